@@ -31,6 +31,7 @@ class ProjectDash(App):
     CSS_PATH = "projectdash.tcss"
     AGENT_RUN_REFRESH_INTERVAL_SECONDS = 3.0
     AGENT_RUN_REFRESH_LIMIT = 100
+    _COMMAND_SEARCH_INDEX: tuple[tuple[str, str, str], ...] | None = None
     PROFILE_DEFAULT_TAB = {
         "ic": "sprint",
         "lead": "github",
@@ -2112,13 +2113,24 @@ class ProjectDash(App):
         # Compatibility aliases kept for now; prefer canonical commands in palette.
         return ("gh", "preset eng manager", "preset engineer", ":q")
 
+    def _command_search_index(self) -> tuple[tuple[str, str, str], ...]:
+        # The palette and alias tables are static, so build the casefolded
+        # search blobs once per process.
+        index = ProjectDash._COMMAND_SEARCH_INDEX
+        if index is None:
+            aliases = self._command_aliases()
+            index = tuple(
+                (name, description, " ".join([name, *aliases.get(name, ())]).casefold())
+                for name, description in self._command_palette_entries()
+            )
+            ProjectDash._COMMAND_SEARCH_INDEX = index
+        return index
+
     def _command_suggestions(self, query: str, limit: int = 8) -> list[tuple[str, str]]:
         normalized = query.strip().casefold()
         context_priority = self._command_context_priority()
         candidates: list[tuple[str, str, int, int]] = []
-        for name, description in self._command_palette_entries():
-            aliases = self._command_aliases().get(name, ())
-            search_blob = " ".join([name, *aliases]).casefold()
+        for name, description, search_blob in self._command_search_index():
             if not normalized or normalized in search_blob:
                 prefix_score = 0 if name.startswith(normalized) else 1
                 context_score = context_priority.get(name, 50)
@@ -36,7 +36,7 @@ class DataManager:
         }
         self.users: List[User] = []
         self.projects: List[Project] = []
-        self.issues: List[Issue] = []
+        self._issues: List[Issue] = []
         self.repositories: List[Repository] = []
         self.pull_requests: List[PullRequest] = []
         self.ci_checks: List[CiCheck] = []
@@ -71,6 +71,15 @@ class DataManager:
         self.github_query_service = GitHubQueryService(self)
         self.github_mutation_service = GitHubMutationService(self)
 
+    @property
+    def issues(self) -> List[Issue]:
+        return self._issues
+
+    @issues.setter
+    def issues(self, issues: List[Issue]) -> None:
+        self._issues = issues
+        self.issue_service.invalidate_issue_index()
+
     async def initialize(self):
         """Initializes the database and loads initial data from cache."""
         await self.db.init_db()
@@ -475,6 +484,9 @@ class DataManager:
     def get_issue_by_id(self, issue_id: str) -> Issue | None:
         return self.issue_service.get_issue_by_id(issue_id)
 
+    def get_issue_by_linear_id(self, linear_id: str) -> Issue | None:
+        return self.issue_service.get_issue_by_linear_id(linear_id)
+
     async def cycle_issue_status(self, issue_id: str, statuses: tuple[str, ...]) -> tuple[bool, str]:
         return await self.issue_mutation_service.cycle_issue_status(issue_id, statuses)
 
@@ -623,6 +635,20 @@ class DataManager:
     async def _record_sync_history(self) -> None:
         await self.sync_service.record_sync_history()
 
+    def _append_sync_history_entry(
+        self,
+        result: str,
+        summary: str,
+        diagnostics: dict[str, str],
+        created_at: str | None = None,
+    ) -> dict[str, Any]:
+        return self.sync_service.append_sync_history_entry(
+            result=result,
+            summary=summary,
+            diagnostics=diagnostics,
+            created_at=created_at,
+        )
+
     def _sync_status_summary_core(self) -> str:
         return self.sync_service.sync_status_summary_core()
 
@@ -1,8 +1,10 @@
 import aiosqlite
 import json
+import sqlite3
+import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, ClassVar, List, Optional
 from projectdash.models import (
     AgentRun,
     CiCheck,
@@ -16,13 +18,61 @@ from projectdash.models import (
 )
 
 DB_PATH = Path("projectdash.db")
+MEMORY_DB_PATH = ":memory:"
 
 class Database:
-    def __init__(self, db_path: Path = DB_PATH):
+    # Resolved file paths whose schema and migrations already ran in this process.
+    _schema_ready: ClassVar[set[str]] = set()
+
+    def __init__(self, db_path: Path | str = DB_PATH):
         self.db_path = db_path
+        target = str(db_path)
+        if target == MEMORY_DB_PATH:
+            # Every method opens its own connection, so a plain ":memory:" database
+            # would vanish between calls; use a named shared-cache one instead.
+            target = f"file:projectdash-{uuid.uuid4().hex}?mode=memory&cache=shared"
+        self._database = target
+        self._uri = target.startswith("file:")
+        self._memory_anchor: sqlite3.Connection | None = None
+        if self._uri and "mode=memory" in target:
+            # A shared in-memory database lives only while a connection is open.
+            self._memory_anchor = sqlite3.connect(target, uri=True, check_same_thread=False)
+        self._schema_initialized = False
+
+    def close(self) -> None:
+        # Releases the anchor that keeps a ":memory:" database alive; file-backed
+        # databases hold no connection between calls, so this is a no-op for them.
+        if self._memory_anchor is not None:
+            self._memory_anchor.close()
+            self._memory_anchor = None
+
+    def _connect(self) -> aiosqlite.Connection:
+        return aiosqlite.connect(self._database, uri=self._uri)
+
+    def _schema_cache_key(self) -> str | None:
+        # Memory databases are private to this instance; only plain files are shared.
+        if self._uri:
+            return None
+        path = Path(self._database)
+        if not path.exists():
+            return None
+        return str(path.resolve())
 
     async def init_db(self):
-        async with aiosqlite.connect(self.db_path) as db:
+        if self._schema_initialized:
+            return
+        cache_key = self._schema_cache_key()
+        if cache_key is not None and cache_key in Database._schema_ready:
+            self._schema_initialized = True
+            return
+        await self._create_schema()
+        self._schema_initialized = True
+        cache_key = self._schema_cache_key()
+        if cache_key is not None:
+            Database._schema_ready.add(cache_key)
+
+    async def _create_schema(self):
+        async with self._connect() as db:
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS users (
                     id TEXT PRIMARY KEY,
@@ -269,7 +319,7 @@ class Database:
             await db.commit()
 
     async def save_users(self, users: List[User]):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             await db.executemany(
                 "INSERT OR REPLACE INTO users (id, name, avatar_url) VALUES (?, ?, ?)",
                 [(u.id, u.name, u.avatar_url) for u in users]
@@ -277,7 +327,7 @@ class Database:
             await db.commit()
 
     async def save_projects(self, projects: List[Project]):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             await db.executemany(
                 "INSERT OR REPLACE INTO projects (id, name, status, issues_count, in_progress_count, blocked_count, due_date, cycle, start_date, description) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
                 [
@@ -299,7 +349,7 @@ class Database:
             await db.commit()
 
     async def save_issues(self, issues: List[Issue], project_id: Optional[str] = None):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             await db.executemany(
                 "INSERT OR REPLACE INTO issues (id, linear_id, title, priority, status, state_id, team_id, assignee_id, points, due_date, project_id, description, labels_json) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
                 [
@@ -324,7 +374,7 @@ class Database:
             await db.commit()
 
     async def save_workflow_states(self, workflow_states: List[LinearWorkflowState]):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             await db.execute("DELETE FROM workflow_states")
             if workflow_states:
                 await db.executemany(
@@ -334,7 +384,7 @@ class Database:
             await db.commit()
 
     async def save_actions(self, actions: List[ActionRecord]):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             for action in actions:
                 timestamp = action.timestamp or datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
                 payload_json = json.dumps(action.payload)
@@ -345,7 +395,7 @@ class Database:
             await db.commit()
 
     async def get_action_history(self, limit: int = 50) -> List[ActionRecord]:
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             db.row_factory = aiosqlite.Row
             async with db.execute(
                 "SELECT * FROM action_history ORDER BY timestamp DESC LIMIT ?", (limit,)
@@ -372,21 +422,21 @@ class Database:
                 return history
 
     async def get_users(self) -> List[User]:
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             db.row_factory = aiosqlite.Row
             async with db.execute("SELECT * FROM users") as cursor:
                 rows = await cursor.fetchall()
                 return [User(id=row["id"], name=row["name"], avatar_url=row["avatar_url"]) for row in rows]
 
     async def get_projects(self) -> List[Project]:
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             db.row_factory = aiosqlite.Row
             async with db.execute("SELECT * FROM projects") as cursor:
                 rows = await cursor.fetchall()
                 return [Project(**dict(row)) for row in rows]
 
     async def get_issues(self) -> List[Issue]:
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             db.row_factory = aiosqlite.Row
             # Join with users to get assignee details
             query = """
@@ -421,7 +471,7 @@ class Database:
                 return issues
 
     async def get_workflow_states(self) -> List[LinearWorkflowState]:
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             db.row_factory = aiosqlite.Row
             async with db.execute("SELECT id, name, type, team_id, team_key FROM workflow_states") as cursor:
                 rows = await cursor.fetchall()
@@ -430,7 +480,7 @@ class Database:
     async def save_repositories(self, repositories: List[Repository]) -> None:
         if not repositories:
             return
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             await db.executemany(
                 """
                 INSERT OR REPLACE INTO repositories (
@@ -455,7 +505,7 @@ class Database:
             await db.commit()
 
     async def get_repositories(self, provider: str | None = None) -> List[Repository]:
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             db.row_factory = aiosqlite.Row
             query = """
                 SELECT id, provider, organization, name, default_branch, is_private, url, created_at, updated_at
@@ -486,7 +536,7 @@ class Database:
     async def save_pull_requests(self, pull_requests: List[PullRequest]) -> None:
         if not pull_requests:
             return
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             await db.executemany(
                 """
                 INSERT OR REPLACE INTO pull_requests (
@@ -525,7 +575,7 @@ class Database:
         provider: str | None = None,
         limit: int = 500,
     ) -> List[PullRequest]:
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             db.row_factory = aiosqlite.Row
             filters: list[str] = []
             values: list[object] = []
@@ -555,7 +605,7 @@ class Database:
     async def save_ci_checks(self, checks: List[CiCheck]) -> None:
         if not checks:
             return
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             await db.executemany(
                 """
                 INSERT OR REPLACE INTO ci_checks (
@@ -588,7 +638,7 @@ class Database:
         provider: str | None = None,
         limit: int = 1000,
     ) -> List[CiCheck]:
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             db.row_factory = aiosqlite.Row
             filters: list[str] = []
             values: list[object] = []
@@ -613,7 +663,7 @@ class Database:
                 return [CiCheck(**dict(row)) for row in rows]
 
     async def get_sync_cursor(self, provider: str) -> str | None:
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             db.row_factory = aiosqlite.Row
             async with db.execute(
                 "SELECT cursor FROM sync_cursors WHERE provider = ?",
@@ -626,7 +676,7 @@ class Database:
 
     async def save_sync_cursor(self, provider: str, cursor_value: str | None) -> None:
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             await db.execute(
                 """
                 INSERT INTO sync_cursors(provider, cursor, updated_at)
@@ -644,7 +694,7 @@ class Database:
         created_at = run.created_at or now
         updated_at = run.updated_at or now
         artifacts_json = json.dumps(run.artifacts, sort_keys=True)
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             await db.execute(
                 """
                 INSERT INTO agent_runs (
@@ -731,7 +781,7 @@ class Database:
         )
 
     async def get_agent_run(self, run_id: str) -> AgentRun | None:
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             db.row_factory = aiosqlite.Row
             async with db.execute(
                 """
@@ -751,7 +801,7 @@ class Database:
                 return self._agent_run_from_row(row)
 
     async def get_agent_runs(self, limit: int = 50) -> List[AgentRun]:
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             db.row_factory = aiosqlite.Row
             async with db.execute(
                 """
@@ -777,7 +827,7 @@ class Database:
         diagnostics: dict[str, str],
         max_entries: int = 20,
     ) -> None:
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             await db.execute(
                 "INSERT INTO sync_history (created_at, result, summary, diagnostics_json) VALUES (?, ?, ?, ?)",
                 (created_at, result, summary, json.dumps(diagnostics, sort_keys=True)),
@@ -797,7 +847,7 @@ class Database:
             await db.commit()
 
     async def get_sync_history(self, limit: int = 20) -> List[dict[str, Any]]:
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             db.row_factory = aiosqlite.Row
             async with db.execute(
                 """
@@ -830,7 +880,7 @@ class Database:
     async def save_local_projects(self, projects: list[LocalProject]) -> None:
         if not projects:
             return
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             await db.executemany(
                 """
                 INSERT OR REPLACE INTO local_projects (
@@ -863,7 +913,7 @@ class Database:
             await db.commit()
 
     async def get_local_projects(self) -> list[LocalProject]:
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             db.row_factory = aiosqlite.Row
             async with db.execute(
                 "SELECT * FROM local_projects ORDER BY tier, name"
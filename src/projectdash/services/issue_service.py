@@ -11,6 +11,11 @@ if TYPE_CHECKING:
 class IssueService:
     def __init__(self, data_manager: DataManager):
         self.data = data_manager
+        # Positions in data.issues by issue id and by Linear id, built lazily.
+        # DataManager.issues resets them when the list is swapped; every
+        # in-place change to the list goes through this service.
+        self._positions_by_id: dict[str, int] | None = None
+        self._positions_by_linear_id: dict[str, int] = {}
 
     def get_issues(self) -> list[Issue]:
         return self.data.issues
@@ -19,10 +24,28 @@ class IssueService:
         return [issue for issue in self.data.issues if issue.status == status]
 
     def get_issue_by_id(self, issue_id: str) -> Issue | None:
-        for issue in self.data.issues:
-            if issue.id == issue_id:
-                return issue
-        return None
+        position = self._issue_positions()[0].get(issue_id)
+        return None if position is None else self.data.issues[position]
+
+    def get_issue_by_linear_id(self, linear_id: str) -> Issue | None:
+        position = self._issue_positions()[1].get(linear_id)
+        return None if position is None else self.data.issues[position]
+
+    def invalidate_issue_index(self) -> None:
+        self._positions_by_id = None
+
+    def _issue_positions(self) -> tuple[dict[str, int], dict[str, int]]:
+        if self._positions_by_id is None:
+            by_id: dict[str, int] = {}
+            by_linear_id: dict[str, int] = {}
+            for position, issue in enumerate(self.data.issues):
+                # First occurrence wins, matching the linear scans this replaces.
+                by_id.setdefault(issue.id, position)
+                if issue.linear_id is not None:
+                    by_linear_id.setdefault(issue.linear_id, position)
+            self._positions_by_id = by_id
+            self._positions_by_linear_id = by_linear_id
+        return self._positions_by_id, self._positions_by_linear_id
 
     def cache_workflow_states(self, raw_teams: list[dict[str, Any]]) -> None:
         self.data.workflow_states_by_team = self.data.linear_connector.workflow_states_by_team(raw_teams)
@@ -59,15 +82,22 @@ class IssueService:
             due_date=raw_issue.get("dueDate"),
         )
 
-        replaced = False
-        for idx, existing in enumerate(self.data.issues):
-            if existing.id == remote_issue.id or (
-                existing.linear_id is not None and existing.linear_id == remote_issue.linear_id
-            ):
-                self.data.issues[idx] = remote_issue
-                replaced = True
-                break
-        if not replaced:
+        by_id, by_linear_id = self._issue_positions()
+        matches = [
+            position
+            for position in (by_id.get(remote_issue.id), by_linear_id.get(remote_issue.linear_id))
+            if position is not None
+        ]
+        if matches:
+            position = min(matches)
+            existing = self.data.issues[position]
+            self.data.issues[position] = remote_issue
+            if existing.id != remote_issue.id or existing.linear_id != remote_issue.linear_id:
+                self.invalidate_issue_index()
+        else:
+            by_id.setdefault(remote_issue.id, len(self.data.issues))
+            if remote_issue.linear_id is not None:
+                by_linear_id.setdefault(remote_issue.linear_id, len(self.data.issues))
             self.data.issues.append(remote_issue)
 
         await self.data.db.save_users(self.data.users)
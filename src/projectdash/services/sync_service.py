@@ -15,6 +15,8 @@ from projectdash.models import CiCheck, PullRequest, Repository
 if TYPE_CHECKING:
     from projectdash.data import DataManager
 
+SYNC_HISTORY_LIMIT = 20
+
 
 class SyncService:
     def __init__(self, data_manager: DataManager):
@@ -546,19 +548,41 @@ class SyncService:
         data = self.data_manager
         if data.last_sync_result == SyncResult.SYNCING:
             return
-        created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        summary = self.sync_status_summary_core()
+        entry = self.append_sync_history_entry(
+            result=data.last_sync_result,
+            summary=self.sync_status_summary_core(),
+            diagnostics=data.sync_diagnostics,
+        )
         try:
             await data.db.append_sync_history(
-                created_at=created_at,
-                result=data.last_sync_result,
-                summary=summary,
-                diagnostics=data.sync_diagnostics,
+                created_at=entry["created_at"],
+                result=entry["result"],
+                summary=entry["summary"],
+                diagnostics=entry["diagnostics"],
+                max_entries=SYNC_HISTORY_LIMIT,
             )
-            data.sync_history = await data.db.get_sync_history()
+            data.sync_history = await data.db.get_sync_history(limit=SYNC_HISTORY_LIMIT)
         except Exception:
             pass
 
+    def append_sync_history_entry(
+        self,
+        *,
+        result: str,
+        summary: str,
+        diagnostics: dict[str, str],
+        created_at: str | None = None,
+    ) -> dict[str, Any]:
+        entry = {
+            "created_at": created_at or datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "result": result,
+            "summary": summary,
+            "diagnostics": dict(diagnostics),
+        }
+        data = self.data_manager
+        data.sync_history = [entry, *data.sync_history][:SYNC_HISTORY_LIMIT]
+        return entry
+
     def sync_status_summary_core(self) -> str:
         data = self.data_manager
         if data.last_sync_result == SyncResult.SUCCESS:
@@ -15,6 +15,7 @@ from textual.widgets import Static
 
 from projectdash.models import Issue, PullRequest, CiCheck
 from projectdash.enums import SyncResult
+from projectdash.views.selection import selection_order
 
 if TYPE_CHECKING:
     from projectdash.app import ProjectDash
@@ -33,12 +34,14 @@ class BlockedQueueRow:
 class BlockedQueueView(Static):
     """Dedicated screen for identifying and triaging blocked work."""
 
+    _issue_order = selection_order()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.graph_density = "compact"
         self.project_scope_id: str | None = None
         self.selected_issue_id: str | None = None
-        self._issue_order: list[str] = []
+        self._issue_order = []
         self.assignee_filter = "all"  # all, mine, unassigned
         self.sort_mode = "age"  # age, project, owner
         self.detail_open = False
@@ -222,11 +225,7 @@ class BlockedQueueView(Static):
     def move_selection(self, delta: int) -> None:
         if not self._issue_order:
             return
-        if self.selected_issue_id not in self._issue_order:
-            self.selected_issue_id = self._issue_order[0]
-        else:
-            idx = self._issue_order.index(self.selected_issue_id)
-            self.selected_issue_id = self._issue_order[(idx + delta) % len(self._issue_order)]
+        self.selected_issue_id = self._issue_order.step(self.selected_issue_id, delta)
         self.refresh_view()
 
     def page_selection(self, delta_pages: int) -> None:
@@ -5,12 +5,15 @@ from textual.app import ComposeResult
 from rich.text import Text
 from datetime import date, datetime
 from projectdash.views.customizable import CustomizableView, SectionSpec
+from projectdash.views.selection import selection_order
 from projectdash.widgets.project_navigator import ProjectNavigator, ProjectNavigatorSelected
 
 
 class DashboardView(CustomizableView):
     VISUAL_MODES = ("load-total", "load-active", "risk", "priority", "compare")
+    _NEXT_MODE = dict(zip(VISUAL_MODES, VISUAL_MODES[1:] + VISUAL_MODES[:1]))
     PAGE_LAYOUT_ID = "dashboard"
+    _project_order = selection_order()
 
     def section_specs(self) -> tuple[SectionSpec, ...]:
         return (
@@ -26,7 +29,7 @@ class DashboardView(CustomizableView):
         self.chart_density = "compact"
         self.project_scope_id: str | None = None
         self.selected_project_id: str | None = None
-        self._project_order: list[str] = []
+        self._project_order = []
         self.detail_open = False
         self._sync_marker: str | None = None
         self._sync_baseline = {
@@ -197,13 +200,7 @@ class DashboardView(CustomizableView):
                 self.refresh_view()
         except Exception:
             # Fallback to manual selection
-            if self.selected_project_id not in self._project_order:
-                self.selected_project_id = self._project_order[0]
-                self.refresh_view()
-                return
-            current_index = self._project_order.index(self.selected_project_id)
-            next_index = (current_index + delta) % len(self._project_order)
-            self.selected_project_id = self._project_order[next_index]
+            self.selected_project_id = self._project_order.step(self.selected_project_id, delta)
             self.refresh_view()
 
     def page_selection(self, delta_pages: int) -> None:
@@ -233,8 +230,7 @@ class DashboardView(CustomizableView):
         }
 
     def toggle_visual_mode(self) -> tuple[bool, str]:
-        current_index = self.VISUAL_MODES.index(self.visual_mode)
-        self.visual_mode = self.VISUAL_MODES[(current_index + 1) % len(self.VISUAL_MODES)]
+        self.visual_mode = self._NEXT_MODE[self.visual_mode]
         self.refresh_view()
         label_map = {
             "load-total": "Project Load",
@@ -13,6 +13,7 @@ from textual.containers import Horizontal, Vertical
 from textual.widgets import Static
 
 from projectdash.models import CiCheck, PullRequest, Repository
+from projectdash.views.selection import selection_order
 from projectdash.widgets.triage_chips import TriageFilterChips
 
 
@@ -34,10 +35,14 @@ class RepositorySnapshot:
 
 class GitHubDashboardView(Static):
     VISUAL_MODES = ("repos", "prs", "failing_prs", "checks")
+    _NEXT_MODE = dict(zip(VISUAL_MODES, VISUAL_MODES[1:] + VISUAL_MODES[:1]))
     STATE_FILTERS = ("all", "open", "merged", "closed")
     LINK_FILTERS = ("all", "linked", "unlinked")
     TRIAGE_FILTERS = ("mine", "blocked", "failing", "stale")
     DEFAULT_TRIAGE_STALE_DAYS = 7
+    _repository_order = selection_order()
+    _pull_request_order = selection_order()
+    _check_order = selection_order()
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -56,9 +61,9 @@ class GitHubDashboardView(Static):
         self.selected_repository_id: str | None = None
         self.selected_pull_request_id: str | None = None
         self.selected_check_id: str | None = None
-        self._repository_order: list[str] = []
-        self._pull_request_order: list[str] = []
-        self._check_order: list[str] = []
+        self._repository_order = []
+        self._pull_request_order = []
+        self._check_order = []
         self.detail_open = False
 
         self._filtered_pull_requests: list[PullRequest] = []
@@ -177,8 +182,7 @@ class GitHubDashboardView(Static):
         )
 
     def toggle_visual_mode(self) -> tuple[bool, str]:
-        current_index = self.VISUAL_MODES.index(self.visual_mode)
-        self.visual_mode = self.VISUAL_MODES[(current_index + 1) % len(self.VISUAL_MODES)]
+        self.visual_mode = self._NEXT_MODE[self.visual_mode]
         self.refresh_view()
         label = {
             "repos": "Repositories",
@@ -252,13 +256,7 @@ class GitHubDashboardView(Static):
         if self.visual_mode == "prs":
             if not self._pull_request_order:
                 return
-            if self.selected_pull_request_id not in self._pull_request_order:
-                self.selected_pull_request_id = self._pull_request_order[0]
-                self.refresh_view()
-                return
-            current_index = self._pull_request_order.index(self.selected_pull_request_id)
-            next_index = (current_index + delta) % len(self._pull_request_order)
-            self.selected_pull_request_id = self._pull_request_order[next_index]
+            self.selected_pull_request_id = self._pull_request_order.step(self.selected_pull_request_id, delta)
             selected_pull_request = self._filtered_pull_requests_by_id.get(self.selected_pull_request_id)
             if selected_pull_request:
                 self.selected_repository_id = selected_pull_request.repository_id
@@ -267,19 +265,7 @@ class GitHubDashboardView(Static):
         if self.visual_mode == "checks":
             if not self._check_order:
                 return
-            if self.selected_check_id not in self._check_order:
-                self.selected_check_id = self._check_order[0]
-                selected_check = self._visible_checks_by_id.get(self.selected_check_id)
-                if selected_check:
-                    selected_pr = self._filtered_pull_requests_by_id.get(selected_check.pull_request_id)
-                    if selected_pr:
-                        self.selected_pull_request_id = selected_pr.id
-                        self.selected_repository_id = selected_pr.repository_id
-                self.refresh_view()
-                return
-            current_index = self._check_order.index(self.selected_check_id)
-            next_index = (current_index + delta) % len(self._check_order)
-            self.selected_check_id = self._check_order[next_index]
+            self.selected_check_id = self._check_order.step(self.selected_check_id, delta)
             selected_check = self._visible_checks_by_id.get(self.selected_check_id)
             if selected_check:
                 selected_pr = self._filtered_pull_requests_by_id.get(selected_check.pull_request_id)
@@ -291,13 +277,7 @@ class GitHubDashboardView(Static):
 
         if not self._repository_order:
             return
-        if self.selected_repository_id not in self._repository_order:
-            self.selected_repository_id = self._repository_order[0]
-            self.refresh_view()
-            return
-        current_index = self._repository_order.index(self.selected_repository_id)
-        next_index = (current_index + delta) % len(self._repository_order)
-        self.selected_repository_id = self._repository_order[next_index]
+        self.selected_repository_id = self._repository_order.step(self.selected_repository_id, delta)
         self.refresh_view()
 
     def page_selection(self, delta_pages: int) -> None:
@@ -441,7 +421,9 @@ class GitHubDashboardView(Static):
                 if str(value).strip().casefold() in self.TRIAGE_FILTERS
             }
         self.drilldown_issue_id = str(state.get("drilldown_issue_id") or "") or None
-        self.visual_mode = str(state.get("visual_mode") or self.visual_mode)
+        visual_mode = str(state.get("visual_mode") or self.visual_mode)
+        if visual_mode in self._NEXT_MODE:
+            self.visual_mode = visual_mode
         self.graph_density = str(state.get("graph_density") or self.graph_density)
         self.selected_repository_id = str(state.get("selected_repository_id") or "") or None
         self.selected_pull_request_id = str(state.get("selected_pull_request_id") or "") or None
@@ -1257,7 +1239,8 @@ class GitHubDashboardView(Static):
         self.mine_only = bool(restore.get("mine_only", False))
         self.blocked_only = bool(restore.get("blocked_only", False))
         self.stale_only = bool(restore.get("stale_only", False))
-        self.visual_mode = str(restore.get("visual_mode") or "repos")
+        visual_mode = str(restore.get("visual_mode") or "repos")
+        self.visual_mode = visual_mode if visual_mode in self._NEXT_MODE else "repos"
         self.selected_repository_id = restore.get("selected_repository_id") or None
         self.selected_pull_request_id = restore.get("selected_pull_request_id") or None
         self.selected_check_id = restore.get("selected_check_id") or None
@@ -9,6 +9,7 @@ from textual.containers import Horizontal, Vertical
 from textual.widgets import Static
 
 from projectdash.charts import LineChartRenderer, LineChartSpec, LineSeries
+from projectdash.views.selection import selection_order
 
 try:
     from textual_plotext import PlotextPlot
@@ -29,6 +30,8 @@ class IdeationCard:
 
 class IdeationGalleryView(Static):
     VISUAL_MODES = ("all", "delivery", "flow", "quality", "capacity", "portfolio")
+    _NEXT_MODE = dict(zip(VISUAL_MODES, VISUAL_MODES[1:] + VISUAL_MODES[:1]))
+    _idea_order = selection_order()
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -37,7 +40,7 @@ class IdeationGalleryView(Static):
         self.project_scope_id: str | None = None
         self.selected_idea_id: str | None = None
         self.detail_open = False
-        self._idea_order: list[str] = []
+        self._idea_order = []
 
         self._line_renderer = LineChartRenderer()
         self._line_render_style = "classic"
@@ -107,15 +110,7 @@ class IdeationGalleryView(Static):
     def move_selection(self, delta: int) -> None:
         if not self._idea_order:
             return
-        if self.selected_idea_id not in self._idea_order:
-            self.selected_idea_id = self._idea_order[0]
-            self._line_window_start = 0
-            self._line_selected_series = 0
-            self.refresh_view()
-            return
-        current_index = self._idea_order.index(self.selected_idea_id)
-        next_index = (current_index + delta) % len(self._idea_order)
-        self.selected_idea_id = self._idea_order[next_index]
+        self.selected_idea_id = self._idea_order.step(self.selected_idea_id, delta)
         self._line_window_start = 0
         self._line_selected_series = 0
         self.refresh_view()
@@ -127,8 +122,7 @@ class IdeationGalleryView(Static):
         self.move_selection(delta_pages * jump)
 
     def toggle_visual_mode(self) -> tuple[bool, str]:
-        current_index = self.VISUAL_MODES.index(self.visual_mode)
-        self.visual_mode = self.VISUAL_MODES[(current_index + 1) % len(self.VISUAL_MODES)]
+        self.visual_mode = self._NEXT_MODE[self.visual_mode]
         self.refresh_view()
         return True, f"Ideation category: {self.visual_mode}"
 
@@ -250,7 +244,9 @@ class IdeationGalleryView(Static):
     def restore_filter_state(self, state: dict[str, object] | None) -> None:
         if not state:
             return
-        self.visual_mode = str(state.get("visual_mode") or self.visual_mode)
+        visual_mode = str(state.get("visual_mode") or self.visual_mode)
+        if visual_mode in self._NEXT_MODE:
+            self.visual_mode = visual_mode
         self.graph_density = str(state.get("graph_density") or self.graph_density)
         self.selected_idea_id = str(state.get("selected_idea_id") or "") or None
         self.detail_open = bool(state.get("detail_open", self.detail_open))
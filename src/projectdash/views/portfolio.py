@@ -11,6 +11,7 @@ from textual.containers import Horizontal, Vertical
 from textual.widgets import Static
 
 from projectdash.services.metrics import PortfolioMetricSet, PortfolioRowMetric
+from projectdash.views.selection import selection_order
 
 if TYPE_CHECKING:
     from projectdash.app import ProjectDash
@@ -20,10 +21,12 @@ class PortfolioView(Static):
     """Top-level portfolio gallery of all local projects."""
 
     VISUAL_MODES = ("all", "active", "paused", "shipped", "ideas")
+    _NEXT_MODE = dict(zip(VISUAL_MODES, VISUAL_MODES[1:] + VISUAL_MODES[:1]))
     SORT_MODES = ("tier", "score", "commit", "name")
     TIER_VALUES = ("S", "A", "B", "C", "D")
     TIER_FILTER_CYCLE = ("all", "S", "A", "B", "C", "D")
     STATUS_VALUES = ("idea", "exploration", "active", "paused", "shipped", "archived")
+    _project_order = selection_order()
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -32,7 +35,7 @@ class PortfolioView(Static):
         self.tier_filter = "all"
         self.project_scope_id: str | None = None
         self.selected_project_id: str | None = None
-        self._project_order: list[str] = []
+        self._project_order = []
         self.detail_open = False
 
     def on_mount(self) -> None:
@@ -76,19 +79,14 @@ class PortfolioView(Static):
     def move_selection(self, delta: int) -> None:
         if not self._project_order:
             return
-        if self.selected_project_id not in self._project_order:
-            self.selected_project_id = self._project_order[0]
-        else:
-            idx = self._project_order.index(self.selected_project_id)
-            self.selected_project_id = self._project_order[(idx + delta) % len(self._project_order)]
+        self.selected_project_id = self._project_order.step(self.selected_project_id, delta)
         self.refresh_view()
 
     def page_selection(self, delta_pages: int) -> None:
         self.move_selection(delta_pages * 10)
 
     def toggle_visual_mode(self) -> tuple[bool, str]:
-        idx = self.VISUAL_MODES.index(self.visual_mode)
-        self.visual_mode = self.VISUAL_MODES[(idx + 1) % len(self.VISUAL_MODES)]
+        self.visual_mode = self._NEXT_MODE[self.visual_mode]
         self.refresh_view()
         return True, f"Portfolio filter: {self.visual_mode}"
 
@@ -231,7 +229,9 @@ class PortfolioView(Static):
     def restore_filter_state(self, state: dict[str, object] | None) -> None:
         if not state:
             return
-        self.visual_mode = str(state.get("visual_mode") or self.visual_mode)
+        visual_mode = str(state.get("visual_mode") or self.visual_mode)
+        if visual_mode in self._NEXT_MODE:
+            self.visual_mode = visual_mode
         self.sort_mode = str(state.get("sort_mode") or self.sort_mode)
         self.tier_filter = str(state.get("tier_filter") or self.tier_filter)
         self.selected_project_id = str(state.get("selected_project_id") or "") or None
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+
+class SelectionOrder(list[str]):
+    """Ordered ids a view's selection cycles through, with O(1) position lookups.
+
+    Views rebuild their orders wholesale on every refresh and never mutate them
+    in place, so positions are indexed once when the order is built.
+    """
+
+    def __init__(self, ids: Iterable[str] = ()) -> None:
+        super().__init__(ids)
+        self._positions: dict[str, int] = {}
+        for position, item_id in enumerate(self):
+            self._positions.setdefault(item_id, position)
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._positions
+
+    def step(self, current: str | None, delta: int) -> str:
+        """Return the id ``delta`` places from ``current``, wrapping at either end.
+
+        Falls back to the first id when ``current`` is not in the order; the
+        order must not be empty.
+        """
+        position = self._positions.get(current) if current is not None else None
+        if position is None:
+            return self[0]
+        return self[(position + delta) % len(self)]
+
+
+class selection_order:
+    """View attribute that stores any assigned list of ids as a SelectionOrder."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        return instance.__dict__[self._name]
+
+    def __set__(self, instance: Any, ids: Iterable[str]) -> None:
+        instance.__dict__[self._name] = ids if isinstance(ids, SelectionOrder) else SelectionOrder(ids)
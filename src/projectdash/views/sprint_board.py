@@ -4,8 +4,11 @@ import shlex
 import shutil
 import subprocess
 import webbrowser
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable
 
 from textual.app import ComposeResult
 from textual.containers import Vertical, Horizontal
@@ -18,6 +21,14 @@ from projectdash.widgets.issue_card import IssueCard, IssueCardSelected
 from projectdash.widgets.triage_chips import TriageFilterChips
 from projectdash.views.sprint_issue import SprintIssueScreen
 
+FILTER_KEY_PATTERN = re.compile(r"(?i)\b(status|state|priority|prio|assignee|owner|id|key|project):")
+
+
+@dataclass(frozen=True)
+class SprintFilterSpec:
+    keyed: tuple[tuple[str, tuple[str, ...]], ...] = ()
+    free_terms: tuple[str, ...] = ()
+
 
 class SprintBoardView(Static):
     BINDINGS = [
@@ -41,8 +52,11 @@ class SprintBoardView(Static):
         "project": "project",
     }
 
-    def __init__(self, **kwargs):
+    def __init__(self, refresh_view: Callable[[], None] | None = None, **kwargs):
         super().__init__(**kwargs)
+        if refresh_view is not None:
+            # Lets headless callers (tests) swap out the widget rebuild.
+            self.refresh_view = refresh_view
         self.project_scope_id: str | None = None
         self.visual_mode = "kanban"  # kanban or blocked
         self.column_metrics = []
@@ -766,36 +780,29 @@ class SprintBoardView(Static):
                 current_card.add_class("is-selected")
                 current_card.refresh()
 
-    def _filter_columns(self, columns, query: str):
-        keyed_filters, free_terms = self._parse_filter_query(query)
-        if not keyed_filters and not free_terms and not self.triage_filters:
+    def _filter_columns(self, columns, query: str | SprintFilterSpec):
+        spec = query if isinstance(query, SprintFilterSpec) else self._parse_filter_query(query)
+        if not spec.keyed and not spec.free_terms and not self.triage_filters:
             return columns
         filtered = []
         for column in columns:
             issues = [
                 issue
                 for issue in column.issues
-                if self._issue_matches_query(issue, keyed_filters, free_terms)
-                and self._issue_matches_triage(issue)
+                if self._issue_matches_query(issue, spec) and self._issue_matches_triage(issue)
             ]
             filtered.append(type(column)(status=column.status, issues=issues))
         return filtered
 
-    def _issue_matches_query(
-        self,
-        issue: Issue,
-        keyed_filters: dict[str, list[str]],
-        free_terms: list[str],
-    ) -> bool:
+    def _issue_matches_query(self, issue: Issue, spec: SprintFilterSpec) -> bool:
         assignee_name = issue.assignee.name if issue.assignee else ""
-        searchable = self._issue_search_blob(issue, assignee_name)
-        for term in free_terms:
-            if term not in searchable:
-                return False
+        if spec.free_terms:
+            searchable = self._issue_search_blob(issue, assignee_name)
+            for term in spec.free_terms:
+                if term not in searchable:
+                    return False
 
-        for key, values in keyed_filters.items():
-            if not values:
-                continue
+        for key, values in spec.keyed:
             field_value = self._issue_field_blob(issue, key, assignee_name)
             if not any(value in field_value for value in values):
                 return False
@@ -900,21 +907,24 @@ class SprintBoardView(Static):
             return "failing"
         return "pending"
 
-    def _parse_filter_query(self, query: str) -> tuple[dict[str, list[str]], list[str]]:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _parse_filter_query(query: str) -> SprintFilterSpec:
+        # The board re-filters on every refresh with an unchanged query, so
+        # parsed specs are cached by query text.
         text = query.strip()
         if not text:
-            return {}, []
+            return SprintFilterSpec()
 
-        pattern = re.compile(r"(?i)\b(status|state|priority|prio|assignee|owner|id|key|project):")
-        matches = list(pattern.finditer(text))
+        matches = list(FILTER_KEY_PATTERN.finditer(text))
         if not matches:
-            return {}, self._split_filter_terms(text)
+            return SprintFilterSpec(free_terms=SprintBoardView._split_filter_terms(text))
 
         keyed: dict[str, list[str]] = {}
         consumed_ranges: list[tuple[int, int]] = []
         for index, match in enumerate(matches):
             key = match.group(1).casefold()
-            canonical_key = self.FILTER_KEY_ALIASES.get(key)
+            canonical_key = SprintBoardView.FILTER_KEY_ALIASES.get(key)
             value_end = matches[index + 1].start() if index + 1 < len(matches) else len(text)
             consumed_ranges.append((match.start(), value_end))
             if canonical_key is None:
@@ -922,7 +932,7 @@ class SprintBoardView(Static):
             raw_value = text[match.end():value_end].strip()
             if not raw_value:
                 continue
-            values = self._split_filter_values(raw_value)
+            values = SprintBoardView._split_filter_values(raw_value)
             if values:
                 keyed.setdefault(canonical_key, []).extend(values)
 
@@ -935,10 +945,13 @@ class SprintBoardView(Static):
         if cursor < len(text):
             free_chunks.append(text[cursor:])
         free_text = " ".join(chunk.strip() for chunk in free_chunks if chunk.strip())
-        free_terms = self._split_filter_terms(free_text)
-        return keyed, free_terms
+        return SprintFilterSpec(
+            keyed=tuple((key, tuple(values)) for key, values in keyed.items()),
+            free_terms=SprintBoardView._split_filter_terms(free_text),
+        )
 
-    def _split_filter_values(self, value_text: str) -> list[str]:
+    @staticmethod
+    def _split_filter_values(value_text: str) -> list[str]:
         values = []
         for chunk in value_text.split(","):
             normalized = chunk.strip().strip("\"'")
@@ -946,15 +959,16 @@ class SprintBoardView(Static):
                 values.append(normalized.casefold())
         return values
 
-    def _split_filter_terms(self, text: str) -> list[str]:
+    @staticmethod
+    def _split_filter_terms(text: str) -> tuple[str, ...]:
         normalized = text.strip()
         if not normalized:
-            return []
+            return ()
         try:
             tokens = shlex.split(normalized)
         except ValueError:
             tokens = normalized.split()
-        return [token.casefold() for token in tokens if token.strip()]
+        return tuple(token.casefold() for token in tokens if token.strip())
 
     def _project_scope_label(self) -> str:
         if not self.project_scope_id:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import Static
@@ -22,6 +24,7 @@ class SyncHistoryScreen(Screen):
         self.expanded_indices: set[int] = set()
         self.filter_query = ""
         self.filter_active = False
+        self._blob_cache: dict[int, tuple[dict, str]] = {}
 
     def compose(self) -> ComposeResult:
         yield Static("SYNC HISTORY", id="sync-history-modal-header")
@@ -32,7 +35,7 @@ class SyncHistoryScreen(Screen):
         self.refresh_view()
 
     def refresh_view(self) -> None:
-        entries = self._filtered_entries(self.app.data_manager.get_sync_history(limit=200), self.filter_query)
+        entries = self._visible_entries()
         if not entries:
             body = "No sync history found."
         else:
@@ -66,22 +69,46 @@ class SyncHistoryScreen(Screen):
             body = "\n".join(detail_lines).rstrip()
         self.query_one("#sync-history-modal-content", Static).update(body)
 
+    def _visible_entries(self) -> list[dict]:
+        entries = self.app.data_manager.get_sync_history(limit=200)
+        if len(self._blob_cache) > len(entries):
+            # History was reloaded or trimmed; drop blobs for entries no longer shown.
+            live = {id(entry) for entry in entries}
+            self._blob_cache = {key: cached for key, cached in self._blob_cache.items() if key in live}
+        if not self._query_tokens(self.filter_query):
+            return entries
+        search_blob = self._cached_search_blob
+        blobs = [search_blob(entry) for entry in entries]
+        return self._filtered_entries(entries, self.filter_query, blobs)
+
+    def _cached_search_blob(self, entry: dict) -> str:
+        # The only cache of search blobs. History entries are long-lived dicts
+        # shared with DataManager.sync_history, so blobs are reused across
+        # keystrokes; the entry itself is kept next to its blob so a recycled
+        # id() never returns stale text.
+        cached = self._blob_cache.get(id(entry))
+        if cached is not None and cached[0] is entry:
+            return cached[1]
+        blob = self._entry_search_blob(entry)
+        self._blob_cache[id(entry)] = (entry, blob)
+        return blob
+
     def action_history_down(self) -> None:
-        entries = self._filtered_entries(self.app.data_manager.get_sync_history(limit=200), self.filter_query)
+        entries = self._visible_entries()
         if not entries:
             return
         self.selected_index = (self.selected_index + 1) % len(entries)
         self.refresh_view()
 
     def action_history_up(self) -> None:
-        entries = self._filtered_entries(self.app.data_manager.get_sync_history(limit=200), self.filter_query)
+        entries = self._visible_entries()
         if not entries:
             return
         self.selected_index = (self.selected_index - 1) % len(entries)
         self.refresh_view()
 
     def action_open_selected(self) -> None:
-        entries = self._filtered_entries(self.app.data_manager.get_sync_history(limit=200), self.filter_query)
+        entries = self._visible_entries()
         if not entries:
             return
         if self.selected_index not in self.expanded_indices:
@@ -132,32 +159,57 @@ class SyncHistoryScreen(Screen):
 
     @staticmethod
     def _entry_search_blob(entry: dict) -> str:
-        diagnostics = entry.get("diagnostics") or {}
-        diagnostics_text = " ".join(f"{k} {v}" for k, v in diagnostics.items())
-        parts = [
-            str(entry.get("created_at", "")),
-            str(entry.get("result", "")),
-            str(entry.get("summary", "")),
-            diagnostics_text,
-        ]
-        return " ".join(parts).casefold()
+        return " ".join(
+            [
+                str(entry.get("created_at", "")),
+                str(entry.get("result", "")),
+                str(entry.get("summary", "")),
+                SyncHistoryScreen._diagnostics_text(entry),
+            ]
+        ).casefold()
+
+    @staticmethod
+    def _diagnostics_text(entry: dict) -> str:
+        # History entries are replaced, never mutated, so the flattened text is
+        # memoized on the entry the first time it is needed.
+        if "diagnostics_text" not in entry:
+            diagnostics = entry.get("diagnostics") or {}
+            entry["diagnostics_text"] = " ".join(f"{key} {value}" for key, value in diagnostics.items())
+        return entry["diagnostics_text"]
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _query_tokens(query: str) -> tuple[str, ...]:
+        # Incremental typing re-filters on every keystroke, so the tokenized
+        # query is cached; blobs are already casefolded, so plain substring
+        # checks are enough. Tokens implied by a longer one ("rat" in "rate")
+        # are dropped, and the rest run longest (most selective) first.
+        tokens: list[str] = []
+        for token in sorted(dict.fromkeys(query.casefold().split()), key=len, reverse=True):
+            if not any(token in longer for longer in tokens):
+                tokens.append(token)
+        return tuple(tokens)
 
     @classmethod
-    def _filtered_entries(cls, entries: list[dict], query: str) -> list[dict]:
-        normalized = query.strip().casefold()
-        if not normalized:
+    def _filtered_entries(
+        cls,
+        entries: list[dict],
+        query: str,
+        blobs: list[str] | None = None,
+    ) -> list[dict]:
+        # blobs run parallel to entries so the match loop never touches the
+        # entry dicts; callers without a cache get blobs built on the fly.
+        tokens = cls._query_tokens(query)
+        if not tokens:
             return entries
-        return [entry for entry in entries if normalized in cls._entry_search_blob(entry)]
+        if blobs is None:
+            search_blob = cls._entry_search_blob
+            blobs = [search_blob(entry) for entry in entries]
+        return [entry for entry, blob in zip(entries, blobs) if all(token in blob for token in tokens)]
 
     @staticmethod
     def _entry_recovery_hints(entry: dict) -> list[str]:
-        diagnostics = entry.get("diagnostics") or {}
-        blob = " ".join(
-            [
-                str(entry.get("summary", "")),
-                *(f"{key} {value}" for key, value in diagnostics.items()),
-            ]
-        ).casefold()
+        blob = f"{entry.get('summary', '')} {SyncHistoryScreen._diagnostics_text(entry)}".casefold()
 
         hints: list[str] = []
         if "linear_api_key not set" in blob:
@@ -7,9 +7,10 @@ from textual.containers import Vertical, Horizontal
 from rich.text import Text
 from projectdash.widgets.timeline_row import TimelineRow, TimelineRowSelected
 from projectdash.models import Issue
+from projectdash.views.selection import selection_order
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BlockedQueueRow:
     issue: Issue
     age_days: int
@@ -19,7 +20,7 @@ class BlockedQueueRow:
     failing_checks: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BlockedProjectSignal:
     blocked_count: int
     failing_checks: int
@@ -27,11 +28,14 @@ class BlockedProjectSignal:
 
 class TimelineView(Static):
     VISUAL_MODES = ("project", "risk", "progress", "blocked")
+    _NEXT_MODE = dict(zip(VISUAL_MODES, VISUAL_MODES[1:] + VISUAL_MODES[:1]))
     BINDINGS = [
         ("/", "open_filter", "Filter/Search"),
         ("B", "open_project_blocked_drilldown", "Blocker Drilldown"),
         ("question_mark", "toggle_help", "Help"),
     ]
+    _project_order = selection_order()
+    _blocked_order = selection_order()
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -40,8 +44,8 @@ class TimelineView(Static):
         self.project_scope_id: str | None = None
         self.selected_project_id: str | None = None
         self.selected_blocked_issue_id: str | None = None
-        self._project_order: list[str] = []
-        self._blocked_order: list[str] = []
+        self._project_order = []
+        self._blocked_order = []
         self.blocked_assignee_mode = "all"
         self.detail_open = False
 
@@ -128,8 +132,7 @@ class TimelineView(Static):
         self._refresh_detail_panel(metric_set, blocked_rows)
 
     def toggle_visual_mode(self) -> tuple[bool, str]:
-        current_index = self.VISUAL_MODES.index(self.visual_mode)
-        self.visual_mode = self.VISUAL_MODES[(current_index + 1) % len(self.VISUAL_MODES)]
+        self.visual_mode = self._NEXT_MODE[self.visual_mode]
         self.refresh_view()
         mode_label = "Blocked Queue" if self.visual_mode == "blocked" else self.visual_mode.title()
         return True, f"Timeline view mode: {mode_label}"
@@ -246,7 +249,7 @@ class TimelineView(Static):
         if not state:
             return
         visual_mode = str(state.get("visual_mode") or self.visual_mode)
-        if visual_mode in self.VISUAL_MODES:
+        if visual_mode in self._NEXT_MODE:
             self.visual_mode = visual_mode
         self.graph_density = str(state.get("graph_density") or self.graph_density)
         self.project_scope_id = str(state.get("project_scope_id") or "") or None
@@ -401,26 +404,14 @@ class TimelineView(Static):
         if self.visual_mode == "blocked":
             if not self._blocked_order:
                 return
-            if self.selected_blocked_issue_id not in self._blocked_order:
-                self.selected_blocked_issue_id = self._blocked_order[0]
-                self.refresh_view()
-                return
-            current_index = self._blocked_order.index(self.selected_blocked_issue_id)
-            next_index = (current_index + delta) % len(self._blocked_order)
-            self.selected_blocked_issue_id = self._blocked_order[next_index]
+            self.selected_blocked_issue_id = self._blocked_order.step(self.selected_blocked_issue_id, delta)
             self.refresh_view()
             return
         if self.visual_mode != "project":
             return
         if not self._project_order:
             return
-        if self.selected_project_id not in self._project_order:
-            self.selected_project_id = self._project_order[0]
-            self.refresh_view()
-            return
-        current_index = self._project_order.index(self.selected_project_id)
-        next_index = (current_index + delta) % len(self._project_order)
-        self.selected_project_id = self._project_order[next_index]
+        self.selected_project_id = self._project_order.step(self.selected_project_id, delta)
         self.refresh_view()
 
     def page_selection(self, delta_pages: int) -> None:
@@ -3,15 +3,18 @@ from textual.widgets import Static
 from textual.containers import Vertical, Horizontal
 from rich.text import Text
 from projectdash.services.metrics import WorkloadMetricSet
+from projectdash.views.selection import selection_order
 from projectdash.widgets.workload_member_row import WorkloadMemberRow, WorkloadMemberSelected
 
 
 class WorkloadView(Static):
     VISUAL_MODES = ("table", "chart", "rebalance")
+    _NEXT_MODE = dict(zip(VISUAL_MODES, VISUAL_MODES[1:] + VISUAL_MODES[:1]))
     BINDINGS = [
         ("/", "open_filter", "Filter/Search"),
         ("question_mark", "toggle_help", "Help"),
     ]
+    _member_order = selection_order()
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -19,7 +22,7 @@ class WorkloadView(Static):
         self.graph_density = "compact"
         self.project_scope_id: str | None = None
         self.selected_member: str | None = None
-        self._member_order: list[str] = []
+        self._member_order = []
         self.detail_open = False
         self.simulation_points = 2
 
@@ -114,8 +117,7 @@ class WorkloadView(Static):
         self._refresh_detail_panel(metric_set)
 
     def toggle_visual_mode(self) -> tuple[bool, str]:
-        current_index = self.VISUAL_MODES.index(self.visual_mode)
-        self.visual_mode = self.VISUAL_MODES[(current_index + 1) % len(self.VISUAL_MODES)]
+        self.visual_mode = self._NEXT_MODE[self.visual_mode]
         self.refresh_view()
         return True, f"Workload view mode: {self.visual_mode}"
 
@@ -202,13 +204,7 @@ class WorkloadView(Static):
     def move_selection(self, delta: int) -> None:
         if not self._member_order:
             return
-        if self.selected_member not in self._member_order:
-            self.selected_member = self._member_order[0]
-            self.refresh_view()
-            return
-        current_index = self._member_order.index(self.selected_member)
-        next_index = (current_index + delta) % len(self._member_order)
-        self.selected_member = self._member_order[next_index]
+        self.selected_member = self._member_order.step(self.selected_member, delta)
         self.refresh_view()
 
     def page_selection(self, delta_pages: int) -> None:
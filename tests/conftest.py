@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from projectdash.database import MEMORY_DB_PATH, Database
+
+LINEAR_VIEWER = {"viewer": {"id": "viewer-1", "name": "Tester", "email": "tester@example.com"}}
+LINEAR_PROJECTS = (
+    {
+        "id": "p1",
+        "name": "Project One",
+        "description": "Customer onboarding workflow improvements.",
+        "startDate": "2026-01-20",
+        "targetDate": "2026-03-01",
+        "state": "Active",
+    },
+)
+LINEAR_TEAMS = (
+    {
+        "id": "team-1",
+        "key": "ENG",
+        "name": "Engineering",
+        "states": {
+            "nodes": [
+                {"id": "state-1", "name": "Todo", "type": "unstarted"},
+                {"id": "state-2", "name": "In Progress", "type": "started"},
+            ]
+        },
+    },
+)
+LINEAR_ISSUES = (
+    {
+        "id": "lin-1",
+        "identifier": "PD-1",
+        "title": "First issue",
+        "priority": 2,
+        "state": {"id": "state-1", "name": "Todo", "type": "unstarted"},
+        "dueDate": "2026-03-02",
+        "project": {"id": "p1"},
+        "team": {"id": "team-1"},
+        "assignee": {"id": "u1", "name": "Alice", "avatarUrl": None},
+        "estimate": 3,
+    },
+)
+
+
+class _FakeLinearCall:
+    """Zero-argument coroutine stand-in for a LinearClient fetch method."""
+
+    def __init__(self, payload: Any) -> None:
+        self.payload = payload
+
+    async def __call__(self) -> Any:
+        if isinstance(self.payload, Exception):
+            raise self.payload
+        if isinstance(self.payload, tuple):
+            return list(self.payload)
+        return self.payload
+
+
+@pytest.fixture
+def memory_db():
+    """A fresh in-memory Database, closed on teardown to release its anchor connection."""
+    db = Database(MEMORY_DB_PATH)
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def patch_linear():
+    """Point a DataManager's Linear fetches at canned payloads (or exceptions).
+
+    Each DataManager owns its LinearClient, so the fakes are assigned directly
+    instead of going through monkeypatch; calling it again swaps the payloads.
+    """
+
+    def _patch(
+        dm,
+        *,
+        me: Any = LINEAR_VIEWER,
+        projects: Any = LINEAR_PROJECTS,
+        states: Any = LINEAR_TEAMS,
+        issues: Any = LINEAR_ISSUES,
+    ):
+        dm.linear.get_me = _FakeLinearCall(me)
+        dm.linear.get_projects = _FakeLinearCall(projects)
+        dm.linear.get_team_workflow_states = _FakeLinearCall(states)
+        dm.linear.get_issues = _FakeLinearCall(issues)
+        return dm
+
+    return _patch
@@ -8,6 +8,8 @@ from projectdash.config import AppConfig
 from projectdash.data import DataManager
 from projectdash.models import AgentRun
 
+_CONFIG = AppConfig(seed_mock_data=False)
+
 
 def _agent_run() -> AgentRun:
     return AgentRun(
@@ -33,7 +35,7 @@ def _agent_run() -> AgentRun:
 @pytest.mark.asyncio
 async def test_dispatch_agent_run_returns_queued_when_env_missing(monkeypatch) -> None:
     monkeypatch.delenv("PD_AGENT_RUN_CMD", raising=False)
-    dm = DataManager(config=AppConfig(seed_mock_data=False))
+    dm = DataManager(config=_CONFIG)
     run = _agent_run()
 
     dispatched, message = await dm.dispatch_agent_run(run)
@@ -46,7 +48,7 @@ async def test_dispatch_agent_run_returns_queued_when_env_missing(monkeypatch) -
 @pytest.mark.asyncio
 async def test_dispatch_agent_run_marks_running_and_records(monkeypatch) -> None:
     monkeypatch.setenv("PD_AGENT_RUN_CMD", "echo {run_id} {issue_id} {pull_request_number}")
-    dm = DataManager(config=AppConfig(seed_mock_data=False))
+    dm = DataManager(config=_CONFIG)
     run = _agent_run()
     saved_statuses: list[str] = []
     command_calls: list[list[str]] = []
@@ -79,7 +81,7 @@ async def test_dispatch_agent_run_marks_running_and_records(monkeypatch) -> None
 async def test_dispatch_agent_run_tmux_profile_captures_session_and_log(monkeypatch, tmp_path) -> None:
     monkeypatch.chdir(tmp_path)
     monkeypatch.setenv("PD_AGENT_RUN_CMD", "tmux:echo run={run_id} pr={pull_request_number}")
-    dm = DataManager(config=AppConfig(seed_mock_data=False))
+    dm = DataManager(config=_CONFIG)
     run = _agent_run()
     saved_runs: list[AgentRun] = []
     command_calls: list[list[str]] = []
@@ -121,7 +123,7 @@ async def test_dispatch_agent_run_tmux_profile_captures_session_and_log(monkeypa
 
 @pytest.mark.asyncio
 async def test_complete_agent_run_marks_failed_and_persists_artifacts(monkeypatch, tmp_path) -> None:
-    dm = DataManager(config=AppConfig(seed_mock_data=False))
+    dm = DataManager(config=_CONFIG)
     run = _agent_run()
     run.status = "running"
     run.runtime = "tmux"
@@ -161,7 +163,7 @@ async def test_complete_agent_run_marks_failed_and_persists_artifacts(monkeypatc
 
 @pytest.mark.asyncio
 async def test_complete_agent_run_captures_trace_logs(monkeypatch, tmp_path) -> None:
-    dm = DataManager(config=AppConfig(seed_mock_data=False))
+    dm = DataManager(config=_CONFIG)
     run = _agent_run()
     run.status = "running"
     
@@ -38,7 +38,16 @@ def _project(project_id: str, name: str):
     return SimpleNamespace(id=project_id, name=name)
 
 
-def test_context_left_moves_sprint_cursor_when_sprint_active(monkeypatch) -> None:
+_PROJECTS = (_project("p1", "API"), _project("p2", "UI"), _project("p3", "Ops"))
+
+
+def _key_event(key: str, character: str | None = None) -> SimpleNamespace:
+    event = SimpleNamespace(key=key, character=character, stopped=False)
+    event.stop = lambda: setattr(event, "stopped", True)
+    return event
+
+
+def test_context_left_moves_sprint_cursor_when_sprint_active() -> None:
     app = ProjectDash()
     sprint = _FakeSprintView()
     prev_tab_called = False
@@ -47,8 +56,8 @@ def test_context_left_moves_sprint_cursor_when_sprint_active(monkeypatch) -> Non
         nonlocal prev_tab_called
         prev_tab_called = True
 
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: sprint)
-    monkeypatch.setattr(app, "action_prev_tab", fake_prev_tab)
+    app._active_sprint_view = lambda: sprint
+    app.action_prev_tab = fake_prev_tab
 
     app.action_context_left()
 
@@ -56,7 +65,7 @@ def test_context_left_moves_sprint_cursor_when_sprint_active(monkeypatch) -> Non
     assert prev_tab_called is False
 
 
-def test_context_right_switches_tab_when_sprint_inactive(monkeypatch) -> None:
+def test_context_right_switches_tab_when_sprint_inactive() -> None:
     app = ProjectDash()
     next_tab_called = False
 
@@ -64,15 +73,15 @@ def test_context_right_switches_tab_when_sprint_inactive(monkeypatch) -> None:
         nonlocal next_tab_called
         next_tab_called = True
 
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: None)
-    monkeypatch.setattr(app, "action_next_tab", fake_next_tab)
+    app._active_sprint_view = lambda: None
+    app.action_next_tab = fake_next_tab
 
     app.action_context_right()
 
     assert next_tab_called is True
 
 
-def test_context_left_does_not_move_when_filter_active(monkeypatch) -> None:
+def test_context_left_does_not_move_when_filter_active() -> None:
     app = ProjectDash()
     sprint = _FakeSprintView()
     sprint.filter_active = True
@@ -82,8 +91,8 @@ def test_context_left_does_not_move_when_filter_active(monkeypatch) -> None:
         nonlocal prev_tab_called
         prev_tab_called = True
 
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: sprint)
-    monkeypatch.setattr(app, "action_prev_tab", fake_prev_tab)
+    app._active_sprint_view = lambda: sprint
+    app.action_prev_tab = fake_prev_tab
 
     app.action_context_left()
 
@@ -91,7 +100,7 @@ def test_context_left_does_not_move_when_filter_active(monkeypatch) -> None:
     assert prev_tab_called is False
 
 
-def test_context_right_cycles_project_when_scope_is_active(monkeypatch) -> None:
+def test_context_right_cycles_project_when_scope_is_active() -> None:
     app = ProjectDash()
     app.project_scope_id = "p1"
     called_project_next = False
@@ -105,9 +114,9 @@ def test_context_right_cycles_project_when_scope_is_active(monkeypatch) -> None:
         nonlocal called_next_tab
         called_next_tab = True
 
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: None)
-    monkeypatch.setattr(app, "action_project_next", fake_project_next)
-    monkeypatch.setattr(app, "action_next_tab", fake_next_tab)
+    app._active_sprint_view = lambda: None
+    app.action_project_next = fake_project_next
+    app.action_next_tab = fake_next_tab
 
     app.action_context_right()
 
@@ -115,16 +124,14 @@ def test_context_right_cycles_project_when_scope_is_active(monkeypatch) -> None:
     assert called_next_tab is False
 
 
-def test_sprint_down_dispatches_to_active_selection_view(monkeypatch) -> None:
+def test_sprint_down_dispatches_to_active_selection_view() -> None:
     app = ProjectDash()
     deltas: list[int] = []
 
-    class _SelectionView:
-        def move_selection(self, delta: int) -> None:
-            deltas.append(delta)
+    selection_view = SimpleNamespace(move_selection=deltas.append)
 
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: None)
-    monkeypatch.setattr(app, "_active_selection_view", lambda: _SelectionView())
+    app._active_sprint_view = lambda: None
+    app._active_selection_view = lambda: selection_view
 
     app.action_sprint_down()
     app.action_sprint_up()
@@ -132,43 +139,39 @@ def test_sprint_down_dispatches_to_active_selection_view(monkeypatch) -> None:
     assert deltas == [1, -1]
 
 
-def test_sprint_down_does_not_fallback_when_sprint_filter_active(monkeypatch) -> None:
+def test_sprint_down_does_not_fallback_when_sprint_filter_active() -> None:
     app = ProjectDash()
     sprint = _FakeSprintView()
     sprint.filter_active = True
-    selection_called = False
+    selection_moves: list[int] = []
+    selection_view = SimpleNamespace(move_selection=selection_moves.append)
 
-    class _SelectionView:
-        def move_selection(self, delta: int) -> None:
-            nonlocal selection_called
-            selection_called = True
-
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: sprint)
-    monkeypatch.setattr(app, "_active_selection_view", lambda: _SelectionView())
+    app._active_sprint_view = lambda: sprint
+    app._active_selection_view = lambda: selection_view
 
     app.action_sprint_down()
 
     assert sprint.moves == []
-    assert selection_called is False
+    assert selection_moves == []
 
 
 @pytest.mark.asyncio
-async def test_sprint_close_issue_dispatches_to_active_sprint(monkeypatch) -> None:
+async def test_sprint_close_issue_dispatches_to_active_sprint() -> None:
     app = ProjectDash()
     sprint = _FakeSprintView()
     published: list[tuple[bool, str]] = []
 
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: sprint)
-    monkeypatch.setattr(app, "_publish_action_result", lambda ok, msg: published.append((ok, msg)))
+    app._active_sprint_view = lambda: sprint
+    app._publish_action_result = lambda ok, msg: published.append((ok, msg))
 
     def mock_push_screen(screen, callback) -> None:
         if callback:
             callback(True)
-    monkeypatch.setattr(app, "push_screen", mock_push_screen)
+    app.push_screen = mock_push_screen
 
     def mock_run_worker(coro, **kwargs):
         app._worker_task = asyncio.create_task(coro)
-    monkeypatch.setattr(app, "run_worker", mock_run_worker)
+    app.run_worker = mock_run_worker
 
     await app.action_sprint_close_issue()
     if hasattr(app, "_worker_task"):
@@ -178,13 +181,13 @@ async def test_sprint_close_issue_dispatches_to_active_sprint(monkeypatch) -> No
     assert published == [(True, "closed")]
 
 
-def test_sprint_open_linear_dispatches_to_active_sprint(monkeypatch) -> None:
+def test_sprint_open_linear_dispatches_to_active_sprint() -> None:
     app = ProjectDash()
     sprint = _FakeSprintView()
     published: list[tuple[bool, str]] = []
 
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: sprint)
-    monkeypatch.setattr(app, "_publish_action_result", lambda ok, msg: published.append((ok, msg)))
+    app._active_sprint_view = lambda: sprint
+    app._publish_action_result = lambda ok, msg: published.append((ok, msg))
 
     app.action_sprint_open_linear()
 
@@ -192,26 +195,26 @@ def test_sprint_open_linear_dispatches_to_active_sprint(monkeypatch) -> None:
     assert published == [(True, "opened")]
 
 
-def test_sprint_open_linear_dispatches_to_github_when_active(monkeypatch) -> None:
+def test_sprint_open_linear_dispatches_to_github_when_active() -> None:
     app = ProjectDash()
     calls: list[str] = []
 
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: None)
-    monkeypatch.setattr(app, "_active_github_view", lambda: object())
-    monkeypatch.setattr(app, "action_github_open_pr", lambda: calls.append("open_pr"))
+    app._active_sprint_view = lambda: None
+    app._active_github_view = lambda: object()
+    app.action_github_open_pr = lambda: calls.append("open_pr")
 
     app.action_sprint_open_linear()
 
     assert calls == ["open_pr"]
 
 
-def test_sprint_comment_dispatches_to_github_check_when_active(monkeypatch) -> None:
+def test_sprint_comment_dispatches_to_github_check_when_active() -> None:
     app = ProjectDash()
     calls: list[str] = []
 
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: None)
-    monkeypatch.setattr(app, "_active_github_view", lambda: object())
-    monkeypatch.setattr(app, "action_github_open_check", lambda: calls.append("open_check"))
+    app._active_sprint_view = lambda: None
+    app._active_github_view = lambda: object()
+    app.action_github_open_check = lambda: calls.append("open_check")
 
     app.action_sprint_comment_issue()
 
@@ -219,24 +222,24 @@ def test_sprint_comment_dispatches_to_github_check_when_active(monkeypatch) -> N
 
 
 @pytest.mark.asyncio
-async def test_sprint_assignee_dispatches_to_github_agent_when_active(monkeypatch) -> None:
+async def test_sprint_assignee_dispatches_to_github_agent_when_active() -> None:
     app = ProjectDash()
     calls: list[str] = []
 
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: None)
-    monkeypatch.setattr(app, "_active_github_view", lambda: object())
+    app._active_sprint_view = lambda: None
+    app._active_github_view = lambda: object()
 
     async def fake_github_agent() -> None:
         calls.append("agent")
 
-    monkeypatch.setattr(app, "action_github_trigger_agent", fake_github_agent)
+    app.action_github_trigger_agent = fake_github_agent
 
     await app.action_sprint_cycle_assignee()
 
     assert calls == ["agent"]
 
 
-def test_sprint_open_github_drilldown_switches_tab_and_focuses_issue(monkeypatch) -> None:
+def test_sprint_open_github_drilldown_switches_tab_and_focuses_issue() -> None:
     app = ProjectDash()
     events: list[tuple[str, str]] = []
 
@@ -251,10 +254,10 @@ def test_sprint_open_github_drilldown_switches_tab_and_focuses_issue(monkeypatch
             events.append(("focus", issue_id))
             return True, f"showing {issue_id}"
 
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: _FakeSprint())
-    monkeypatch.setattr(app, "_active_github_view", lambda: _FakeGithub())
-    monkeypatch.setattr(app, "action_switch_tab", lambda tab_id: events.append(("tab", tab_id)))
-    monkeypatch.setattr(app, "_publish_action_result", lambda ok, msg: events.append(("result", msg)))
+    app._active_sprint_view = lambda: _FakeSprint()
+    app._active_github_view = lambda: _FakeGithub()
+    app.action_switch_tab = lambda tab_id: events.append(("tab", tab_id))
+    app._publish_action_result = lambda ok, msg: events.append(("result", msg))
 
     app.action_sprint_open_github_drilldown()
 
@@ -263,7 +266,7 @@ def test_sprint_open_github_drilldown_switches_tab_and_focuses_issue(monkeypatch
     assert any(event[0] == "result" and "PD-123" in event[1] for event in events)
 
 
-def test_sprint_open_github_drilldown_falls_back_to_timeline_blocked_drilldown(monkeypatch) -> None:
+def test_sprint_open_github_drilldown_falls_back_to_timeline_blocked_drilldown() -> None:
     app = ProjectDash()
     events: list[tuple[bool, str]] = []
 
@@ -271,16 +274,16 @@ def test_sprint_open_github_drilldown_falls_back_to_timeline_blocked_drilldown(m
         def open_project_blocked_drilldown(self):
             return True, "Blocked drilldown: 2 issue(s)"
 
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: None)
-    monkeypatch.setattr(app, "_active_timeline_view", lambda: _FakeTimeline())
-    monkeypatch.setattr(app, "_publish_action_result", lambda ok, msg: events.append((ok, msg)))
+    app._active_sprint_view = lambda: None
+    app._active_timeline_view = lambda: _FakeTimeline()
+    app._publish_action_result = lambda ok, msg: events.append((ok, msg))
 
     app.action_sprint_open_github_drilldown()
 
     assert events == [(True, "Blocked drilldown: 2 issue(s)")]
 
 
-def test_github_jump_issue_switches_to_sprint(monkeypatch) -> None:
+def test_github_jump_issue_switches_to_sprint() -> None:
     app = ProjectDash()
     events: list[tuple[str, str]] = []
 
@@ -293,10 +296,10 @@ def test_github_jump_issue_switches_to_sprint(monkeypatch) -> None:
             events.append(("focus", issue_id))
             return True, f"focused {issue_id}"
 
-    monkeypatch.setattr(app, "_active_github_view", lambda: _FakeGithub())
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: _FakeSprint())
-    monkeypatch.setattr(app, "action_switch_tab", lambda tab_id: events.append(("tab", tab_id)))
-    monkeypatch.setattr(app, "_publish_action_result", lambda ok, msg: events.append(("result", msg)))
+    app._active_github_view = lambda: _FakeGithub()
+    app._active_sprint_view = lambda: _FakeSprint()
+    app.action_switch_tab = lambda tab_id: events.append(("tab", tab_id))
+    app._publish_action_result = lambda ok, msg: events.append(("result", msg))
 
     app.action_github_jump_issue()
 
@@ -306,7 +309,7 @@ def test_github_jump_issue_switches_to_sprint(monkeypatch) -> None:
     assert any(item.get("route") == "github_jump_issue" for item in app._navigation_context_stack)
 
 
-def test_github_jump_issue_clears_context_when_focus_fails(monkeypatch) -> None:
+def test_github_jump_issue_clears_context_when_focus_fails() -> None:
     app = ProjectDash()
     events: list[tuple[str, str]] = []
 
@@ -319,10 +322,10 @@ def test_github_jump_issue_clears_context_when_focus_fails(monkeypatch) -> None:
             events.append(("focus", issue_id))
             return False, "not found"
 
-    monkeypatch.setattr(app, "_active_github_view", lambda: _FakeGithub())
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: _FakeSprint())
-    monkeypatch.setattr(app, "action_switch_tab", lambda tab_id: events.append(("tab", tab_id)))
-    monkeypatch.setattr(app, "_publish_action_result", lambda ok, msg: events.append(("result", msg)))
+    app._active_github_view = lambda: _FakeGithub()
+    app._active_sprint_view = lambda: _FakeSprint()
+    app.action_switch_tab = lambda tab_id: events.append(("tab", tab_id))
+    app._publish_action_result = lambda ok, msg: events.append(("result", msg))
 
     app.action_github_jump_issue()
 
@@ -332,7 +335,7 @@ def test_github_jump_issue_clears_context_when_focus_fails(monkeypatch) -> None:
     assert app._navigation_context_stack == []
 
 
-def test_github_clear_drilldown_dispatches_to_active_github(monkeypatch) -> None:
+def test_github_clear_drilldown_dispatches_to_active_github() -> None:
     app = ProjectDash()
     events: list[tuple[bool, str]] = []
 
@@ -340,15 +343,15 @@ def test_github_clear_drilldown_dispatches_to_active_github(monkeypatch) -> None
         def clear_issue_drilldown(self):
             return True, "Cleared issue drilldown (PD-123)"
 
-    monkeypatch.setattr(app, "_active_github_view", lambda: _FakeGithub())
-    monkeypatch.setattr(app, "_publish_action_result", lambda ok, msg: events.append((ok, msg)))
+    app._active_github_view = lambda: _FakeGithub()
+    app._publish_action_result = lambda ok, msg: events.append((ok, msg))
 
     app.action_github_clear_drilldown()
 
     assert events == [(True, "Cleared issue drilldown (PD-123)")]
 
 
-def test_github_clear_drilldown_restores_origin_context(monkeypatch) -> None:
+def test_github_clear_drilldown_restores_origin_context() -> None:
     app = ProjectDash()
     events: list[tuple[bool, str]] = []
     switched: list[str] = []
@@ -362,15 +365,11 @@ def test_github_clear_drilldown_restores_origin_context(monkeypatch) -> None:
         route="github_issue_drilldown",
         payload={"origin": {"tab_id": "sprint", "view_state": {"filter_query": "mine", "selected_issue_id": "PD-123"}}},
     )
-    monkeypatch.setattr(app, "_active_github_view", lambda: _FakeGithub())
-    monkeypatch.setattr(app, "action_switch_tab", lambda tab_id: switched.append(tab_id))
-    monkeypatch.setattr(
-        app,
-        "_restore_view_state_snapshot",
-        lambda view_id, state: restored.append((view_id, state)),
-    )
-    monkeypatch.setattr(app, "update_app_status", lambda msg=None: None)
-    monkeypatch.setattr(app, "_publish_action_result", lambda ok, msg: events.append((ok, msg)))
+    app._active_github_view = lambda: _FakeGithub()
+    app.action_switch_tab = lambda tab_id: switched.append(tab_id)
+    app._restore_view_state_snapshot = lambda view_id, state: restored.append((view_id, state))
+    app.update_app_status = lambda msg=None: None
+    app._publish_action_result = lambda ok, msg: events.append((ok, msg))
 
     app.action_github_clear_drilldown()
 
@@ -380,7 +379,7 @@ def test_github_clear_drilldown_restores_origin_context(monkeypatch) -> None:
     assert app._navigation_context_stack == []
 
 
-def test_github_clear_drilldown_restores_jump_issue_context_when_github_inactive(monkeypatch) -> None:
+def test_github_clear_drilldown_restores_jump_issue_context_when_github_inactive() -> None:
     app = ProjectDash()
     switched: list[str] = []
     restored: list[tuple[str, dict[str, object] | None]] = []
@@ -390,15 +389,11 @@ def test_github_clear_drilldown_restores_jump_issue_context_when_github_inactive
         route="github_jump_issue",
         payload={"origin": {"tab_id": "github", "view_state": {"visual_mode": "prs", "selected_pull_request_id": "pr-7"}}},
     )
-    monkeypatch.setattr(app, "_active_github_view", lambda: None)
-    monkeypatch.setattr(app, "action_switch_tab", lambda tab_id: switched.append(tab_id))
-    monkeypatch.setattr(
-        app,
-        "_restore_view_state_snapshot",
-        lambda view_id, state: restored.append((view_id, state)),
-    )
-    monkeypatch.setattr(app, "update_app_status", lambda msg=None: None)
-    monkeypatch.setattr(app, "_publish_action_result", lambda ok, msg: published.append((ok, msg)))
+    app._active_github_view = lambda: None
+    app.action_switch_tab = lambda tab_id: switched.append(tab_id)
+    app._restore_view_state_snapshot = lambda view_id, state: restored.append((view_id, state))
+    app.update_app_status = lambda msg=None: None
+    app._publish_action_result = lambda ok, msg: published.append((ok, msg))
 
     app.action_github_clear_drilldown()
 
@@ -408,7 +403,7 @@ def test_github_clear_drilldown_restores_jump_issue_context_when_github_inactive
     assert app._navigation_context_stack == []
 
 
-def test_timeline_blocked_drilldown_back_restores_origin(monkeypatch) -> None:
+def test_timeline_blocked_drilldown_back_restores_origin() -> None:
     app = ProjectDash()
     events: list[tuple[bool, str]] = []
     switched: list[str] = []
@@ -421,15 +416,11 @@ def test_timeline_blocked_drilldown_back_restores_origin(monkeypatch) -> None:
         route="timeline_blocked_drilldown",
         payload={"origin": {"tab_id": "timeline", "view_state": {"visual_mode": "project", "selected_project_id": "p1"}}},
     )
-    monkeypatch.setattr(app, "_active_timeline_view", lambda: _FakeTimeline())
-    monkeypatch.setattr(app, "action_switch_tab", lambda tab_id: switched.append(tab_id))
-    monkeypatch.setattr(
-        app,
-        "_restore_view_state_snapshot",
-        lambda view_id, state: restored.append((view_id, state)),
-    )
-    monkeypatch.setattr(app, "update_app_status", lambda msg=None: None)
-    monkeypatch.setattr(app, "_publish_action_result", lambda ok, msg: events.append((ok, msg)))
+    app._active_timeline_view = lambda: _FakeTimeline()
+    app.action_switch_tab = lambda tab_id: switched.append(tab_id)
+    app._restore_view_state_snapshot = lambda view_id, state: restored.append((view_id, state))
+    app.update_app_status = lambda msg=None: None
+    app._publish_action_result = lambda ok, msg: events.append((ok, msg))
 
     app.action_timeline_blocked_drilldown()
 
@@ -439,7 +430,7 @@ def test_timeline_blocked_drilldown_back_restores_origin(monkeypatch) -> None:
     assert app._navigation_context_stack == []
 
 
-def test_open_issue_flow_prefers_active_sprint_issue(monkeypatch) -> None:
+def test_open_issue_flow_prefers_active_sprint_issue() -> None:
     app = ProjectDash()
     pushed: list[object] = []
     callbacks: list[object] = []
@@ -455,10 +446,10 @@ def test_open_issue_flow_prefers_active_sprint_issue(monkeypatch) -> None:
         def selected_issue_for_jump(self):
             return "PD-999"
 
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: _FakeSprint())
-    monkeypatch.setattr(app, "_active_github_view", lambda: _FakeGithub())
-    monkeypatch.setattr(app, "push_screen", lambda screen, callback=None: (pushed.append(screen), callbacks.append(callback)))
-    monkeypatch.setattr(app, "_publish_action_result", lambda ok, msg: published.append((ok, msg)))
+    app._active_sprint_view = lambda: _FakeSprint()
+    app._active_github_view = lambda: _FakeGithub()
+    app.push_screen = lambda screen, callback=None: (pushed.append(screen), callbacks.append(callback))
+    app._publish_action_result = lambda ok, msg: published.append((ok, msg))
 
     app.action_open_issue_flow()
 
@@ -470,7 +461,7 @@ def test_open_issue_flow_prefers_active_sprint_issue(monkeypatch) -> None:
     assert published == [(True, "Opened issue flow for PD-201")]
 
 
-def test_open_issue_flow_uses_github_selection_when_sprint_unavailable(monkeypatch) -> None:
+def test_open_issue_flow_uses_github_selection_when_sprint_unavailable() -> None:
     app = ProjectDash()
     pushed: list[object] = []
     callbacks: list[object] = []
@@ -480,10 +471,10 @@ def test_open_issue_flow_uses_github_selection_when_sprint_unavailable(monkeypat
         def selected_issue_for_jump(self):
             return "PD-333"
 
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: None)
-    monkeypatch.setattr(app, "_active_github_view", lambda: _FakeGithub())
-    monkeypatch.setattr(app, "push_screen", lambda screen, callback=None: (pushed.append(screen), callbacks.append(callback)))
-    monkeypatch.setattr(app, "_publish_action_result", lambda ok, msg: published.append((ok, msg)))
+    app._active_sprint_view = lambda: None
+    app._active_github_view = lambda: _FakeGithub()
+    app.push_screen = lambda screen, callback=None: (pushed.append(screen), callbacks.append(callback))
+    app._publish_action_result = lambda ok, msg: published.append((ok, msg))
 
     app.action_open_issue_flow()
 
@@ -494,7 +485,7 @@ def test_open_issue_flow_uses_github_selection_when_sprint_unavailable(monkeypat
     assert published == [(True, "Opened issue flow for PD-333")]
 
 
-def test_open_issue_flow_publishes_error_when_no_issue_context(monkeypatch) -> None:
+def test_open_issue_flow_publishes_error_when_no_issue_context() -> None:
     app = ProjectDash()
     published: list[tuple[bool, str]] = []
     pushed: list[object] = []
@@ -509,10 +500,10 @@ def test_open_issue_flow_publishes_error_when_no_issue_context(monkeypatch) -> N
         def selected_issue_for_jump(self):
             return None
 
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: _FakeSprint())
-    monkeypatch.setattr(app, "_active_github_view", lambda: _FakeGithub())
-    monkeypatch.setattr(app, "push_screen", lambda screen, callback=None: pushed.append(screen))
-    monkeypatch.setattr(app, "_publish_action_result", lambda ok, msg: published.append((ok, msg)))
+    app._active_sprint_view = lambda: _FakeSprint()
+    app._active_github_view = lambda: _FakeGithub()
+    app.push_screen = lambda screen, callback=None: pushed.append(screen)
+    app._publish_action_result = lambda ok, msg: published.append((ok, msg))
 
     app.action_open_issue_flow()
 
@@ -520,7 +511,7 @@ def test_open_issue_flow_publishes_error_when_no_issue_context(monkeypatch) -> N
     assert published == [(False, "No linked issue selected for issue flow")]
 
 
-def test_issue_flow_close_restores_origin_tab_and_view_state(monkeypatch) -> None:
+def test_issue_flow_close_restores_origin_tab_and_view_state() -> None:
     app = ProjectDash()
     switched: list[str] = []
     restored: list[tuple[str, dict[str, object] | None]] = []
@@ -535,13 +526,9 @@ def test_issue_flow_close_restores_origin_tab_and_view_state(monkeypatch) -> Non
             }
         },
     )
-    monkeypatch.setattr(app, "action_switch_tab", lambda tab_id: switched.append(tab_id))
-    monkeypatch.setattr(
-        app,
-        "_restore_view_state_snapshot",
-        lambda view_id, state: restored.append((view_id, state)),
-    )
-    monkeypatch.setattr(app, "update_app_status", lambda msg=None: status_updates.append(msg or ""))
+    app.action_switch_tab = lambda tab_id: switched.append(tab_id)
+    app._restore_view_state_snapshot = lambda view_id, state: restored.append((view_id, state))
+    app.update_app_status = lambda msg=None: status_updates.append(msg or "")
 
     app._on_issue_flow_closed()
 
@@ -551,82 +538,82 @@ def test_issue_flow_close_restores_origin_tab_and_view_state(monkeypatch) -> Non
     assert app._navigation_context_stack == []
 
 
-def test_open_filter_dispatches_to_sprint_or_github(monkeypatch) -> None:
+def test_open_filter_dispatches_to_sprint_or_github() -> None:
     app = ProjectDash()
     events: list[str] = []
 
     class _FakeGithub:
         pass
 
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: None)
-    monkeypatch.setattr(app, "_active_github_view", lambda: _FakeGithub())
-    monkeypatch.setattr(app, "_activate_command_input", lambda initial: events.append(f"cmd:{initial}"))
+    app._active_sprint_view = lambda: None
+    app._active_github_view = lambda: _FakeGithub()
+    app._activate_command_input = lambda initial: events.append(f"cmd:{initial}")
 
     app.action_open_filter()
 
     assert events == ["cmd:github "]
 
 
-def test_open_filter_prefers_sprint_filter(monkeypatch) -> None:
+def test_open_filter_prefers_sprint_filter() -> None:
     app = ProjectDash()
     events: list[str] = []
 
     class _FakeSprint:
         pass
 
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: _FakeSprint())
-    monkeypatch.setattr(app, "action_sprint_filter", lambda: events.append("sprint"))
-    monkeypatch.setattr(app, "_activate_command_input", lambda initial: events.append(f"cmd:{initial}"))
+    app._active_sprint_view = lambda: _FakeSprint()
+    app.action_sprint_filter = lambda: events.append("sprint")
+    app._activate_command_input = lambda initial: events.append(f"cmd:{initial}")
 
     app.action_open_filter()
 
     assert events == ["sprint"]
 
 
-def test_open_filter_prefills_timeline_and_workload(monkeypatch) -> None:
+def test_open_filter_prefills_timeline_and_workload() -> None:
     app = ProjectDash()
     events: list[str] = []
 
     class _FakeTimeline:
         visual_mode = "blocked"
 
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: None)
-    monkeypatch.setattr(app, "_active_github_view", lambda: None)
-    monkeypatch.setattr(app, "_active_timeline_view", lambda: _FakeTimeline())
-    monkeypatch.setattr(app, "_activate_command_input", lambda initial: events.append(initial))
+    app._active_sprint_view = lambda: None
+    app._active_github_view = lambda: None
+    app._active_timeline_view = lambda: _FakeTimeline()
+    app._activate_command_input = lambda initial: events.append(initial)
 
     app.action_open_filter()
 
-    monkeypatch.setattr(app, "_active_timeline_view", lambda: None)
-    monkeypatch.setattr(app, "_active_workload_view", lambda: object())
+    app._active_timeline_view = lambda: None
+    app._active_workload_view = lambda: object()
     app.action_open_filter()
 
     assert events == ["blocked ", "workload "]
 
 
-def test_back_context_uses_timeline_drilldown_restore(monkeypatch) -> None:
+def test_back_context_uses_timeline_drilldown_restore() -> None:
     app = ProjectDash()
     calls: list[str] = []
 
     class _FakeTimeline:
         visual_mode = "blocked"
 
-    monkeypatch.setattr(app, "_active_github_view", lambda: None)
-    monkeypatch.setattr(app, "_active_timeline_view", lambda: _FakeTimeline())
-    monkeypatch.setattr(app, "action_timeline_blocked_drilldown", lambda: calls.append("timeline_back"))
+    app._active_github_view = lambda: None
+    app._active_timeline_view = lambda: _FakeTimeline()
+    app.action_timeline_blocked_drilldown = lambda: calls.append("timeline_back")
 
     app.action_back_context()
 
     assert calls == ["timeline_back"]
 
 
-def test_back_context_falls_back_to_close_detail(monkeypatch) -> None:
+def test_back_context_falls_back_to_close_detail() -> None:
     app = ProjectDash()
     calls: list[str] = []
-    monkeypatch.setattr(app, "_active_github_view", lambda: None)
-    monkeypatch.setattr(app, "_active_timeline_view", lambda: None)
-    monkeypatch.setattr(app, "_restore_context_route", lambda route: False)
-    monkeypatch.setattr(app, "action_close_detail", lambda: calls.append("close"))
+    app._active_github_view = lambda: None
+    app._active_timeline_view = lambda: None
+    app._restore_context_route = lambda route: False
+    app.action_close_detail = lambda: calls.append("close")
 
     app.action_back_context()
 
@@ -665,11 +652,11 @@ async def test_github_trigger_agent_records_run(monkeypatch) -> None:
     async def fake_record_agent_run(run):
         recorded_runs.append(run)
 
-    monkeypatch.setattr(app, "_active_github_view", lambda: _FakeGithub())
-    monkeypatch.setattr(app.data_manager, "record_agent_run", fake_record_agent_run)
-    monkeypatch.setattr(app.data_manager, "get_issue_by_id", lambda issue_id: SimpleNamespace(project_id="p1"))
-    monkeypatch.setattr(app, "_queue_agent_run_refresh", lambda: refresh_queued.append(True))
-    monkeypatch.setattr(app, "_publish_action_result", lambda ok, msg: published.append((ok, msg)))
+    app._active_github_view = lambda: _FakeGithub()
+    app.data_manager.record_agent_run = fake_record_agent_run
+    app.data_manager.get_issue_by_id = lambda issue_id: SimpleNamespace(project_id="p1")
+    app._queue_agent_run_refresh = lambda: refresh_queued.append(True)
+    app._publish_action_result = lambda ok, msg: published.append((ok, msg))
 
     await app.action_github_trigger_agent()
 
@@ -684,7 +671,7 @@ async def test_github_trigger_agent_records_run(monkeypatch) -> None:
 
 
 @pytest.mark.asyncio
-async def test_agent_run_refresh_notifies_on_terminal_transition(monkeypatch) -> None:
+async def test_agent_run_refresh_notifies_on_terminal_transition() -> None:
     app = ProjectDash()
     app._agent_run_status_by_id = {"ghrun-1": "running"}
     refreshed: list[bool] = []
@@ -703,10 +690,10 @@ async def test_agent_run_refresh_notifies_on_terminal_transition(monkeypatch) ->
             )
         ]
 
-    monkeypatch.setattr(app.data_manager, "get_agent_runs", fake_get_agent_runs)
-    monkeypatch.setattr(app, "refresh_views", lambda: refreshed.append(True))
-    monkeypatch.setattr(app, "_notify", lambda message, severity="information": notified.append((severity, message)))
-    monkeypatch.setattr(app, "update_app_status", lambda message=None: statuses.append(message or ""))
+    app.data_manager.get_agent_runs = fake_get_agent_runs
+    app.refresh_views = lambda: refreshed.append(True)
+    app._notify = lambda message, severity="information": notified.append((severity, message))
+    app.update_app_status = lambda message=None: statuses.append(message or "")
 
     await app._refresh_agent_run_snapshot(notify=True)
 
@@ -716,7 +703,7 @@ async def test_agent_run_refresh_notifies_on_terminal_transition(monkeypatch) ->
 
 
 @pytest.mark.asyncio
-async def test_agent_run_refresh_snapshot_initializes_without_notifications(monkeypatch) -> None:
+async def test_agent_run_refresh_snapshot_initializes_without_notifications() -> None:
     app = ProjectDash()
     refreshed: list[bool] = []
     notified: list[tuple[str, str]] = []
@@ -733,9 +720,9 @@ async def test_agent_run_refresh_snapshot_initializes_without_notifications(monk
             )
         ]
 
-    monkeypatch.setattr(app.data_manager, "get_agent_runs", fake_get_agent_runs)
-    monkeypatch.setattr(app, "refresh_views", lambda: refreshed.append(True))
-    monkeypatch.setattr(app, "_notify", lambda message, severity="information": notified.append((severity, message)))
+    app.data_manager.get_agent_runs = fake_get_agent_runs
+    app.refresh_views = lambda: refreshed.append(True)
+    app._notify = lambda message, severity="information": notified.append((severity, message))
 
     await app._refresh_agent_run_snapshot(notify=True)
 
@@ -744,7 +731,7 @@ async def test_agent_run_refresh_snapshot_initializes_without_notifications(monk
     assert notified == []
 
 
-def test_queue_agent_run_refresh_skips_when_poll_inflight(monkeypatch) -> None:
+def test_queue_agent_run_refresh_skips_when_poll_inflight() -> None:
     app = ProjectDash()
     app._agent_run_refresh_inflight = True
     run_worker_called = False
@@ -753,14 +740,14 @@ def test_queue_agent_run_refresh_skips_when_poll_inflight(monkeypatch) -> None:
         nonlocal run_worker_called
         run_worker_called = True
 
-    monkeypatch.setattr(app, "run_worker", fake_run_worker)
+    app.run_worker = fake_run_worker
 
     app._queue_agent_run_refresh()
 
     assert run_worker_called is False
 
 
-def test_queue_agent_run_refresh_starts_worker_once(monkeypatch) -> None:
+def test_queue_agent_run_refresh_starts_worker_once() -> None:
     app = ProjectDash()
     app._agent_run_refresh_inflight = False
     started: list[bool] = []
@@ -769,7 +756,7 @@ def test_queue_agent_run_refresh_starts_worker_once(monkeypatch) -> None:
         started.append(True)
         awaitable.close()
 
-    monkeypatch.setattr(app, "run_worker", fake_run_worker)
+    app.run_worker = fake_run_worker
 
     app._queue_agent_run_refresh()
     app._queue_agent_run_refresh()
@@ -777,225 +764,143 @@ def test_queue_agent_run_refresh_starts_worker_once(monkeypatch) -> None:
     assert started == [True]
 
 
-def test_on_key_left_moves_sprint_cursor_and_stops_event(monkeypatch) -> None:
+def test_on_key_left_moves_sprint_cursor_and_stops_event() -> None:
     app = ProjectDash()
     sprint = _FakeSprintView()
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: sprint)
-
-    class _FakeKeyEvent:
-        key = "left"
-        character = None
-
-        def __init__(self) -> None:
-            self.stopped = False
+    app._active_sprint_view = lambda: sprint
 
-        def stop(self) -> None:
-            self.stopped = True
-
-    event = _FakeKeyEvent()
+    event = _key_event("left")
     app.on_key(event)  # type: ignore[arg-type]
 
     assert sprint.moves == [(-1, 0)]
     assert event.stopped is True
 
 
-def test_on_key_down_moves_sprint_cursor_and_stops_event(monkeypatch) -> None:
+def test_on_key_down_moves_sprint_cursor_and_stops_event() -> None:
     app = ProjectDash()
     sprint = _FakeSprintView()
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: sprint)
-
-    class _FakeKeyEvent:
-        key = "down"
-        character = None
-
-        def __init__(self) -> None:
-            self.stopped = False
+    app._active_sprint_view = lambda: sprint
 
-        def stop(self) -> None:
-            self.stopped = True
-
-    event = _FakeKeyEvent()
+    event = _key_event("down")
     app.on_key(event)  # type: ignore[arg-type]
 
     assert sprint.moves == [(0, 1)]
     assert event.stopped is True
 
 
-def test_on_key_space_toggles_page_focus(monkeypatch) -> None:
+def test_on_key_space_toggles_page_focus() -> None:
     app = ProjectDash()
     sprint = _FakeSprintView()
     app.page_focus_locked = True
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: sprint)
-    monkeypatch.setattr(app, "_apply_page_focus_mode", lambda: None)
+    app._active_sprint_view = lambda: sprint
+    app._apply_page_focus_mode = lambda: None
     statuses: list[str] = []
-    monkeypatch.setattr(app, "update_app_status", lambda msg=None: statuses.append(msg or ""))
-
-    class _FakeKeyEvent:
-        key = "space"
-        character = None
-
-        def __init__(self) -> None:
-            self.stopped = False
-
-        def stop(self) -> None:
-            self.stopped = True
+    app.update_app_status = lambda msg=None: statuses.append(msg or "")
 
-    first = _FakeKeyEvent()
+    first = _key_event("space")
     app.on_key(first)  # type: ignore[arg-type]
     assert app.page_focus_locked is False
     assert first.stopped is True
 
-    second = _FakeKeyEvent()
+    second = _key_event("space")
     app.on_key(second)  # type: ignore[arg-type]
     assert app.page_focus_locked is True
     assert second.stopped is True
     assert statuses
 
 
-def test_on_key_left_does_not_move_sprint_when_page_focus_disabled(monkeypatch) -> None:
+def test_on_key_left_does_not_move_sprint_when_page_focus_disabled() -> None:
     app = ProjectDash()
     sprint = _FakeSprintView()
     app.page_focus_locked = False
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: sprint)
-
-    class _FakeKeyEvent:
-        key = "left"
-        character = None
-
-        def __init__(self) -> None:
-            self.stopped = False
-
-        def stop(self) -> None:
-            self.stopped = True
+    app._active_sprint_view = lambda: sprint
 
-    event = _FakeKeyEvent()
+    event = _key_event("left")
     app.on_key(event)  # type: ignore[arg-type]
 
     assert sprint.moves == []
     assert event.stopped is False
 
 
-def test_on_key_down_moves_active_selection_in_page_focus(monkeypatch) -> None:
+def test_on_key_down_moves_active_selection_in_page_focus() -> None:
     app = ProjectDash()
     app.page_focus_locked = True
     app.page_focus_section = "main"
     moves: list[int] = []
 
-    class _SelectionView:
-        def move_selection(self, delta: int) -> None:
-            moves.append(delta)
+    selection_view = SimpleNamespace(move_selection=moves.append)
 
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: None)
-    monkeypatch.setattr(app, "_active_selection_view", lambda: _SelectionView())
+    app._active_sprint_view = lambda: None
+    app._active_selection_view = lambda: selection_view
 
-    class _FakeKeyEvent:
-        key = "down"
-        character = None
-
-        def __init__(self) -> None:
-            self.stopped = False
-
-        def stop(self) -> None:
-            self.stopped = True
-
-    event = _FakeKeyEvent()
+    event = _key_event("down")
     app.on_key(event)  # type: ignore[arg-type]
 
     assert moves == [1]
     assert event.stopped is True
 
 
-def test_on_key_right_switches_to_detail_section_in_page_focus(monkeypatch) -> None:
+def test_on_key_right_switches_to_detail_section_in_page_focus() -> None:
     app = ProjectDash()
     app.page_focus_locked = True
     app.page_focus_section = "main"
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: None)
-    monkeypatch.setattr(app, "_active_selection_view", lambda: None)
-    monkeypatch.setattr(app, "update_app_status", lambda msg=None: None)
-
-    class _FakeKeyEvent:
-        key = "right"
-        character = None
-
-        def __init__(self) -> None:
-            self.stopped = False
-
-        def stop(self) -> None:
-            self.stopped = True
+    app._active_sprint_view = lambda: None
+    app._active_selection_view = lambda: None
+    app.update_app_status = lambda msg=None: None
 
-    event = _FakeKeyEvent()
+    event = _key_event("right")
     app.on_key(event)  # type: ignore[arg-type]
 
     assert app.page_focus_section == "detail"
     assert event.stopped is True
 
 
-def test_on_key_left_returns_to_main_section_in_page_focus(monkeypatch) -> None:
+def test_on_key_left_returns_to_main_section_in_page_focus() -> None:
     app = ProjectDash()
     app.page_focus_locked = True
     app.page_focus_section = "detail"
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: None)
-    monkeypatch.setattr(app, "_active_selection_view", lambda: None)
-    monkeypatch.setattr(app, "update_app_status", lambda msg=None: None)
+    app._active_sprint_view = lambda: None
+    app._active_selection_view = lambda: None
+    app.update_app_status = lambda msg=None: None
 
-    class _FakeKeyEvent:
-        key = "left"
-        character = None
-
-        def __init__(self) -> None:
-            self.stopped = False
-
-        def stop(self) -> None:
-            self.stopped = True
-
-    event = _FakeKeyEvent()
+    event = _key_event("left")
     app.on_key(event)  # type: ignore[arg-type]
 
     assert app.page_focus_section == "main"
     assert event.stopped is True
 
 
-def test_on_key_shift_space_opens_detail(monkeypatch) -> None:
+def test_on_key_shift_space_opens_detail() -> None:
     app = ProjectDash()
     opened: list[bool] = []
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: None)
-    monkeypatch.setattr(app, "action_open_detail", lambda: opened.append(True))
-
-    class _FakeKeyEvent:
-        key = "shift+space"
-        character = None
+    app._active_sprint_view = lambda: None
+    app.action_open_detail = lambda: opened.append(True)
 
-        def __init__(self) -> None:
-            self.stopped = False
-
-        def stop(self) -> None:
-            self.stopped = True
-
-    event = _FakeKeyEvent()
+    event = _key_event("shift+space")
     app.on_key(event)  # type: ignore[arg-type]
 
     assert opened == [True]
     assert event.stopped is True
 
 
-def test_level_down_focuses_first_project_when_scope_is_global(monkeypatch) -> None:
+def test_level_down_focuses_first_project_when_scope_is_global() -> None:
     app = ProjectDash()
-    monkeypatch.setattr(app.data_manager, "get_projects", lambda: [_project("p1", "API"), _project("p2", "UI")])
-    monkeypatch.setattr(app, "_preferred_project_id_from_active_view", lambda: None)
+    app.data_manager.get_projects = lambda: list(_PROJECTS[:2])
+    app._preferred_project_id_from_active_view = lambda: None
     events: list[tuple[str, str]] = []
 
     def fake_set_project_scope(project_id: str | None) -> None:
         events.append(("scope", project_id or "none"))
 
-    monkeypatch.setattr(app, "_set_project_scope", fake_set_project_scope)
-    monkeypatch.setattr(app, "_publish_action_result", lambda ok, msg: events.append(("message", msg)))
+    app._set_project_scope = fake_set_project_scope
+    app._publish_action_result = lambda ok, msg: events.append(("message", msg))
 
     app.action_level_down()
 
     assert events == [("scope", "p1"), ("message", "Project focus: API")]
 
 
-def test_level_up_clears_project_scope(monkeypatch) -> None:
+def test_level_up_clears_project_scope() -> None:
     app = ProjectDash()
     app.project_scope_id = "p2"
     events: list[tuple[str, str]] = []
@@ -1003,8 +908,8 @@ def test_level_up_clears_project_scope(monkeypatch) -> None:
     def fake_set_project_scope(project_id: str | None) -> None:
         events.append(("scope", project_id or "none"))
 
-    monkeypatch.setattr(app, "_set_project_scope", fake_set_project_scope)
-    monkeypatch.setattr(app, "_publish_action_result", lambda ok, msg: events.append(("message", msg)))
+    app._set_project_scope = fake_set_project_scope
+    app._publish_action_result = lambda ok, msg: events.append(("message", msg))
 
     app.action_level_up()
 
@@ -1021,35 +926,31 @@ def test_bindings_include_vertical_level_navigation_shortcuts() -> None:
     assert bound_keys["K"] == "toggle_hotkey_bar"
 
 
-def test_project_next_cycles_scope(monkeypatch) -> None:
+def test_project_next_cycles_scope() -> None:
     app = ProjectDash()
     app.project_scope_id = "p1"
-    monkeypatch.setattr(
-        app.data_manager,
-        "get_projects",
-        lambda: [_project("p1", "API"), _project("p2", "UI"), _project("p3", "Ops")],
-    )
+    app.data_manager.get_projects = lambda: list(_PROJECTS)
     events: list[tuple[str, str]] = []
 
     def fake_set_project_scope(project_id: str | None) -> None:
         events.append(("scope", project_id or "none"))
 
-    monkeypatch.setattr(app, "_set_project_scope", fake_set_project_scope)
-    monkeypatch.setattr(app, "_publish_action_result", lambda ok, msg: events.append(("message", msg)))
+    app._set_project_scope = fake_set_project_scope
+    app._publish_action_result = lambda ok, msg: events.append(("message", msg))
 
     app.action_project_next()
 
     assert events == [("scope", "p2"), ("message", "Project focus: UI")]
 
 
-def test_open_sync_history_pushes_screen(monkeypatch) -> None:
+def test_open_sync_history_pushes_screen() -> None:
     app = ProjectDash()
     pushed: list[object] = []
 
     def fake_push_screen(screen: object) -> None:
         pushed.append(screen)
 
-    monkeypatch.setattr(app, "push_screen", fake_push_screen)
+    app.push_screen = fake_push_screen
 
     app.action_open_sync_history()
 
@@ -1057,44 +958,38 @@ def test_open_sync_history_pushes_screen(monkeypatch) -> None:
     assert isinstance(pushed[0], SyncHistoryScreen)
 
 
-def test_toggle_visual_mode_dispatches_to_active_view(monkeypatch) -> None:
+def test_toggle_visual_mode_dispatches_to_active_view() -> None:
     app = ProjectDash()
     called: list[str] = []
 
-    class _FakeView:
-        def toggle_visual_mode(self):
-            called.append("mode")
-            return True, "ok"
+    fake_view = SimpleNamespace(toggle_visual_mode=lambda: called.append("mode") or (True, "ok"))
 
-    monkeypatch.setattr(app, "_active_visual_view", lambda: _FakeView())
-    monkeypatch.setattr(app, "_publish_action_result", lambda ok, message: called.append(message))
+    app._active_visual_view = lambda: fake_view
+    app._publish_action_result = lambda ok, message: called.append(message)
 
     app.action_toggle_visual_mode()
 
     assert called == ["mode", "ok"]
 
 
-def test_toggle_graph_density_dispatches_to_active_view(monkeypatch) -> None:
+def test_toggle_graph_density_dispatches_to_active_view() -> None:
     app = ProjectDash()
     called: list[str] = []
 
-    class _FakeView:
-        def toggle_graph_density(self):
-            called.append("density")
-            return True, "ok"
+    fake_view = SimpleNamespace(toggle_graph_density=lambda: called.append("density") or (True, "ok"))
 
-    monkeypatch.setattr(app, "_active_visual_view", lambda: _FakeView())
-    monkeypatch.setattr(app, "_publish_action_result", lambda ok, message: called.append(message))
+    app._active_visual_view = lambda: fake_view
+    app._publish_action_result = lambda ok, message: called.append(message)
 
     app.action_toggle_graph_density()
 
     assert called == ["density", "ok"]
 
 
-def test_toggle_hotkey_bar_toggles_visibility(monkeypatch) -> None:
+def test_toggle_hotkey_bar_toggles_visibility() -> None:
     app = ProjectDash()
     statuses: list[str] = []
-    monkeypatch.setattr(app, "update_app_status", lambda msg=None: statuses.append(msg or ""))
+    app.update_app_status = lambda msg=None: statuses.append(msg or "")
 
     assert app.hotkey_bar_visible is True
     app.action_toggle_hotkey_bar()
@@ -1106,18 +1001,16 @@ def test_toggle_hotkey_bar_toggles_visibility(monkeypatch) -> None:
     assert statuses[-1] == "Hotkey bar shown"
 
 
-def test_open_detail_dispatches_to_active_detail_view(monkeypatch) -> None:
+def test_open_detail_dispatches_to_active_detail_view() -> None:
     app = ProjectDash()
     opened: list[bool] = []
     status_updated: list[bool] = []
 
-    class _FakeView:
-        def open_detail(self):
-            opened.append(True)
+    fake_view = SimpleNamespace(open_detail=lambda: opened.append(True))
 
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: None)
-    monkeypatch.setattr(app, "_active_detail_view", lambda: _FakeView())
-    monkeypatch.setattr(app, "update_app_status", lambda msg=None: status_updated.append(True))
+    app._active_sprint_view = lambda: None
+    app._active_detail_view = lambda: fake_view
+    app.update_app_status = lambda msg=None: status_updated.append(True)
 
     app.action_open_detail()
 
@@ -1125,7 +1018,7 @@ def test_open_detail_dispatches_to_active_detail_view(monkeypatch) -> None:
     assert status_updated == [True]
 
 
-def test_open_detail_double_press_on_sprint_opens_item_screen(monkeypatch) -> None:
+def test_open_detail_double_press_on_sprint_opens_item_screen() -> None:
     app = ProjectDash()
     pushed: list[object] = []
     published: list[tuple[bool, str]] = []
@@ -1137,9 +1030,9 @@ def test_open_detail_double_press_on_sprint_opens_item_screen(monkeypatch) -> No
         def current_issue(self):
             return SimpleNamespace(id="PD-77")
 
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: _FakeSprint())
-    monkeypatch.setattr(app, "push_screen", lambda screen, callback=None: pushed.append(screen))
-    monkeypatch.setattr(app, "_publish_action_result", lambda ok, msg: published.append((ok, msg)))
+    app._active_sprint_view = lambda: _FakeSprint()
+    app.push_screen = lambda screen, callback=None: pushed.append(screen)
+    app._publish_action_result = lambda ok, msg: published.append((ok, msg))
 
     app.action_open_detail()
 
@@ -1149,7 +1042,7 @@ def test_open_detail_double_press_on_sprint_opens_item_screen(monkeypatch) -> No
     assert published == [(True, "Opened sprint item view for PD-77")]
 
 
-def test_open_item_view_opens_selected_sprint_issue(monkeypatch) -> None:
+def test_open_item_view_opens_selected_sprint_issue() -> None:
     app = ProjectDash()
     pushed: list[object] = []
     published: list[tuple[bool, str]] = []
@@ -1160,9 +1053,9 @@ def test_open_item_view_opens_selected_sprint_issue(monkeypatch) -> None:
         def current_issue(self):
             return SimpleNamespace(id="PD-88")
 
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: _FakeSprint())
-    monkeypatch.setattr(app, "push_screen", lambda screen, callback=None: pushed.append(screen))
-    monkeypatch.setattr(app, "_publish_action_result", lambda ok, msg: published.append((ok, msg)))
+    app._active_sprint_view = lambda: _FakeSprint()
+    app.push_screen = lambda screen, callback=None: pushed.append(screen)
+    app._publish_action_result = lambda ok, msg: published.append((ok, msg))
 
     app.action_open_item_view()
 
@@ -1172,18 +1065,16 @@ def test_open_item_view_opens_selected_sprint_issue(monkeypatch) -> None:
     assert published == [(True, "Opened sprint item view for PD-88")]
 
 
-def test_close_detail_dispatches_to_active_detail_view(monkeypatch) -> None:
+def test_close_detail_dispatches_to_active_detail_view() -> None:
     app = ProjectDash()
     closed: list[bool] = []
     status_updated: list[bool] = []
 
-    class _FakeView:
-        def close_detail(self):
-            closed.append(True)
+    fake_view = SimpleNamespace(close_detail=lambda: closed.append(True))
 
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: None)
-    monkeypatch.setattr(app, "_active_detail_view", lambda: _FakeView())
-    monkeypatch.setattr(app, "update_app_status", lambda msg=None: status_updated.append(True))
+    app._active_sprint_view = lambda: None
+    app._active_detail_view = lambda: fake_view
+    app.update_app_status = lambda msg=None: status_updated.append(True)
 
     app.action_close_detail()
 
@@ -1191,19 +1082,17 @@ def test_close_detail_dispatches_to_active_detail_view(monkeypatch) -> None:
     assert status_updated == [True]
 
 
-def test_close_detail_closes_help_overlay_before_view(monkeypatch) -> None:
+def test_close_detail_closes_help_overlay_before_view() -> None:
     app = ProjectDash()
     app.help_overlay_active = True
     closed: list[bool] = []
     statuses: list[str] = []
 
-    class _FakeView:
-        def close_detail(self):
-            closed.append(True)
+    fake_view = SimpleNamespace(close_detail=lambda: closed.append(True))
 
-    monkeypatch.setattr(app, "_active_sprint_view", lambda: None)
-    monkeypatch.setattr(app, "_active_detail_view", lambda: _FakeView())
-    monkeypatch.setattr(app, "update_app_status", lambda msg=None: statuses.append(msg or ""))
+    app._active_sprint_view = lambda: None
+    app._active_detail_view = lambda: fake_view
+    app.update_app_status = lambda msg=None: statuses.append(msg or "")
 
     app.action_close_detail()
 
@@ -1212,24 +1101,24 @@ def test_close_detail_closes_help_overlay_before_view(monkeypatch) -> None:
     assert statuses == ["Help overlay closed"]
 
 
-def test_execute_command_filter_dispatches_to_open_filter(monkeypatch) -> None:
+def test_execute_command_filter_dispatches_to_open_filter() -> None:
     app = ProjectDash()
     calls: list[str] = []
-    monkeypatch.setattr(app, "action_open_filter", lambda: calls.append("filter"))
+    app.action_open_filter = lambda: calls.append("filter")
 
     app._execute_command("filter")
 
     assert calls == ["filter"]
 
 
-def test_execute_command_switches_to_github_tab(monkeypatch) -> None:
+def test_execute_command_switches_to_github_tab() -> None:
     app = ProjectDash()
     calls: list[tuple[str, str]] = []
 
     def fake_switch_tab(tab_id: str) -> None:
         calls.append(("tab", tab_id))
 
-    monkeypatch.setattr(app, "action_switch_tab", fake_switch_tab)
+    app.action_switch_tab = fake_switch_tab
 
     app._execute_command("github")
 
@@ -1237,11 +1126,11 @@ def test_execute_command_switches_to_github_tab(monkeypatch) -> None:
     assert all(call == ("tab", "github") for call in calls)
 
 
-def test_execute_command_help_publishes_help(monkeypatch) -> None:
+def test_execute_command_help_publishes_help() -> None:
     app = ProjectDash()
     published: list[tuple[bool, str]] = []
 
-    monkeypatch.setattr(app, "_publish_action_result", lambda ok, msg: published.append((ok, msg)))
+    app._publish_action_result = lambda ok, msg: published.append((ok, msg))
 
     app._execute_command("help")
 
@@ -1251,33 +1140,33 @@ def test_execute_command_help_publishes_help(monkeypatch) -> None:
     assert "Deprecated aliases:" in published[0][1]
 
 
-def test_execute_command_blocked_runs_triage_filter(monkeypatch) -> None:
+def test_execute_command_blocked_runs_triage_filter() -> None:
     app = ProjectDash()
     calls: list[str] = []
 
-    monkeypatch.setattr(app, "action_triage_blocked", lambda: calls.append("blocked"))
+    app.action_triage_blocked = lambda: calls.append("blocked")
 
     app._execute_command("blocked")
 
     assert calls == ["blocked"]
 
 
-def test_execute_command_back_dispatches_back_context(monkeypatch) -> None:
+def test_execute_command_back_dispatches_back_context() -> None:
     app = ProjectDash()
     calls: list[str] = []
-    monkeypatch.setattr(app, "action_back_context", lambda: calls.append("back"))
+    app.action_back_context = lambda: calls.append("back")
 
     app._execute_command("back")
 
     assert calls == ["back"]
 
 
-def test_execute_command_blocked_drilldown_then_back(monkeypatch) -> None:
+def test_execute_command_blocked_drilldown_then_back() -> None:
     app = ProjectDash()
     calls: list[str] = []
-    monkeypatch.setattr(app, "action_switch_tab", lambda tab_id: calls.append(f"tab:{tab_id}"))
-    monkeypatch.setattr(app, "action_timeline_blocked_drilldown", lambda: calls.append("drill"))
-    monkeypatch.setattr(app, "action_back_context", lambda: calls.append("back"))
+    app.action_switch_tab = lambda tab_id: calls.append(f"tab:{tab_id}")
+    app.action_timeline_blocked_drilldown = lambda: calls.append("drill")
+    app.action_back_context = lambda: calls.append("back")
 
     app._execute_command("blocked drilldown")
     app._execute_command("back")
@@ -1285,45 +1174,47 @@ def test_execute_command_blocked_drilldown_then_back(monkeypatch) -> None:
     assert calls == ["tab:timeline", "drill", "back"]
 
 
-def test_execute_command_unknown_publishes_error(monkeypatch) -> None:
+def test_execute_command_unknown_publishes_error() -> None:
     app = ProjectDash()
     published: list[tuple[bool, str]] = []
 
-    monkeypatch.setattr(app, "_publish_action_result", lambda ok, msg: published.append((ok, msg)))
+    app._publish_action_result = lambda ok, msg: published.append((ok, msg))
 
     app._execute_command("not-a-real-command")
 
     assert published == [(False, "Unknown command: /not-a-real-command. Try /help.")]
 
 
-def test_execute_command_colon_q_quits(monkeypatch) -> None:
+def test_execute_command_colon_q_quits() -> None:
     app = ProjectDash()
     calls: list[str] = []
 
-    monkeypatch.setattr(app, "action_quit", lambda: calls.append("quit"))
+    app.action_quit = lambda: calls.append("quit")
 
     app._execute_command(":q")
 
     assert calls == ["quit"]
 
 
-def test_command_suggestions_match_partial_query() -> None:
+@pytest.mark.parametrize(
+    ("query", "limit", "expected_name"),
+    [
+        pytest.param("his", 5, "history", id="partial-query"),
+        pytest.param("", 3, None, id="empty-query-returns-catalog-entries"),
+    ],
+)
+def test_command_suggestions(query: str, limit: int, expected_name: str | None) -> None:
     app = ProjectDash()
 
-    suggestions = app._command_suggestions("his", limit=5)
+    suggestions = app._command_suggestions(query, limit=limit)
 
-    assert suggestions
     names = [name for name, _desc in suggestions]
-    assert "history" in names
-
-
-def test_command_suggestions_empty_query_returns_catalog_entries() -> None:
-    app = ProjectDash()
-
-    suggestions = app._command_suggestions("", limit=3)
-
-    assert len(suggestions) == 3
-    assert all(name for name, _desc in suggestions)
+    assert names
+    assert all(names)
+    if expected_name is None:
+        assert len(names) == limit
+    else:
+        assert expected_name in names
 
 
 def test_check_action_blocks_bindings_while_command_active() -> None:
@@ -1367,11 +1258,7 @@ def test_handle_command_key_consumes_unhandled_keys() -> None:
     app = ProjectDash()
     app.command_active = True
 
-    class _FakeKeyEvent:
-        key = "up"
-        character = None
-
-    handled = app._handle_command_key(_FakeKeyEvent())
+    handled = app._handle_command_key(_key_event("up"))
 
     assert handled is True
 
@@ -1382,11 +1269,7 @@ def test_command_mode_down_key_moves_palette_selection() -> None:
     app.command_query = "h"
     app.command_selected_index = 0
 
-    class _FakeKeyEvent:
-        key = "down"
-        character = None
-
-    app._handle_command_key(_FakeKeyEvent())
+    app._handle_command_key(_key_event("down"))
 
     assert app.command_selected_index == 1
 
@@ -1397,54 +1280,36 @@ def test_command_mode_tab_autocompletes_selected_command() -> None:
     app.command_query = "his"
     app.command_selected_index = 0
 
-    class _FakeKeyEvent:
-        key = "tab"
-        character = None
-
-    app._handle_command_key(_FakeKeyEvent())
+    app._handle_command_key(_key_event("tab"))
 
     assert app.command_query == "history"
 
 
-def test_command_mode_enter_executes_selected_suggestion_when_partial(monkeypatch) -> None:
+def test_command_mode_enter_executes_selected_suggestion_when_partial() -> None:
     app = ProjectDash()
     app.command_active = True
     app.command_query = "his"
     app.command_selected_index = 0
     executed: list[str] = []
 
-    monkeypatch.setattr(app, "_execute_command", lambda cmd: executed.append(cmd))
+    app._execute_command = lambda cmd: executed.append(cmd)
 
-    class _FakeKeyEvent:
-        key = "enter"
-        character = None
-
-    app._handle_command_key(_FakeKeyEvent())
+    app._handle_command_key(_key_event("enter"))
 
     assert executed == ["history"]
     assert app.command_active is False
 
 
-def test_view_filter_state_helpers_capture_and_restore(monkeypatch) -> None:
+def test_view_filter_state_helpers_capture_and_restore() -> None:
     app = ProjectDash()
     restored: list[dict[str, object] | None] = []
 
-    class _FakeView:
-        def capture_filter_state(self):
-            return {"filter_query": "status:blocked"}
-
-        def restore_filter_state(self, state):
-            restored.append(state)
-
-    class _FakeSwitcher:
-        def __init__(self):
-            self.views = {"#sprint": _FakeView()}
-
-        def query_one(self, selector: str):
-            return self.views[selector]
-
-    switcher = _FakeSwitcher()
-    monkeypatch.setattr(app, "query_one", lambda cls: switcher)
+    fake_view = SimpleNamespace(
+        capture_filter_state=lambda: {"filter_query": "status:blocked"},
+        restore_filter_state=restored.append,
+    )
+    switcher = SimpleNamespace(query_one={"#sprint": fake_view}.__getitem__)
+    app.query_one = lambda cls: switcher
 
     app._persist_view_filter_state("sprint")
     assert app._view_filter_state_by_view["sprint"] == {"filter_query": "status:blocked"}
@@ -1453,26 +1318,16 @@ def test_view_filter_state_helpers_capture_and_restore(monkeypatch) -> None:
     assert restored == [{"filter_query": "status:blocked"}]
 
 
-def test_view_filter_state_helpers_capture_and_restore_timeline(monkeypatch) -> None:
+def test_view_filter_state_helpers_capture_and_restore_timeline() -> None:
     app = ProjectDash()
     restored: list[dict[str, object] | None] = []
 
-    class _FakeTimelineView:
-        def capture_filter_state(self):
-            return {"visual_mode": "blocked", "selected_project_id": "p1"}
-
-        def restore_filter_state(self, state):
-            restored.append(state)
-
-    class _FakeSwitcher:
-        def __init__(self):
-            self.views = {"#timeline": _FakeTimelineView()}
-
-        def query_one(self, selector: str):
-            return self.views[selector]
-
-    switcher = _FakeSwitcher()
-    monkeypatch.setattr(app, "query_one", lambda cls: switcher)
+    fake_view = SimpleNamespace(
+        capture_filter_state=lambda: {"visual_mode": "blocked", "selected_project_id": "p1"},
+        restore_filter_state=restored.append,
+    )
+    switcher = SimpleNamespace(query_one={"#timeline": fake_view}.__getitem__)
+    app.query_one = lambda cls: switcher
 
     app._persist_view_filter_state("timeline")
     assert app._view_filter_state_by_view["timeline"] == {"visual_mode": "blocked", "selected_project_id": "p1"}
@@ -1484,7 +1339,7 @@ def test_view_filter_state_helpers_capture_and_restore_timeline(monkeypatch) ->
 def test_help_overlay_github_mentions_enter_and_escape_detail(monkeypatch) -> None:
     app = ProjectDash()
     monkeypatch.setattr(ProjectDash, "screen", property(lambda self: SimpleNamespace()))
-    monkeypatch.setattr(app, "_active_tab_label", lambda: "GitHub")
+    app._active_tab_label = lambda: "GitHub"
 
     help_text = app._help_overlay_text()
 
@@ -1495,7 +1350,7 @@ def test_help_overlay_github_mentions_enter_and_escape_detail(monkeypatch) -> No
 def test_help_overlay_workload_mentions_enter_and_escape_detail(monkeypatch) -> None:
     app = ProjectDash()
     monkeypatch.setattr(ProjectDash, "screen", property(lambda self: SimpleNamespace()))
-    monkeypatch.setattr(app, "_active_tab_label", lambda: "Workload")
+    app._active_tab_label = lambda: "Workload"
 
     help_text = app._help_overlay_text()
 
@@ -1506,7 +1361,7 @@ def test_help_overlay_workload_mentions_enter_and_escape_detail(monkeypatch) ->
 def test_help_overlay_mentions_filter_search_and_back(monkeypatch) -> None:
     app = ProjectDash()
     monkeypatch.setattr(ProjectDash, "screen", property(lambda self: SimpleNamespace()))
-    monkeypatch.setattr(app, "_active_tab_label", lambda: "Timeline")
+    app._active_tab_label = lambda: "Timeline"
 
     help_text = app._help_overlay_text()
 
@@ -17,68 +17,71 @@ def test_pd_dev_dispatches_to_dev_runner(monkeypatch) -> None:
     assert raised.value.code == 0
 
 
-@pytest.mark.asyncio
-async def test_sync_prints_success_summary_and_diagnostics(monkeypatch, capsys) -> None:
-    class FakeDataManager:
-        def __init__(self):
-            self.last_sync_result = "idle"
+class _FakeLinearSyncManager:
+    def __init__(self, result: str, summary: str, diagnostics: list[str]) -> None:
+        self.last_sync_result = "idle"
+        self._result = result
+        self._summary = summary
+        self._diagnostics = diagnostics
 
-        async def initialize(self):
-            return None
+    async def initialize(self):
+        return None
 
-        async def sync_with_linear(self):
-            self.last_sync_result = "success"
+    async def sync_with_linear(self):
+        self.last_sync_result = self._result
 
-        def sync_status_summary(self) -> str:
-            return "success u:1 p:1 i:2 t:1"
+    def sync_status_summary(self) -> str:
+        return self._summary
 
-        def sync_diagnostic_lines(self) -> list[str]:
-            return ["auth: ok: Tester", "issues: ok: 2"]
-
-    monkeypatch.setenv("LINEAR_API_KEY", "test-key")
-    monkeypatch.setattr(cli, "DataManager", FakeDataManager)
-
-    rc = await cli.sync()
-    out = capsys.readouterr().out
-
-    assert rc == 0
-    assert "✅ Sync complete. success u:1 p:1 i:2 t:1" in out
-    assert "connector scope: linear" in out
-    assert "failure category: none" in out
-    assert "   - auth: ok: Tester" in out
-    assert "   - issues: ok: 2" in out
+    def sync_diagnostic_lines(self) -> list[str]:
+        return self._diagnostics
 
 
 @pytest.mark.asyncio
-async def test_sync_prints_failure_summary_and_diagnostics(monkeypatch, capsys) -> None:
-    class FakeDataManager:
-        def __init__(self):
-            self.last_sync_result = "idle"
-
-        async def initialize(self):
-            return None
-
-        async def sync_with_linear(self):
-            self.last_sync_result = "failed"
-
-        def sync_status_summary(self) -> str:
-            return "failed: issues fetch failed: rate limit"
-
-        def sync_diagnostic_lines(self) -> list[str]:
-            return ["auth: ok: Tester", "issues: failed: rate limit"]
-
+@pytest.mark.parametrize(
+    ("result", "summary", "diagnostics", "expected_rc", "expected_lines"),
+    [
+        pytest.param(
+            "success",
+            "success u:1 p:1 i:2 t:1",
+            ["auth: ok: Tester", "issues: ok: 2"],
+            0,
+            [
+                "✅ Sync complete. success u:1 p:1 i:2 t:1",
+                "failure category: none",
+                "   - auth: ok: Tester",
+                "   - issues: ok: 2",
+            ],
+            id="success",
+        ),
+        pytest.param(
+            "failed",
+            "failed: issues fetch failed: rate limit",
+            ["auth: ok: Tester", "issues: failed: rate limit"],
+            1,
+            [
+                "❌ Sync failed. failed: issues fetch failed: rate limit",
+                "failure category: rate_limit",
+                "retry hint:",
+                "   - issues: failed: rate limit",
+            ],
+            id="failure",
+        ),
+    ],
+)
+async def test_sync_prints_summary_and_diagnostics(
+    monkeypatch, capsys, result, summary, diagnostics, expected_rc, expected_lines
+) -> None:
     monkeypatch.setenv("LINEAR_API_KEY", "test-key")
-    monkeypatch.setattr(cli, "DataManager", FakeDataManager)
+    monkeypatch.setattr(cli, "DataManager", lambda: _FakeLinearSyncManager(result, summary, diagnostics))
 
     rc = await cli.sync()
     out = capsys.readouterr().out
 
-    assert rc == 1
-    assert "❌ Sync failed. failed: issues fetch failed: rate limit" in out
+    assert rc == expected_rc
     assert "connector scope: linear" in out
-    assert "failure category: rate_limit" in out
-    assert "retry hint:" in out
-    assert "   - issues: failed: rate limit" in out
+    for line in expected_lines:
+        assert line in out
 
 
 @pytest.mark.asyncio
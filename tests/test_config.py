@@ -2,6 +2,8 @@ from pathlib import Path
 
 from projectdash.config import AppConfig
 
+_DEFAULT_CONFIG = AppConfig()
+
 
 def test_config_merge_file_json(tmp_path: Path) -> None:
     config_file = tmp_path / "projectdash.config.json"
@@ -26,7 +28,7 @@ def test_config_merge_file_json(tmp_path: Path) -> None:
         encoding="utf-8",
     )
 
-    merged = AppConfig().merge_file(config_file)
+    merged = _DEFAULT_CONFIG.merge_file(config_file)
     assert merged.kanban_statuses == ("Backlog", "In Progress", "Done")
     assert merged.linear_status_mappings == {"in progress": "state-2"}
     assert merged.sprint_overflow_column_label == "Unmapped"
@@ -47,7 +49,7 @@ def test_config_merge_file_invalid_json_falls_back(tmp_path: Path) -> None:
     config_file = tmp_path / "projectdash.config.json"
     config_file.write_text("{ this-is: bad json", encoding="utf-8")
 
-    defaults = AppConfig()
+    defaults = _DEFAULT_CONFIG
     merged = defaults.merge_file(config_file)
     assert merged == defaults
 
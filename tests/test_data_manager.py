@@ -1,4 +1,6 @@
 import pytest
+import pytest_asyncio
+from dataclasses import replace
 from datetime import datetime
 
 from projectdash.config import AppConfig
@@ -8,11 +10,71 @@ from projectdash.github import GitHubApiError
 from projectdash.linear import LinearApiError
 from projectdash.models import Issue, LinearWorkflowState, User
 
+# Shared across tests: AppConfig is frozen and nothing here mutates its dict fields.
+_CONFIG = AppConfig(seed_mock_data=False)
+_SEEDED_CONFIG = AppConfig(seed_mock_data=True)
+
+_ALICE = User("u1", "Alice")
+_ISSUE = Issue(
+    id="X-1",
+    linear_id="lin-1",
+    title="Task",
+    priority="Medium",
+    status="Todo",
+    state_id="state-1",
+    team_id="team-1",
+    assignee=_ALICE,
+    points=3,
+)
+_STATE_TODO = LinearWorkflowState(id="state-1", name="Todo", type="unstarted", team_id="team-1")
+_STATE_IN_PROGRESS = LinearWorkflowState(id="state-2", name="In Progress", type="started", team_id="team-1")
+
+
+class _NullDatabase:
+    """Database stand-in for tests that never read back what they persist."""
+
+    async def init_db(self) -> None:
+        return None
+
+    async def get_sync_cursor(self, provider: str) -> None:
+        return None
+
+    def __getattr__(self, name: str):
+        async def _noop(*args, **kwargs):
+            return [] if name.startswith("get_") else None
+
+        return _noop
+
+
+class _FailingHistoryDatabase(_NullDatabase):
+    async def append_sync_history(self, **kwargs) -> None:
+        raise OSError("disk full")
+
+
+@pytest_asyncio.fixture(scope="module")
+async def seeded_db():
+    dm = DataManager(config=_SEEDED_CONFIG)
+    dm.db = Database(":memory:")
+    await dm.initialize()
+    yield dm.db
+    dm.db.close()
+
+
+@pytest_asyncio.fixture
+async def seeded_manager(seeded_db: Database) -> DataManager:
+    # Schema and seed rows are built once per module; each test gets its own
+    # manager state loaded from that cache.
+    dm = DataManager(config=_SEEDED_CONFIG)
+    dm.db = seeded_db
+    await dm.load_from_cache()
+    return dm
+
 
 @pytest.mark.asyncio
 async def test_sync_state_when_api_key_missing(monkeypatch) -> None:
     monkeypatch.delenv("LINEAR_API_KEY", raising=False)
     dm = DataManager()
+    dm.db = _NullDatabase()
     await dm.sync_with_linear()
     assert dm.sync_in_progress is False
     assert dm.last_sync_result == "failed"
@@ -22,32 +84,15 @@ async def test_sync_state_when_api_key_missing(monkeypatch) -> None:
 
 
 @pytest.mark.asyncio
-async def test_load_from_cache_restores_workflow_states_for_status_updates(tmp_path, monkeypatch) -> None:
-    db_path = tmp_path / "projectdash-test.db"
-    db = Database(db_path)
-    await db.init_db()
-
-    user = User("u1", "Alice")
-    issue = Issue(
-        id="X-1",
-        linear_id="lin-1",
-        title="Task",
-        priority="Medium",
-        status="Todo",
-        state_id="state-1",
-        team_id="team-1",
-        assignee=user,
-        points=3,
-    )
-    state_todo = LinearWorkflowState(id="state-1", name="Todo", type="unstarted", team_id="team-1")
-    state_in_progress = LinearWorkflowState(id="state-2", name="In Progress", type="started", team_id="team-1")
-
-    await db.save_users([user])
-    await db.save_issues([issue])
-    await db.save_workflow_states([state_todo, state_in_progress])
-
-    dm = DataManager(config=AppConfig())
-    dm.db = Database(db_path)
+async def test_load_from_cache_restores_workflow_states_for_status_updates(monkeypatch, memory_db: Database) -> None:
+    await memory_db.init_db()
+
+    await memory_db.save_users([_ALICE])
+    await memory_db.save_issues([_ISSUE])
+    await memory_db.save_workflow_states([_STATE_TODO, _STATE_IN_PROGRESS])
+
+    dm = DataManager(config=_CONFIG)
+    dm.db = memory_db
     await dm.load_from_cache()
 
     async def remote_ok(issue_id: str, state_id: str):
@@ -64,10 +109,32 @@ async def test_load_from_cache_restores_workflow_states_for_status_updates(tmp_p
 
 
 @pytest.mark.asyncio
-async def test_initialize_does_not_seed_mock_data_by_default(tmp_path) -> None:
-    db_path = tmp_path / "projectdash-test.db"
-    dm = DataManager(config=AppConfig(seed_mock_data=False))
-    dm.db = Database(db_path)
+async def test_cycle_issue_status_wraps_to_first_cached_workflow_state(monkeypatch, memory_db: Database) -> None:
+    await memory_db.init_db()
+    await memory_db.save_users([_ALICE])
+    await memory_db.save_issues([replace(_ISSUE, status="In Progress", state_id="state-2")])
+    await memory_db.save_workflow_states([_STATE_TODO, _STATE_IN_PROGRESS])
+
+    dm = DataManager(config=_CONFIG)
+    dm.db = memory_db
+    await dm.load_from_cache()
+
+    async def remote_ok(issue_id: str, state_id: str):
+        assert state_id == "state-1"
+        return {"success": True}
+
+    monkeypatch.setattr(dm.linear, "update_issue_status", remote_ok)
+    ok, _ = await dm.cycle_issue_status("X-1", ("Todo", "In Progress"))
+
+    assert ok is True
+    assert dm.issues[0].status == "Todo"
+    assert dm.issues[0].state_id == "state-1"
+
+
+@pytest.mark.asyncio
+async def test_initialize_does_not_seed_mock_data_by_default() -> None:
+    dm = DataManager(config=_CONFIG)
+    dm.db = _NullDatabase()
 
     await dm.initialize()
 
@@ -76,40 +143,40 @@ async def test_initialize_does_not_seed_mock_data_by_default(tmp_path) -> None:
     assert dm.issues == []
 
 
-@pytest.mark.asyncio
-async def test_initialize_seeds_mock_data_when_enabled(tmp_path) -> None:
-    db_path = tmp_path / "projectdash-test.db"
-    dm = DataManager(config=AppConfig(seed_mock_data=True))
-    dm.db = Database(db_path)
+def test_initialize_seeds_mock_data_when_enabled(seeded_manager: DataManager) -> None:
+    assert len(seeded_manager.users) > 0
+    assert len(seeded_manager.projects) > 0
+    assert len(seeded_manager.issues) > 0
 
-    await dm.initialize()
 
-    assert len(dm.users) > 0
-    assert len(dm.projects) > 0
-    assert len(dm.issues) > 0
+def test_seeded_projects_keep_descriptions_after_cache_reload(seeded_manager: DataManager) -> None:
+    descriptions = {project.name: project.description for project in seeded_manager.projects}
 
+    assert descriptions["Acme Corp"] == "Customer onboarding delivery for enterprise accounts."
+    assert all(descriptions.values())
 
-@pytest.mark.asyncio
-async def test_sync_diagnostics_capture_failing_resource(monkeypatch) -> None:
-    monkeypatch.setenv("LINEAR_API_KEY", "test-key")
-    dm = DataManager(config=AppConfig(seed_mock_data=False))
 
-    async def fake_get_me():
-        return {"viewer": {"id": "u1", "name": "Tester", "email": "tester@example.com"}}
+def test_issue_lookups_reset_when_the_issue_list_is_replaced() -> None:
+    dm = DataManager(config=_CONFIG)
+    dm.issues = [_ISSUE]
+    assert dm.get_issue_by_id("X-1") is _ISSUE
+    assert dm.get_issue_by_linear_id("lin-1") is _ISSUE
 
-    async def fake_get_projects():
-        return []
+    other = replace(_ISSUE, id="X-2", linear_id="lin-2")
+    dm.issues = [other]
 
-    async def fake_get_team_workflow_states():
-        return []
+    assert dm.get_issue_by_id("X-1") is None
+    assert dm.get_issue_by_linear_id("lin-1") is None
+    assert dm.get_issue_by_id("X-2") is other
+    assert dm.get_issue_by_linear_id("lin-2") is other
 
-    async def fake_get_issues():
-        raise RuntimeError("rate limit")
 
-    monkeypatch.setattr(dm.linear, "get_me", fake_get_me)
-    monkeypatch.setattr(dm.linear, "get_projects", fake_get_projects)
-    monkeypatch.setattr(dm.linear, "get_team_workflow_states", fake_get_team_workflow_states)
-    monkeypatch.setattr(dm.linear, "get_issues", fake_get_issues)
+@pytest.mark.asyncio
+async def test_sync_diagnostics_capture_failing_resource(monkeypatch, patch_linear) -> None:
+    monkeypatch.setenv("LINEAR_API_KEY", "test-key")
+    dm = DataManager(config=_CONFIG)
+    dm.db = _NullDatabase()
+    patch_linear(dm, projects=(), states=(), issues=RuntimeError("rate limit"))
 
     await dm.sync_with_linear()
 
@@ -123,14 +190,11 @@ async def test_sync_diagnostics_capture_failing_resource(monkeypatch) -> None:
 
 
 @pytest.mark.asyncio
-async def test_linear_sync_normalizes_auth_failures(monkeypatch) -> None:
+async def test_linear_sync_normalizes_auth_failures(monkeypatch, patch_linear) -> None:
     monkeypatch.setenv("LINEAR_API_KEY", "test-key")
-    dm = DataManager(config=AppConfig(seed_mock_data=False))
-
-    async def fake_get_me():
-        raise LinearApiError("You don't have permission", code="FORBIDDEN")
-
-    monkeypatch.setattr(dm.linear, "get_me", fake_get_me)
+    dm = DataManager(config=_CONFIG)
+    dm.db = _NullDatabase()
+    patch_linear(dm, me=LinearApiError("You don't have permission", code="FORBIDDEN"))
 
     await dm.sync_with_linear()
 
@@ -140,11 +204,10 @@ async def test_linear_sync_normalizes_auth_failures(monkeypatch) -> None:
 
 
 @pytest.mark.asyncio
-async def test_github_sync_normalizes_auth_failures(tmp_path, monkeypatch) -> None:
-    db_path = tmp_path / "projectdash-github.db"
+async def test_github_sync_normalizes_auth_failures(monkeypatch) -> None:
     monkeypatch.setenv("GITHUB_TOKEN", "test-token")
     dm = DataManager(config=AppConfig(github_repositories=("acme/platform",), seed_mock_data=False))
-    dm.db = Database(db_path)
+    dm.db = _NullDatabase()
     await dm.initialize()
 
     async def fake_get_current_user():
@@ -159,24 +222,33 @@ async def test_github_sync_normalizes_auth_failures(tmp_path, monkeypatch) -> No
     assert dm.sync_diagnostics["github_auth"] == "failed: Requires authentication (status=401)"
 
 
-@pytest.mark.asyncio
-async def test_sync_history_is_capped_to_last_20_entries(tmp_path, monkeypatch) -> None:
-    db_path = tmp_path / "projectdash-test.db"
-    dm = DataManager(config=AppConfig(seed_mock_data=False))
-    dm.db = Database(db_path)
-    await dm.initialize()
-    monkeypatch.delenv("LINEAR_API_KEY", raising=False)
+def test_sync_history_is_capped_to_last_20_entries() -> None:
+    dm = DataManager(config=_CONFIG)
 
-    for _ in range(25):
-        await dm.sync_with_linear()
+    for index in range(25):
+        dm._append_sync_history_entry("failed", f"failed: attempt {index}", {"auth": "failed"})
 
     history = dm.get_sync_history()
     assert len(history) == 20
     assert all(entry["result"] == "failed" for entry in history)
+    assert history[0]["summary"] == "failed: attempt 24"
+    assert history[0]["diagnostics"] == {"auth": "failed"}
+
+
+@pytest.mark.asyncio
+async def test_record_sync_history_keeps_entry_in_memory_when_persist_fails() -> None:
+    dm = DataManager(config=_CONFIG)
+    dm.db = _FailingHistoryDatabase()
+    dm.last_sync_result = "failed"
+    dm.last_sync_error = "issues fetch failed: rate limit"
+
+    await dm._record_sync_history()
+
+    assert [entry["summary"] for entry in dm.get_sync_history()] == ["failed: issues fetch failed: rate limit"]
 
 
 def test_latest_sync_history_lines_formats_entries() -> None:
-    dm = DataManager(config=AppConfig(seed_mock_data=False))
+    dm = DataManager(config=_CONFIG)
     dm.sync_history = [
         {
             "created_at": "2026-02-23 01:00:00",
@@ -201,7 +273,7 @@ def test_latest_sync_history_lines_formats_entries() -> None:
 
 
 def test_connector_freshness_snapshot_marks_stale_by_threshold() -> None:
-    dm = DataManager(config=AppConfig(seed_mock_data=False))
+    dm = DataManager(config=_CONFIG)
     dm.sync_stale_minutes = 30
     dm._connector_freshness["linear"] = {
         "status": "success",
@@ -218,7 +290,7 @@ def test_connector_freshness_snapshot_marks_stale_by_threshold() -> None:
 
 
 def test_connector_freshness_snapshot_failure_includes_recovery_hint() -> None:
-    dm = DataManager(config=AppConfig(seed_mock_data=False))
+    dm = DataManager(config=_CONFIG)
     dm._connector_freshness["github"] = {
         "status": "failed",
         "last_success_at": None,
@@ -234,59 +306,14 @@ def test_connector_freshness_snapshot_failure_includes_recovery_hint() -> None:
     assert "FAILED" in summary
 
 
+@pytest.mark.slow
 @pytest.mark.asyncio
-async def test_linear_sync_checkpoints_are_stable_for_identical_upstream(tmp_path, monkeypatch) -> None:
-    db_path = tmp_path / "projectdash-linear.db"
+async def test_linear_sync_checkpoints_are_stable_for_identical_upstream(monkeypatch, patch_linear, memory_db: Database) -> None:
     monkeypatch.setenv("LINEAR_API_KEY", "test-key")
-    dm = DataManager(config=AppConfig(seed_mock_data=False))
-    dm.db = Database(db_path)
+    dm = DataManager(config=_CONFIG)
+    dm.db = memory_db
     await dm.initialize()
-
-    async def fake_get_me():
-        return {"viewer": {"id": "viewer-1", "name": "Tester", "email": "tester@example.com"}}
-
-    async def fake_get_projects():
-        return [
-            {
-                "id": "p1",
-                "name": "Project One",
-                "targetDate": "2026-03-01",
-                "state": "Active",
-                "startDate": "2026-02-01",
-                "description": "Alpha",
-            }
-        ]
-
-    async def fake_get_team_workflow_states():
-        return [
-            {
-                "id": "team-1",
-                "key": "ENG",
-                "name": "Engineering",
-                "states": {"nodes": [{"id": "state-1", "name": "Todo", "type": "unstarted"}]},
-            }
-        ]
-
-    async def fake_get_issues():
-        return [
-            {
-                "id": "lin-1",
-                "identifier": "PD-1",
-                "title": "First issue",
-                "priority": 2,
-                "state": {"id": "state-1", "name": "Todo", "type": "unstarted"},
-                "dueDate": "2026-03-02",
-                "project": {"id": "p1"},
-                "team": {"id": "team-1"},
-                "assignee": {"id": "u1", "name": "Alice", "avatarUrl": None},
-                "estimate": 3,
-            }
-        ]
-
-    monkeypatch.setattr(dm.linear, "get_me", fake_get_me)
-    monkeypatch.setattr(dm.linear, "get_projects", fake_get_projects)
-    monkeypatch.setattr(dm.linear, "get_team_workflow_states", fake_get_team_workflow_states)
-    monkeypatch.setattr(dm.linear, "get_issues", fake_get_issues)
+    patch_linear(dm)
 
     await dm.sync_with_linear()
     first_issues_cursor = await dm.get_sync_cursor("linear:issues")
@@ -302,97 +329,36 @@ async def test_linear_sync_checkpoints_are_stable_for_identical_upstream(tmp_pat
     assert first_projects_cursor == second_projects_cursor
 
 
+@pytest.mark.slow
 @pytest.mark.asyncio
-async def test_linear_partial_failure_preserves_cache_and_recovery_converges(tmp_path, monkeypatch) -> None:
-    db_path = tmp_path / "projectdash-linear.db"
+async def test_linear_partial_failure_preserves_cache_and_recovery_converges(monkeypatch, patch_linear, memory_db: Database) -> None:
     monkeypatch.setenv("LINEAR_API_KEY", "test-key")
-    dm = DataManager(config=AppConfig(seed_mock_data=False))
-    dm.db = Database(db_path)
+    dm = DataManager(config=_CONFIG)
+    dm.db = memory_db
     await dm.initialize()
+    second_issue = {
+        "id": "lin-2",
+        "identifier": "PD-2",
+        "title": "Second issue",
+        "priority": 3,
+        "state": {"id": "state-2", "name": "In Progress", "type": "started"},
+        "dueDate": "2026-03-03",
+        "project": {"id": "p1"},
+        "team": {"id": "team-1"},
+        "assignee": {"id": "u1", "name": "Alice", "avatarUrl": None},
+        "estimate": 2,
+    }
 
-    state = {"fail_issues": False, "new_payload": False}
-
-    async def fake_get_me():
-        return {"viewer": {"id": "viewer-1", "name": "Tester", "email": "tester@example.com"}}
-
-    async def fake_get_projects():
-        return [
-            {
-                "id": "p1",
-                "name": "Project One",
-                "targetDate": "2026-03-01",
-                "state": "Active",
-                "startDate": "2026-02-01",
-                "description": "Alpha",
-            }
-        ]
-
-    async def fake_get_team_workflow_states():
-        return [
-            {
-                "id": "team-1",
-                "key": "ENG",
-                "name": "Engineering",
-                "states": {
-                    "nodes": [
-                        {"id": "state-1", "name": "Todo", "type": "unstarted"},
-                        {"id": "state-2", "name": "In Progress", "type": "started"},
-                    ]
-                },
-            }
-        ]
-
-    async def fake_get_issues():
-        if state["fail_issues"]:
-            raise RuntimeError("rate limit")
-        rows = [
-            {
-                "id": "lin-1",
-                "identifier": "PD-1",
-                "title": "First issue",
-                "priority": 2,
-                "state": {"id": "state-1", "name": "Todo", "type": "unstarted"},
-                "dueDate": "2026-03-02",
-                "project": {"id": "p1"},
-                "team": {"id": "team-1"},
-                "assignee": {"id": "u1", "name": "Alice", "avatarUrl": None},
-                "estimate": 3,
-            }
-        ]
-        if state["new_payload"]:
-            rows.append(
-                {
-                    "id": "lin-2",
-                    "identifier": "PD-2",
-                    "title": "Second issue",
-                    "priority": 3,
-                    "state": {"id": "state-2", "name": "In Progress", "type": "started"},
-                    "dueDate": "2026-03-03",
-                    "project": {"id": "p1"},
-                    "team": {"id": "team-1"},
-                    "assignee": {"id": "u1", "name": "Alice", "avatarUrl": None},
-                    "estimate": 2,
-                }
-            )
-        return rows
-
-    monkeypatch.setattr(dm.linear, "get_me", fake_get_me)
-    monkeypatch.setattr(dm.linear, "get_projects", fake_get_projects)
-    monkeypatch.setattr(dm.linear, "get_team_workflow_states", fake_get_team_workflow_states)
-    monkeypatch.setattr(dm.linear, "get_issues", fake_get_issues)
-
-    await dm.sync_with_linear()
+    await patch_linear(dm).sync_with_linear()
     assert dm.last_sync_result == "success"
     assert len(dm.get_issues()) == 1
+    first_issues = dm.linear.get_issues.payload
 
-    state["new_payload"] = True
-    state["fail_issues"] = True
-    await dm.sync_with_linear()
+    await patch_linear(dm, issues=RuntimeError("rate limit")).sync_with_linear()
     assert dm.last_sync_result == "failed"
     assert "issues fetch failed" in (dm.last_sync_error or "")
     assert len(dm.get_issues()) == 1
 
-    state["fail_issues"] = False
-    await dm.sync_with_linear()
+    await patch_linear(dm, issues=(*first_issues, second_issue)).sync_with_linear()
     assert dm.last_sync_result == "success"
     assert len(dm.get_issues()) == 2
@@ -6,11 +6,10 @@ from projectdash.database import Database
 
 
 @pytest.mark.asyncio
-async def test_sync_with_github_fails_without_token(tmp_path, monkeypatch) -> None:
-    db_path = tmp_path / "projectdash-github.db"
+async def test_sync_with_github_fails_without_token(monkeypatch, memory_db: Database) -> None:
     monkeypatch.delenv("GITHUB_TOKEN", raising=False)
     dm = DataManager(config=AppConfig(github_repositories=("acme/platform",)))
-    dm.db = Database(db_path)
+    dm.db = memory_db
     await dm.initialize()
 
     await dm.sync_with_github()
@@ -21,8 +20,7 @@ async def test_sync_with_github_fails_without_token(tmp_path, monkeypatch) -> No
 
 
 @pytest.mark.asyncio
-async def test_sync_with_github_persists_repositories_prs_and_checks(tmp_path, monkeypatch) -> None:
-    db_path = tmp_path / "projectdash-github.db"
+async def test_sync_with_github_persists_repositories_prs_and_checks(monkeypatch, memory_db: Database) -> None:
     monkeypatch.setenv("GITHUB_TOKEN", "test-token")
     dm = DataManager(
         config=AppConfig(
@@ -32,7 +30,7 @@ async def test_sync_with_github_persists_repositories_prs_and_checks(tmp_path, m
             seed_mock_data=False,
         )
     )
-    dm.db = Database(db_path)
+    dm.db = memory_db
     await dm.initialize()
 
     async def fake_get_current_user():
@@ -116,12 +114,11 @@ async def test_sync_with_github_persists_repositories_prs_and_checks(tmp_path, m
 
 
 @pytest.mark.asyncio
-async def test_sync_with_github_discovers_repository_targets_when_unconfigured(tmp_path, monkeypatch) -> None:
-    db_path = tmp_path / "projectdash-github.db"
+async def test_sync_with_github_discovers_repository_targets_when_unconfigured(monkeypatch, memory_db: Database) -> None:
     monkeypatch.setenv("GITHUB_TOKEN", "test-token")
     monkeypatch.delenv("PD_GITHUB_REPOS", raising=False)
     dm = DataManager(config=AppConfig(github_repositories=()))
-    dm.db = Database(db_path)
+    dm.db = memory_db
     await dm.initialize()
 
     async def fake_get_current_user():
@@ -162,8 +159,7 @@ async def test_sync_with_github_discovers_repository_targets_when_unconfigured(t
 
 
 @pytest.mark.asyncio
-async def test_github_sync_checkpoints_are_stable_for_identical_upstream(tmp_path, monkeypatch) -> None:
-    db_path = tmp_path / "projectdash-github.db"
+async def test_github_sync_checkpoints_are_stable_for_identical_upstream(monkeypatch, memory_db: Database) -> None:
     monkeypatch.setenv("GITHUB_TOKEN", "test-token")
     dm = DataManager(
         config=AppConfig(
@@ -172,7 +168,7 @@ async def test_github_sync_checkpoints_are_stable_for_identical_upstream(tmp_pat
             seed_mock_data=False,
         )
     )
-    dm.db = Database(db_path)
+    dm.db = memory_db
     await dm.initialize()
 
     async def fake_get_current_user():
@@ -241,8 +237,7 @@ async def test_github_sync_checkpoints_are_stable_for_identical_upstream(tmp_pat
 
 
 @pytest.mark.asyncio
-async def test_github_sync_checkpoints_progress_when_upstream_changes(tmp_path, monkeypatch) -> None:
-    db_path = tmp_path / "projectdash-github.db"
+async def test_github_sync_checkpoints_progress_when_upstream_changes(monkeypatch, memory_db: Database) -> None:
     monkeypatch.setenv("GITHUB_TOKEN", "test-token")
     dm = DataManager(
         config=AppConfig(
@@ -251,7 +246,7 @@ async def test_github_sync_checkpoints_progress_when_upstream_changes(tmp_path,
             seed_mock_data=False,
         )
     )
-    dm.db = Database(db_path)
+    dm.db = memory_db
     await dm.initialize()
 
     payload_state = {"updated_at": "2026-02-23T00:00:00Z"}
@@ -323,8 +318,7 @@ async def test_github_sync_checkpoints_progress_when_upstream_changes(tmp_path,
 
 
 @pytest.mark.asyncio
-async def test_github_conflict_policy_keeps_newer_pull_request_snapshot(tmp_path, monkeypatch) -> None:
-    db_path = tmp_path / "projectdash-github.db"
+async def test_github_conflict_policy_keeps_newer_pull_request_snapshot(monkeypatch, memory_db: Database) -> None:
     monkeypatch.setenv("GITHUB_TOKEN", "test-token")
     dm = DataManager(
         config=AppConfig(
@@ -333,7 +327,7 @@ async def test_github_conflict_policy_keeps_newer_pull_request_snapshot(tmp_path
             seed_mock_data=False,
         )
     )
-    dm.db = Database(db_path)
+    dm.db = memory_db
     await dm.initialize()
 
     sync_state = {"old_payload": False}
@@ -393,8 +387,7 @@ async def test_github_conflict_policy_keeps_newer_pull_request_snapshot(tmp_path
 
 
 @pytest.mark.asyncio
-async def test_github_partial_failure_preserves_cache_and_recovery_converges(tmp_path, monkeypatch) -> None:
-    db_path = tmp_path / "projectdash-github.db"
+async def test_github_partial_failure_preserves_cache_and_recovery_converges(monkeypatch, memory_db: Database) -> None:
     monkeypatch.setenv("GITHUB_TOKEN", "test-token")
     dm = DataManager(
         config=AppConfig(
@@ -403,7 +396,7 @@ async def test_github_partial_failure_preserves_cache_and_recovery_converges(tmp
             seed_mock_data=False,
         )
     )
-    dm.db = Database(db_path)
+    dm.db = memory_db
     await dm.initialize()
 
     state = {"fail_second_repo": False}
@@ -1,74 +1,71 @@
+import aiosqlite
 import pytest
+import pytest_asyncio
 
 from projectdash.config import AppConfig
 from projectdash.data import DataManager
 from projectdash.database import Database
-
-
+from projectdash.models import Issue, LinearWorkflowState, User
+
+_CONFIG = AppConfig(seed_mock_data=False)
+_ALICE = User("u1", "Alice")
+_ISSUE = Issue(
+    id="PD-1",
+    linear_id="lin-1",
+    title="First issue",
+    priority="Medium",
+    status="Todo",
+    state_id="state-1",
+    team_id="team-1",
+    assignee=_ALICE,
+    points=3,
+)
+_STATE_TODO = LinearWorkflowState(id="state-1", name="Todo", type="unstarted", team_id="team-1")
+_STATE_IN_PROGRESS = LinearWorkflowState(id="state-2", name="In Progress", type="started", team_id="team-1")
+
+
+async def _fake_update_issue_status(issue_id: str, state_id: str):
+    assert issue_id == "lin-1"
+    assert state_id == "state-2"
+    return {"success": True}
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_db(tmp_path_factory):
+    db = Database(tmp_path_factory.mktemp("integration") / "projectdash-integration.db")
+    await db.init_db()
+    yield db
+    db.close()
+
+
+@pytest_asyncio.fixture
+async def integration_db(shared_db: Database):
+    # Every Database call opens its own connection, so a per-test SAVEPOINT
+    # cannot span the test body; wipe rows afterwards and keep the schema.
+    yield shared_db
+    async with aiosqlite.connect(shared_db.db_path) as db:
+        async with db.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+        ) as cursor:
+            tables = [row[0] for row in await cursor.fetchall()]
+        for table in tables:
+            await db.execute(f"DELETE FROM {table}")
+        await db.commit()
+
+
+@pytest.mark.slow
 @pytest.mark.asyncio
-async def test_sync_persists_cache_and_restart_loads_all_entities(tmp_path, monkeypatch) -> None:
-    db_path = tmp_path / "projectdash-integration.db"
+async def test_sync_persists_cache_and_restart_loads_all_entities(integration_db, monkeypatch, patch_linear) -> None:
     monkeypatch.setenv("LINEAR_API_KEY", "test-key")
 
-    dm = DataManager(config=AppConfig(seed_mock_data=False))
-    dm.db = Database(db_path)
+    dm = DataManager(config=_CONFIG)
+    dm.db = integration_db
     await dm.initialize()
+    await patch_linear(dm).sync_with_linear()
 
-    async def fake_get_me():
-        return {"viewer": {"id": "viewer-1", "name": "Tester", "email": "tester@example.com"}}
-
-    async def fake_get_projects():
-        return [
-            {
-                "id": "p1",
-                "name": "Project One",
-                "description": "Customer onboarding workflow improvements.",
-                "startDate": "2026-01-20",
-                "targetDate": "2026-03-01",
-                "state": "Active",
-            }
-        ]
-
-    async def fake_get_team_workflow_states():
-        return [
-            {
-                "id": "team-1",
-                "key": "ENG",
-                "name": "Engineering",
-                "states": {
-                    "nodes": [
-                        {"id": "state-1", "name": "Todo", "type": "unstarted"},
-                        {"id": "state-2", "name": "In Progress", "type": "started"},
-                    ]
-                },
-            }
-        ]
-
-    async def fake_get_issues():
-        return [
-            {
-                "id": "lin-1",
-                "identifier": "PD-1",
-                "title": "First issue",
-                "priority": 2,
-                "state": {"id": "state-1", "name": "Todo", "type": "unstarted"},
-                "dueDate": "2026-03-02",
-                "project": {"id": "p1"},
-                "team": {"id": "team-1"},
-                "assignee": {"id": "u1", "name": "Alice", "avatarUrl": None},
-                "estimate": 3,
-            }
-        ]
-
-    monkeypatch.setattr(dm.linear, "get_me", fake_get_me)
-    monkeypatch.setattr(dm.linear, "get_projects", fake_get_projects)
-    monkeypatch.setattr(dm.linear, "get_team_workflow_states", fake_get_team_workflow_states)
-    monkeypatch.setattr(dm.linear, "get_issues", fake_get_issues)
-
-    await dm.sync_with_linear()
-
-    restarted = DataManager(config=AppConfig(seed_mock_data=False))
-    restarted.db = Database(db_path)
+    # A fresh Database on the same file stands in for a process restart.
+    restarted = DataManager(config=_CONFIG)
+    restarted.db = Database(integration_db.db_path)
     await restarted.load_from_cache()
 
     assert restarted.last_sync_result == "idle"
@@ -82,69 +79,23 @@ async def test_sync_persists_cache_and_restart_loads_all_entities(tmp_path, monk
     assert restarted.issues[0].id == "PD-1"
     assert restarted.issues[0].linear_id == "lin-1"
 
+    restarted.linear.update_issue_status = _fake_update_issue_status
+    ok, _message = await restarted.cycle_issue_status("PD-1", ("Todo", "In Progress"))
+    assert ok is True
+    assert restarted.issues[0].state_id == "state-2"
+
 
 @pytest.mark.asyncio
-async def test_restart_can_cycle_status_using_cached_workflow_states(tmp_path, monkeypatch) -> None:
-    db_path = tmp_path / "projectdash-integration.db"
-    monkeypatch.setenv("LINEAR_API_KEY", "test-key")
-
-    dm = DataManager(config=AppConfig(seed_mock_data=False))
-    dm.db = Database(db_path)
-    await dm.initialize()
+async def test_restart_can_cycle_status_using_cached_workflow_states(integration_db) -> None:
+    await integration_db.save_users([_ALICE])
+    await integration_db.save_issues([_ISSUE])
+    await integration_db.save_workflow_states([_STATE_TODO, _STATE_IN_PROGRESS])
 
-    async def fake_get_me():
-        return {"viewer": {"id": "viewer-1", "name": "Tester", "email": "tester@example.com"}}
-
-    async def fake_get_projects():
-        return [{"id": "p1", "name": "Project One", "targetDate": "2026-03-01", "state": "Active"}]
-
-    async def fake_get_team_workflow_states():
-        return [
-            {
-                "id": "team-1",
-                "key": "ENG",
-                "name": "Engineering",
-                "states": {
-                    "nodes": [
-                        {"id": "state-1", "name": "Todo", "type": "unstarted"},
-                        {"id": "state-2", "name": "In Progress", "type": "started"},
-                    ]
-                },
-            }
-        ]
-
-    async def fake_get_issues():
-        return [
-            {
-                "id": "lin-1",
-                "identifier": "PD-1",
-                "title": "First issue",
-                "priority": 2,
-                "state": {"id": "state-1", "name": "Todo", "type": "unstarted"},
-                "dueDate": "2026-03-02",
-                "project": {"id": "p1"},
-                "team": {"id": "team-1"},
-                "assignee": {"id": "u1", "name": "Alice", "avatarUrl": None},
-                "estimate": 3,
-            }
-        ]
-
-    monkeypatch.setattr(dm.linear, "get_me", fake_get_me)
-    monkeypatch.setattr(dm.linear, "get_projects", fake_get_projects)
-    monkeypatch.setattr(dm.linear, "get_team_workflow_states", fake_get_team_workflow_states)
-    monkeypatch.setattr(dm.linear, "get_issues", fake_get_issues)
-    await dm.sync_with_linear()
-
-    restarted = DataManager(config=AppConfig(seed_mock_data=False))
-    restarted.db = Database(db_path)
+    restarted = DataManager(config=_CONFIG)
+    restarted.db = Database(integration_db.db_path)
     await restarted.load_from_cache()
 
-    async def fake_update_issue_status(issue_id: str, state_id: str):
-        assert issue_id == "lin-1"
-        assert state_id == "state-2"
-        return {"success": True}
-
-    monkeypatch.setattr(restarted.linear, "update_issue_status", fake_update_issue_status)
+    restarted.linear.update_issue_status = _fake_update_issue_status
     ok, message = await restarted.cycle_issue_status("PD-1", ("Todo", "In Progress"))
 
     assert ok is True
@@ -153,38 +104,18 @@ async def test_restart_can_cycle_status_using_cached_workflow_states(tmp_path, m
     assert restarted.issues[0].state_id == "state-2"
 
 
+@pytest.mark.slow
 @pytest.mark.asyncio
-async def test_sync_history_persists_across_restart(tmp_path, monkeypatch) -> None:
-    db_path = tmp_path / "projectdash-integration.db"
+async def test_sync_history_persists_across_restart(integration_db, monkeypatch, patch_linear) -> None:
     monkeypatch.setenv("LINEAR_API_KEY", "test-key")
 
-    dm = DataManager(config=AppConfig(seed_mock_data=False))
-    dm.db = Database(db_path)
+    dm = DataManager(config=_CONFIG)
+    dm.db = integration_db
     await dm.initialize()
+    empty_team = [{"id": "team-1", "key": "ENG", "name": "Engineering", "states": {"nodes": []}}]
 
-    async def fake_get_me():
-        return {"viewer": {"id": "viewer-1", "name": "Tester", "email": "tester@example.com"}}
-
-    async def fake_get_projects():
-        return [{"id": "p1", "name": "Project One", "targetDate": "2026-03-01", "state": "Active"}]
-
-    async def fake_get_team_workflow_states():
-        return [{"id": "team-1", "key": "ENG", "name": "Engineering", "states": {"nodes": []}}]
-
-    async def fake_get_issues_ok():
-        return []
-
-    async def fake_get_issues_fail():
-        raise RuntimeError("rate limit")
-
-    monkeypatch.setattr(dm.linear, "get_me", fake_get_me)
-    monkeypatch.setattr(dm.linear, "get_projects", fake_get_projects)
-    monkeypatch.setattr(dm.linear, "get_team_workflow_states", fake_get_team_workflow_states)
-    monkeypatch.setattr(dm.linear, "get_issues", fake_get_issues_ok)
-    await dm.sync_with_linear()
-
-    monkeypatch.setattr(dm.linear, "get_issues", fake_get_issues_fail)
-    await dm.sync_with_linear()
+    await patch_linear(dm, states=empty_team, issues=[]).sync_with_linear()
+    await patch_linear(dm, states=empty_team, issues=RuntimeError("rate limit")).sync_with_linear()
 
     history = dm.get_sync_history()
     assert len(history) == 2
@@ -192,8 +123,8 @@ async def test_sync_history_persists_across_restart(tmp_path, monkeypatch) -> No
     assert "issues fetch failed: rate limit" in history[0]["summary"]
     assert history[1]["result"] == "success"
 
-    restarted = DataManager(config=AppConfig(seed_mock_data=False))
-    restarted.db = Database(db_path)
+    restarted = DataManager(config=_CONFIG)
+    restarted.db = Database(integration_db.db_path)
     await restarted.load_from_cache()
     restarted_history = restarted.get_sync_history()
     assert len(restarted_history) == 2
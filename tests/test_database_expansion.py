@@ -30,23 +30,89 @@ async def test_init_db_creates_expansion_tables(tmp_path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_sync_cursor_round_trip(tmp_path) -> None:
+async def test_init_db_recreates_schema_when_cached_file_was_removed(tmp_path) -> None:
     db_path = tmp_path / "projectdash-expansion.db"
+    await Database(db_path).init_db()
+    db_path.unlink()
+
     db = Database(db_path)
     await db.init_db()
-
-    assert await db.get_sync_cursor("github") is None
     await db.save_sync_cursor("github", "cursor-1")
+
     assert await db.get_sync_cursor("github") == "cursor-1"
-    await db.save_sync_cursor("github", "cursor-2")
-    assert await db.get_sync_cursor("github") == "cursor-2"
 
 
 @pytest.mark.asyncio
-async def test_agent_runs_round_trip(tmp_path) -> None:
-    db_path = tmp_path / "projectdash-expansion.db"
-    db = Database(db_path)
-    await db.init_db()
+async def test_sync_cursor_round_trip(memory_db: Database) -> None:
+    await memory_db.init_db()
+
+    assert await memory_db.get_sync_cursor("github") is None
+    await memory_db.save_sync_cursor("github", "cursor-1")
+    assert await memory_db.get_sync_cursor("github") == "cursor-1"
+    await memory_db.save_sync_cursor("github", "cursor-2")
+    assert await memory_db.get_sync_cursor("github") == "cursor-2"
+
+
+@pytest.mark.asyncio
+async def test_memory_databases_are_isolated_per_instance() -> None:
+    first = Database(":memory:")
+    second = Database(":memory:")
+    await first.init_db()
+    await second.init_db()
+
+    await first.save_sync_cursor("github", "cursor-1")
+
+    assert await first.get_sync_cursor("github") == "cursor-1"
+    assert await second.get_sync_cursor("github") is None
+    first.close()
+    second.close()
+
+
+@pytest.mark.asyncio
+async def test_append_sync_history_trims_persisted_rows_to_newest(memory_db: Database) -> None:
+    await memory_db.init_db()
+
+    for index in range(25):
+        await memory_db.append_sync_history(
+            created_at=f"2026-02-23 00:00:{index:02d}",
+            result="failed",
+            summary=f"failed: attempt {index}",
+            diagnostics={"auth": "failed"},
+            max_entries=20,
+        )
+    history = await memory_db.get_sync_history(limit=50)
+
+    assert [entry["summary"] for entry in history] == [f"failed: attempt {index}" for index in range(24, 4, -1)]
+
+
+@pytest.mark.asyncio
+async def test_get_sync_history_returns_plain_rows(memory_db: Database) -> None:
+    await memory_db.init_db()
+    await memory_db.append_sync_history(
+        created_at="2026-02-23 00:00:00",
+        result="failed",
+        summary="failed: auth",
+        diagnostics={"linear_auth": "failed: unauthorized", "github_auth": "ok"},
+    )
+    history = await memory_db.get_sync_history()
+
+    reloaded = history[0]
+    assert set(reloaded) == {"id", "created_at", "result", "summary", "diagnostics"}
+    assert reloaded["diagnostics"] == {"github_auth": "ok", "linear_auth": "failed: unauthorized"}
+
+
+def test_close_releases_memory_anchor_and_is_idempotent() -> None:
+    db = Database(":memory:")
+
+    db.close()
+    db.close()
+
+    assert db._memory_anchor is None
+
+
+@pytest.mark.asyncio
+async def test_agent_runs_round_trip(memory_db: Database) -> None:
+    await memory_db.init_db()
 
     run = AgentRun(
         id="run-1",
@@ -57,9 +123,9 @@ async def test_agent_runs_round_trip(tmp_path) -> None:
         project_id="p1",
         artifacts={"log": "session.log"},
     )
-    await db.save_agent_run(run)
-    saved = await db.get_agent_runs(limit=10)
-    fetched = await db.get_agent_run("run-1")
+    await memory_db.save_agent_run(run)
+    saved = await memory_db.get_agent_runs(limit=10)
+    fetched = await memory_db.get_agent_run("run-1")
 
     assert len(saved) == 1
     assert saved[0].id == "run-1"
@@ -71,10 +137,8 @@ async def test_agent_runs_round_trip(tmp_path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_repository_pr_and_check_round_trip(tmp_path) -> None:
-    db_path = tmp_path / "projectdash-expansion.db"
-    db = Database(db_path)
-    await db.init_db()
+async def test_repository_pr_and_check_round_trip(memory_db: Database) -> None:
+    await memory_db.init_db()
 
     repository = Repository(
         id="github:acme/platform",
@@ -107,13 +171,13 @@ async def test_repository_pr_and_check_round_trip(tmp_path) -> None:
         updated_at="2026-02-20 10:03:00",
     )
 
-    await db.save_repositories([repository])
-    await db.save_pull_requests([pull_request])
-    await db.save_ci_checks([check])
+    await memory_db.save_repositories([repository])
+    await memory_db.save_pull_requests([pull_request])
+    await memory_db.save_ci_checks([check])
 
-    repositories = await db.get_repositories(provider="github")
-    pull_requests = await db.get_pull_requests(issue_id="PD-9")
-    checks = await db.get_ci_checks(pull_request_id=pull_request.id)
+    repositories = await memory_db.get_repositories(provider="github")
+    pull_requests = await memory_db.get_pull_requests(issue_id="PD-9")
+    checks = await memory_db.get_ci_checks(pull_request_id=pull_request.id)
 
     assert len(repositories) == 1
     assert repositories[0].name == "platform"
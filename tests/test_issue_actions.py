@@ -1,3 +1,5 @@
+from types import SimpleNamespace
+
 import pytest
 
 from projectdash.config import AppConfig
@@ -5,46 +7,101 @@ from projectdash.data import DataManager
 from projectdash.linear import LinearApiError
 from projectdash.models import Issue, LinearWorkflowState, User
 
+# Every test here awaits a DataManager mutation; they share the session loop
+# configured in pyproject.toml.
+pytestmark = pytest.mark.asyncio
+
+_DEFAULT_CONFIG = AppConfig()
+_REMOTE_ISSUE = {
+    "id": "lin-1",
+    "identifier": "X-1",
+    "title": "New",
+    "priority": 2,
+    "state": {"id": "st-1", "name": "In Progress", "type": "started"},
+    "dueDate": None,
+    "project": {"id": "p1"},
+    "team": {"id": "t1"},
+    "assignee": {"id": "u1", "name": "Alice", "avatarUrl": None},
+    "estimate": 3,
+}
+
+
+def _returning(value=None):
+    """Async stand-in that ignores its arguments and returns ``value``."""
+
+    async def _call(*_args, **_kwargs):
+        return value
+
+    return _call
+
+
+def _raising(error: Exception):
+    """Async stand-in that ignores its arguments and raises ``error``."""
 
-@pytest.mark.asyncio
-async def test_cycle_issue_status_success_write_through(monkeypatch) -> None:
-    dm = DataManager(config=AppConfig())
-    dm.users = [User("u1", "Alice")]
-    dm.workflow_states_by_team = {
-        "team-1": [LinearWorkflowState(id="state-2", name="In Progress", type="started", team_id="team-1")]
-    }
-    dm.issues = [Issue("X-1", "Task", "Medium", "Todo", dm.users[0], 3, team_id="team-1", linear_id="lin-1")]
+    async def _call(*_args, **_kwargs):
+        raise error
 
-    async def save_ok(_issues, project_id=None):
-        return None
+    return _call
+
+
+@pytest.fixture
+def make_dm():
+    """Build a DataManager over cached state with stub Linear and database backends.
+
+    Only the Linear methods passed in exist on the stub client, so an
+    unexpected remote call can never reach the network.
+    """
+
+    def _make(
+        *,
+        users: list[User],
+        issues: list[Issue],
+        workflow_states: dict[str, list[LinearWorkflowState]] | None = None,
+        config: AppConfig | None = None,
+        linear_api_key: str | None = None,
+        **linear_methods,
+    ) -> DataManager:
+        dm = DataManager(config=config or _DEFAULT_CONFIG)
+        dm.users = users
+        dm.issues = issues
+        if workflow_states is not None:
+            dm.workflow_states_by_team = workflow_states
+        dm.db = SimpleNamespace(save_issues=_returning(), save_users=_returning())
+        dm.linear = SimpleNamespace(api_key=linear_api_key, **linear_methods)
+        return dm
+
+    return _make
+
+
+async def test_cycle_issue_status_success_write_through(make_dm) -> None:
+    alice = User("u1", "Alice")
 
     async def remote_ok(issue_id: str, state_id: str):
         assert issue_id == "lin-1"
         assert state_id == "state-2"
         return {"success": True}
 
-    monkeypatch.setattr(dm.linear, "update_issue_status", remote_ok)
-    monkeypatch.setattr(dm.db, "save_issues", save_ok)
+    dm = make_dm(
+        users=[alice],
+        issues=[Issue("X-1", "Task", "Medium", "Todo", alice, 3, team_id="team-1", linear_id="lin-1")],
+        workflow_states={
+            "team-1": [LinearWorkflowState(id="state-2", name="In Progress", type="started", team_id="team-1")]
+        },
+        update_issue_status=remote_ok,
+    )
     ok, message = await dm.cycle_issue_status("X-1", ("Todo", "In Progress", "Done"))
     assert ok is True
     assert dm.issues[0].status == "In Progress"
     assert "moved to In Progress" in message
 
 
-@pytest.mark.asyncio
-async def test_cycle_issue_points_rolls_back_on_remote_failure(monkeypatch) -> None:
-    dm = DataManager(config=AppConfig())
-    dm.users = [User("u1", "Alice")]
-    dm.issues = [Issue("X-1", "Task", "Medium", "Todo", dm.users[0], 5, linear_id="lin-1")]
-
-    async def remote_fail(_issue_id: str, _estimate: int):
-        raise LinearApiError("Issue is archived", code="FORBIDDEN")
-
-    async def save_ok(_issues, project_id=None):
-        return None
-
-    monkeypatch.setattr(dm.linear, "update_issue_estimate", remote_fail)
-    monkeypatch.setattr(dm.db, "save_issues", save_ok)
+async def test_cycle_issue_points_rolls_back_on_remote_failure(make_dm) -> None:
+    alice = User("u1", "Alice")
+    dm = make_dm(
+        users=[alice],
+        issues=[Issue("X-1", "Task", "Medium", "Todo", alice, 5, linear_id="lin-1")],
+        update_issue_estimate=_raising(LinearApiError("Issue is archived", code="FORBIDDEN")),
+    )
     ok, message = await dm.cycle_issue_points("X-1")
     assert ok is False
     assert "Estimate update failed" in message
@@ -52,41 +109,25 @@ async def test_cycle_issue_points_rolls_back_on_remote_failure(monkeypatch) -> N
     assert dm.issues[0].points == 5
 
 
-@pytest.mark.asyncio
-async def test_cycle_issue_status_uses_configured_linear_mapping(monkeypatch) -> None:
-    dm = DataManager(config=AppConfig(linear_status_mappings={"in progress": "state-2"}))
-    dm.users = [User("u1", "Alice")]
-    dm.workflow_states_by_team = {
-        "team-1": [LinearWorkflowState(id="state-2", name="Started", type="started", team_id="team-1")]
-    }
-    dm.issues = [Issue("X-1", "Task", "Medium", "Todo", dm.users[0], 3, team_id="team-1", linear_id="lin-1")]
-
-    async def save_ok(_issues, project_id=None):
-        return None
-
-    async def remote_ok(_issue_id: str, _state_id: str):
-        return {"success": True}
-
-    monkeypatch.setattr(dm.linear, "update_issue_status", remote_ok)
-    monkeypatch.setattr(dm.db, "save_issues", save_ok)
+async def test_cycle_issue_status_uses_configured_linear_mapping(make_dm) -> None:
+    alice = User("u1", "Alice")
+    dm = make_dm(
+        users=[alice],
+        issues=[Issue("X-1", "Task", "Medium", "Todo", alice, 3, team_id="team-1", linear_id="lin-1")],
+        workflow_states={
+            "team-1": [LinearWorkflowState(id="state-2", name="Started", type="started", team_id="team-1")]
+        },
+        config=AppConfig(linear_status_mappings={"in progress": "state-2"}),
+        update_issue_status=_returning({"success": True}),
+    )
     ok, message = await dm.cycle_issue_status("X-1", ("Todo", "In Progress", "Done"))
     assert ok is True
     assert "warning:" not in message
     assert dm.issues[0].state_id == "state-2"
 
 
-@pytest.mark.asyncio
-async def test_cycle_issue_status_fails_when_mapping_missing(monkeypatch) -> None:
-    dm = DataManager(config=AppConfig())
-    dm.users = [User("u1", "Alice")]
-    dm.workflow_states_by_team = {
-        "team-1": [LinearWorkflowState(id="state-3", name="Started", type="started", team_id="team-1")]
-    }
-    dm.issues = [Issue("X-1", "Task", "Medium", "Todo", dm.users[0], 3, team_id="team-1", linear_id="lin-1")]
-
-    async def save_ok(_issues, project_id=None):
-        return None
-
+async def test_cycle_issue_status_fails_when_mapping_missing(make_dm) -> None:
+    alice = User("u1", "Alice")
     called_remote = False
 
     async def remote_should_not_run(_issue_id: str, _state_id: str):
@@ -94,8 +135,14 @@ async def test_cycle_issue_status_fails_when_mapping_missing(monkeypatch) -> Non
         called_remote = True
         return {"success": True}
 
-    monkeypatch.setattr(dm.linear, "update_issue_status", remote_should_not_run)
-    monkeypatch.setattr(dm.db, "save_issues", save_ok)
+    dm = make_dm(
+        users=[alice],
+        issues=[Issue("X-1", "Task", "Medium", "Todo", alice, 3, team_id="team-1", linear_id="lin-1")],
+        workflow_states={
+            "team-1": [LinearWorkflowState(id="state-3", name="Started", type="started", team_id="team-1")]
+        },
+        update_issue_status=remote_should_not_run,
+    )
     ok, message = await dm.cycle_issue_status("X-1", ("Todo", "In Progress", "Done"))
     assert ok is False
     assert "no mapping for status" in message
@@ -103,196 +150,93 @@ async def test_cycle_issue_status_fails_when_mapping_missing(monkeypatch) -> Non
     assert dm.issues[0].state_id is None
 
 
-@pytest.mark.asyncio
-async def test_cycle_issue_assignee_rolls_back_on_permission_error(monkeypatch) -> None:
-    dm = DataManager(config=AppConfig())
-    dm.users = [User("u1", "Alice"), User("u2", "Bob")]
-    dm.issues = [Issue("X-1", "Task", "Medium", "Todo", dm.users[0], 2, linear_id="lin-1")]
-
-    async def remote_fail(_issue_id, _assignee_id):
-        raise LinearApiError("You don't have permission", code="FORBIDDEN")
-
-    async def save_ok(_issues, project_id=None):
-        return None
-
-    monkeypatch.setattr(dm.linear, "update_issue_assignee", remote_fail)
-    monkeypatch.setattr(dm.db, "save_issues", save_ok)
+async def test_cycle_issue_assignee_rolls_back_on_permission_error(make_dm) -> None:
+    alice = User("u1", "Alice")
+    dm = make_dm(
+        users=[alice, User("u2", "Bob")],
+        issues=[Issue("X-1", "Task", "Medium", "Todo", alice, 2, linear_id="lin-1")],
+        update_issue_assignee=_raising(LinearApiError("You don't have permission", code="FORBIDDEN")),
+    )
     ok, message = await dm.cycle_issue_assignee("X-1")
     assert ok is False
     assert "permission denied" in message.casefold()
     assert dm.issues[0].assignee is dm.users[0]
 
 
-@pytest.mark.asyncio
-async def test_cycle_issue_points_reconciles_with_targeted_refetch(monkeypatch) -> None:
-    dm = DataManager(config=AppConfig())
-    dm.linear.api_key = "test-key"
-    dm.users = [User("u1", "Alice")]
-    dm.issues = [Issue("X-1", "Task", "Medium", "Todo", dm.users[0], 5, linear_id="lin-1")]
-
-    async def remote_fail(_issue_id: str, _estimate: int):
-        raise LinearApiError("stale issue", code="CONFLICT")
-
-    async def get_issue_ok(_issue_id: str):
-        return {
-            "id": "lin-1",
-            "identifier": "X-1",
-            "title": "Task (Remote)",
-            "priority": 2,
-            "state": {"id": "st-1", "name": "In Progress", "type": "started"},
-            "dueDate": None,
-            "project": {"id": "p1"},
-            "team": {"id": "t1"},
-            "assignee": {"id": "u1", "name": "Alice", "avatarUrl": None},
-            "estimate": 8,
-        }
-
-    async def save_issues_ok(_issues, project_id=None):
-        return None
-
-    async def save_users_ok(_users):
-        return None
-
-    monkeypatch.setattr(dm.linear, "update_issue_estimate", remote_fail)
-    monkeypatch.setattr(dm.linear, "get_issue", get_issue_ok)
-    monkeypatch.setattr(dm.db, "save_issues", save_issues_ok)
-    monkeypatch.setattr(dm.db, "save_users", save_users_ok)
-
-    ok, message = await dm.cycle_issue_points("X-1")
-    assert ok is False
-    assert "re-fetched latest issue" in message
-    assert dm.issues[0].title == "Task (Remote)"
-    assert dm.issues[0].points == 8
-
-
-@pytest.mark.asyncio
-async def test_cycle_issue_points_reconciles_with_full_sync_fallback(monkeypatch) -> None:
-    dm = DataManager(config=AppConfig())
-    dm.linear.api_key = "test-key"
-    dm.users = [User("u1", "Alice")]
-    dm.issues = [Issue("X-1", "Task", "Medium", "Todo", dm.users[0], 5, linear_id="lin-1")]
-
-    async def remote_fail(_issue_id: str, _estimate: int):
-        raise LinearApiError("stale issue", code="CONFLICT")
-
-    async def get_issue_missing(_issue_id: str):
-        return None
-
-    async def sync_ok():
-        dm.last_sync_result = "success"
-        return None
-
-    async def save_issues_ok(_issues, project_id=None):
-        return None
-
-    monkeypatch.setattr(dm.linear, "update_issue_estimate", remote_fail)
-    monkeypatch.setattr(dm.linear, "get_issue", get_issue_missing)
-    monkeypatch.setattr(dm, "sync_with_linear", sync_ok)
-    monkeypatch.setattr(dm.db, "save_issues", save_issues_ok)
-
-    ok, message = await dm.cycle_issue_points("X-1")
-    assert ok is False
-    assert "triggered full re-sync" in message
-    assert dm.issues[0].points == 5
-
-
-@pytest.mark.asyncio
-async def test_cycle_issue_points_remote_failure_without_reconcile_suffix(monkeypatch) -> None:
-    dm = DataManager(config=AppConfig())
-    dm.linear.api_key = "test-key"
-    dm.users = [User("u1", "Alice")]
-    dm.issues = [Issue("X-1", "Task", "Medium", "Todo", dm.users[0], 5, linear_id="lin-1")]
-
-    async def remote_fail(_issue_id: str, _estimate: int):
-        raise LinearApiError("stale issue", code="CONFLICT")
-
-    async def get_issue_fails(_issue_id: str):
-        raise RuntimeError("network")
-
-    async def sync_fails():
-        raise RuntimeError("network")
+_RECONCILE_SUFFIXES = ("re-fetched latest issue", "triggered full re-sync")
+
+
+@pytest.mark.parametrize(
+    ("get_issue", "sync_outcome", "expected_suffix", "expected_issue"),
+    [
+        (_returning({**_REMOTE_ISSUE, "title": "Task (Remote)", "estimate": 8}), "success", "re-fetched latest issue", ("Task (Remote)", 8)),
+        (_returning(None), "success", "triggered full re-sync", ("Task", 5)),
+        (_raising(RuntimeError("network")), RuntimeError("network"), None, ("Task", 5)),
+    ],
+    ids=["targeted-refetch", "full-sync-fallback", "no-reconcile-suffix"],
+)
+async def test_cycle_issue_points_reconciles_after_stale_remote_failure(
+    make_dm, get_issue, sync_outcome, expected_suffix, expected_issue
+) -> None:
+    alice = User("u1", "Alice")
+    dm = make_dm(
+        users=[alice],
+        issues=[Issue("X-1", "Task", "Medium", "Todo", alice, 5, linear_id="lin-1")],
+        update_issue_estimate=_raising(LinearApiError("stale issue", code="CONFLICT")),
+        get_issue=get_issue,
+        linear_api_key="test-key",
+    )
 
-    async def save_issues_ok(_issues, project_id=None):
-        return None
+    async def fake_sync():
+        if isinstance(sync_outcome, Exception):
+            raise sync_outcome
+        dm.last_sync_result = sync_outcome
 
-    monkeypatch.setattr(dm.linear, "update_issue_estimate", remote_fail)
-    monkeypatch.setattr(dm.linear, "get_issue", get_issue_fails)
-    monkeypatch.setattr(dm, "sync_with_linear", sync_fails)
-    monkeypatch.setattr(dm.db, "save_issues", save_issues_ok)
+    dm.sync_with_linear = fake_sync
 
     ok, message = await dm.cycle_issue_points("X-1")
     assert ok is False
     assert "stale issue data" in message
-    assert "re-fetched latest issue" not in message
-    assert "triggered full re-sync" not in message
-    assert dm.issues[0].points == 5
+    for suffix in _RECONCILE_SUFFIXES:
+        assert (suffix in message) is (suffix == expected_suffix)
+    assert (dm.issues[0].title, dm.issues[0].points) == expected_issue
 
 
-@pytest.mark.asyncio
-async def test_apply_remote_issue_replaces_existing_by_linear_id(monkeypatch) -> None:
-    dm = DataManager(config=AppConfig())
-    dm.users = [User("u1", "Alice")]
-    dm.issues = [Issue("X-OLD", "Old", "Low", "Todo", dm.users[0], 1, linear_id="lin-1")]
-
-    async def save_issues_ok(_issues, project_id=None):
-        return None
-
-    async def save_users_ok(_users):
-        return None
-
-    monkeypatch.setattr(dm.db, "save_issues", save_issues_ok)
-    monkeypatch.setattr(dm.db, "save_users", save_users_ok)
-
-    await dm._apply_remote_issue(
-        {
-            "id": "lin-1",
-            "identifier": "X-1",
-            "title": "New",
-            "priority": 2,
-            "state": {"id": "st-1", "name": "In Progress", "type": "started"},
-            "dueDate": None,
-            "project": {"id": "p1"},
-            "team": {"id": "t1"},
-            "assignee": {"id": "u1", "name": "Alice", "avatarUrl": None},
-            "estimate": 3,
-        }
-    )
+async def test_apply_remote_issue_replaces_existing_by_linear_id(make_dm) -> None:
+    alice = User("u1", "Alice")
+    dm = make_dm(users=[alice], issues=[Issue("X-OLD", "Old", "Low", "Todo", alice, 1, linear_id="lin-1")])
+    assert dm.get_issue_by_id("X-OLD") is not None
+
+    await dm._apply_remote_issue(dict(_REMOTE_ISSUE))
 
     assert len(dm.issues) == 1
     assert dm.issues[0].id == "X-1"
     assert dm.issues[0].title == "New"
+    assert dm.get_issue_by_id("X-OLD") is None
+    assert dm.get_issue_by_id("X-1") is dm.issues[0]
 
 
-@pytest.mark.asyncio
-async def test_apply_remote_issue_replaces_existing_by_identifier(monkeypatch) -> None:
-    dm = DataManager(config=AppConfig())
-    dm.users = [User("u1", "Alice")]
-    dm.issues = [Issue("X-1", "Old", "Low", "Todo", dm.users[0], 1, linear_id=None)]
-
-    async def save_issues_ok(_issues, project_id=None):
-        return None
-
-    async def save_users_ok(_users):
-        return None
-
-    monkeypatch.setattr(dm.db, "save_issues", save_issues_ok)
-    monkeypatch.setattr(dm.db, "save_users", save_users_ok)
-
-    await dm._apply_remote_issue(
-        {
-            "id": "lin-1",
-            "identifier": "X-1",
-            "title": "Updated",
-            "priority": 2,
-            "state": {"id": "st-1", "name": "In Progress", "type": "started"},
-            "dueDate": None,
-            "project": {"id": "p1"},
-            "team": {"id": "t1"},
-            "assignee": {"id": "u1", "name": "Alice", "avatarUrl": None},
-            "estimate": 5,
-        }
-    )
+async def test_apply_remote_issue_replaces_existing_by_identifier(make_dm) -> None:
+    alice = User("u1", "Alice")
+    dm = make_dm(users=[alice], issues=[Issue("X-1", "Old", "Low", "Todo", alice, 1, linear_id=None)])
+
+    await dm._apply_remote_issue({**_REMOTE_ISSUE, "title": "Updated", "estimate": 5})
 
     assert len(dm.issues) == 1
     assert dm.issues[0].id == "X-1"
     assert dm.issues[0].title == "Updated"
+    assert dm.get_issue_by_linear_id("lin-1") is dm.issues[0]
+
+
+async def test_apply_remote_issue_appends_unknown_issue_and_indexes_it(make_dm) -> None:
+    alice = User("u1", "Alice")
+    existing = Issue("X-0", "Existing", "Low", "Todo", alice, 1, linear_id="lin-0")
+    dm = make_dm(users=[alice], issues=[existing])
+    assert dm.get_issue_by_id("X-0") is existing
+
+    await dm._apply_remote_issue(dict(_REMOTE_ISSUE))
+
+    assert [issue.id for issue in dm.issues] == ["X-0", "X-1"]
+    assert dm.get_issue_by_id("X-1") is dm.issues[1]
+    assert dm.get_issue_by_linear_id("lin-1") is dm.issues[1]
+    assert dm.get_issue_by_linear_id("lin-0") is existing
@@ -30,26 +30,29 @@ class _FakeCustomizableView:
         return True, "removed"
 
 
-def test_layout_actions_require_edit_mode(monkeypatch) -> None:
+def _app_with_view(view: _FakeCustomizableView, published: list[tuple[bool, str]]) -> ProjectDash:
+    # Plain instance assignment: the app is discarded after each test, so there
+    # is nothing for monkeypatch to undo.
     app = ProjectDash()
+    app._active_customizable_view = lambda: view
+    app._publish_action_result = lambda ok, msg: published.append((ok, msg))
+    return app
+
+
+def test_layout_actions_require_edit_mode() -> None:
     view = _FakeCustomizableView()
     published: list[tuple[bool, str]] = []
-
-    monkeypatch.setattr(app, "_active_customizable_view", lambda: view)
-    monkeypatch.setattr(app, "_publish_action_result", lambda ok, msg: published.append((ok, msg)))
+    app = _app_with_view(view, published)
 
     app.action_layout_move_left()
 
     assert published == [(False, "Enable layout edit mode first (Ctrl+E)")]
 
 
-def test_toggle_layout_edit_dispatches(monkeypatch) -> None:
-    app = ProjectDash()
+def test_toggle_layout_edit_dispatches() -> None:
     view = _FakeCustomizableView()
     published: list[tuple[bool, str]] = []
-
-    monkeypatch.setattr(app, "_active_customizable_view", lambda: view)
-    monkeypatch.setattr(app, "_publish_action_result", lambda ok, msg: published.append((ok, msg)))
+    app = _app_with_view(view, published)
 
     app.action_toggle_layout_edit()
     app.action_layout_move_right()
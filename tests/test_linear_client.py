@@ -2,115 +2,81 @@ import pytest
 
 from projectdash.linear import LinearClient
 
-
-@pytest.mark.asyncio
-async def test_get_projects_paginates(monkeypatch) -> None:
-    client = LinearClient(api_key="test-key")
-    calls: list[dict] = []
-
-    async def fake_query(_query: str, variables: dict | None = None) -> dict:
-        assert variables is not None
-        calls.append(variables)
-        if len(calls) == 1:
-            return {
-                "projects": {
-                    "nodes": [{"id": "p1", "name": "One", "targetDate": None, "state": "started"}],
-                    "pageInfo": {"hasNextPage": True, "endCursor": "cur-1"},
-                }
-            }
-        return {
-            "projects": {
-                "nodes": [{"id": "p2", "name": "Two", "targetDate": None, "state": "started"}],
-                "pageInfo": {"hasNextPage": False, "endCursor": None},
-            }
+_PROJECT_PAGES = (
+    [{"id": "p1", "name": "One", "targetDate": None, "state": "started"}],
+    [{"id": "p2", "name": "Two", "targetDate": None, "state": "started"}],
+)
+_ISSUE_PAGES = (
+    [
+        {
+            "id": "i1",
+            "identifier": "PD-1",
+            "title": "First",
+            "priority": 1,
+            "state": {"id": "s1", "name": "Todo", "type": "unstarted"},
+            "dueDate": None,
+            "project": {"id": "p1"},
+            "team": {"id": "t1"},
+            "assignee": None,
+            "estimate": 2,
         }
-
-    monkeypatch.setattr(client, "_query", fake_query)
-    projects = await client.get_projects()
-
-    assert [p["id"] for p in projects] == ["p1", "p2"]
-    assert calls == [{"first": 100, "after": None}, {"first": 100, "after": "cur-1"}]
-
-
-@pytest.mark.asyncio
-async def test_get_issues_paginates(monkeypatch) -> None:
-    client = LinearClient(api_key="test-key")
-    calls: list[dict] = []
-
-    async def fake_query(_query: str, variables: dict | None = None) -> dict:
-        assert variables is not None
-        calls.append(variables)
-        if len(calls) == 1:
-            return {
-                "issues": {
-                    "nodes": [
-                        {
-                            "id": "i1",
-                            "identifier": "PD-1",
-                            "title": "First",
-                            "priority": 1,
-                            "state": {"id": "s1", "name": "Todo", "type": "unstarted"},
-                            "dueDate": None,
-                            "project": {"id": "p1"},
-                            "team": {"id": "t1"},
-                            "assignee": None,
-                            "estimate": 2,
-                        }
-                    ],
-                    "pageInfo": {"hasNextPage": True, "endCursor": "cur-1"},
-                }
-            }
-        return {
-            "issues": {
-                "nodes": [
-                    {
-                        "id": "i2",
-                        "identifier": "PD-2",
-                        "title": "Second",
-                        "priority": 2,
-                        "state": {"id": "s2", "name": "In Progress", "type": "started"},
-                        "dueDate": None,
-                        "project": {"id": "p1"},
-                        "team": {"id": "t1"},
-                        "assignee": None,
-                        "estimate": 3,
-                    }
-                ],
-                "pageInfo": {"hasNextPage": False, "endCursor": None},
-            }
+    ],
+    [
+        {
+            "id": "i2",
+            "identifier": "PD-2",
+            "title": "Second",
+            "priority": 2,
+            "state": {"id": "s2", "name": "In Progress", "type": "started"},
+            "dueDate": None,
+            "project": {"id": "p1"},
+            "team": {"id": "t1"},
+            "assignee": None,
+            "estimate": 3,
         }
+    ],
+)
+_TEAM_PAGES = (
+    [{"id": "t1", "key": "ENG", "name": "Eng", "states": {"nodes": []}}],
+    [{"id": "t2", "key": "OPS", "name": "Ops", "states": {"nodes": []}}],
+)
 
-    monkeypatch.setattr(client, "_query", fake_query)
-    issues = await client.get_issues()
 
-    assert [i["id"] for i in issues] == ["i1", "i2"]
-    assert calls == [{"first": 100, "after": None}, {"first": 100, "after": "cur-1"}]
+@pytest.fixture(scope="module")
+def client() -> LinearClient:
+    # Shared across tests; each test patches _query through monkeypatch so the
+    # real method is restored afterwards.
+    return LinearClient(api_key="test-key")
 
 
 @pytest.mark.asyncio
-async def test_get_team_workflow_states_paginates(monkeypatch) -> None:
-    client = LinearClient(api_key="test-key")
+@pytest.mark.parametrize(
+    ("method", "root", "pages", "expected_ids"),
+    [
+        ("get_projects", "projects", _PROJECT_PAGES, ["p1", "p2"]),
+        ("get_issues", "issues", _ISSUE_PAGES, ["i1", "i2"]),
+        ("get_team_workflow_states", "teams", _TEAM_PAGES, ["t1", "t2"]),
+    ],
+    ids=["projects", "issues", "teams"],
+)
+async def test_fetch_paginates(
+    client: LinearClient, monkeypatch, method: str, root: str, pages: tuple, expected_ids: list[str]
+) -> None:
     calls: list[dict] = []
 
     async def fake_query(_query: str, variables: dict | None = None) -> dict:
         assert variables is not None
         calls.append(variables)
-        if len(calls) == 1:
-            return {
-                "teams": {
-                    "nodes": [{"id": "t1", "key": "ENG", "name": "Eng", "states": {"nodes": []}}],
-                    "pageInfo": {"hasNextPage": True, "endCursor": "cur-1"},
-                }
-            }
+        has_next = len(calls) == 1
         return {
-            "teams": {
-                "nodes": [{"id": "t2", "key": "OPS", "name": "Ops", "states": {"nodes": []}}],
-                "pageInfo": {"hasNextPage": False, "endCursor": None},
+            root: {
+                "nodes": pages[len(calls) - 1],
+                "pageInfo": {"hasNextPage": has_next, "endCursor": "cur-1" if has_next else None},
             }
         }
 
     monkeypatch.setattr(client, "_query", fake_query)
-    teams = await client.get_team_workflow_states()
+    rows = await getattr(client, method)()
 
-    assert [t["id"] for t in teams] == ["t1", "t2"]
+    assert [row["id"] for row in rows] == expected_ids
     assert calls == [{"first": 100, "after": None}, {"first": 100, "after": "cur-1"}]
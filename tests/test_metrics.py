@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+import pytest
+
 from projectdash.config import AppConfig
 from projectdash.models import CiCheck, Issue, Project, PullRequest, User
 from projectdash.services.metrics import MetricsService
@@ -91,29 +93,33 @@ def _sample_data() -> DummyData:
     return DummyData(users=users, projects=projects, issues=issues, pull_requests=pull_requests, ci_checks=ci_checks)
 
 
-def test_sprint_board_adds_overflow_column() -> None:
-    data = _sample_data()
+@pytest.fixture(scope="module")
+def sample_data() -> DummyData:
+    # MetricsService only reads from the data source, so one graph serves every test.
+    return _sample_data()
+
+
+def test_sprint_board_adds_overflow_column(sample_data: DummyData) -> None:
     config = AppConfig(
         kanban_statuses=("Todo", "In Progress", "Done"),
         sprint_overflow_column_label="Other",
     )
-    metrics = MetricsService(config).sprint_board(data)
+    metrics = MetricsService(config).sprint_board(sample_data)
     assert [column.status for column in metrics.columns] == ["Todo", "In Progress", "Done", "Other"]
     assert [issue.id for issue in metrics.columns[-1].issues] == ["B-1"]
 
 
-def test_dashboard_and_workload_metrics_are_data_driven() -> None:
-    data = _sample_data()
+def test_dashboard_and_workload_metrics_are_data_driven(sample_data: DummyData) -> None:
     config = AppConfig(default_user_capacity_points=10)
     service = MetricsService(config)
 
-    dashboard = service.dashboard(data)
+    dashboard = service.dashboard(sample_data)
     assert dashboard.projects_total == 2
     assert dashboard.issues_total == 4
     assert dashboard.velocity_points == 2
     assert dashboard.blocked_total == 1
 
-    workload = service.workload(data)
+    workload = service.workload(sample_data)
     assert len(workload.members) == 2
     assert workload.team.total_points == 10
     assert workload.team.total_capacity == 20
@@ -121,42 +127,39 @@ def test_dashboard_and_workload_metrics_are_data_driven() -> None:
     assert workload.team.active_issues == 1
 
 
-def test_workload_active_issues_uses_configured_active_statuses() -> None:
-    data = _sample_data()
+def test_workload_active_issues_uses_configured_active_statuses(sample_data: DummyData) -> None:
     config = AppConfig(default_user_capacity_points=10, active_statuses=("Todo", "Blocked"))
     service = MetricsService(config)
 
-    workload = service.workload(data)
+    workload = service.workload(sample_data)
 
     # Todo + Blocked should count as active for this custom configuration.
     assert workload.team.active_issues == 2
 
 
-def test_metrics_support_project_scope_filtering() -> None:
-    data = _sample_data()
+def test_metrics_support_project_scope_filtering(sample_data: DummyData) -> None:
     config = AppConfig(kanban_statuses=("Todo", "In Progress", "Done"))
     service = MetricsService(config)
 
-    dashboard = service.dashboard(data, project_id="p1")
+    dashboard = service.dashboard(sample_data, project_id="p1")
     assert dashboard.projects_total == 1
     assert dashboard.issues_total == 3
     assert [card.project_id for card in dashboard.project_cards] == ["p1"]
 
-    sprint = service.sprint_board(data, project_id="p1")
+    sprint = service.sprint_board(sample_data, project_id="p1")
     assert [len(column.issues) for column in sprint.columns] == [1, 1, 1]
     assert [column.status for column in sprint.columns] == ["Todo", "In Progress", "Done"]
 
-    timeline = service.timeline(data, project_id="p1")
+    timeline = service.timeline(sample_data, project_id="p1")
     assert len(timeline.project_lines) == 1
     assert timeline.project_lines[0].project_id == "p1"
 
-    workload = service.workload(data, project_id="p1")
+    workload = service.workload(sample_data, project_id="p1")
     assert workload.team.total_points == 10
     assert workload.team.active_issues == 1
 
 
-def test_sprint_risk_metrics_count_and_thresholds() -> None:
-    data = _sample_data()
+def test_sprint_risk_metrics_count_and_thresholds(sample_data: DummyData) -> None:
     config = AppConfig(
         default_user_capacity_points=10,
         sprint_risk_blocked_threshold=1,
@@ -168,7 +171,7 @@ def test_sprint_risk_metrics_count_and_thresholds() -> None:
     )
     service = MetricsService(config)
 
-    sprint = service.sprint_board(data)
+    sprint = service.sprint_board(sample_data)
 
     assert sprint.risk.blocked_issues == 1
     assert sprint.risk.failing_prs == 1
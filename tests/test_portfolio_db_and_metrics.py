@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 
+import aiosqlite
 import pytest
 
 from projectdash.config import AppConfig
@@ -10,6 +11,8 @@ from projectdash.database import Database
 from projectdash.models import LocalProject
 from projectdash.services.metrics import MetricsService
 
+_CONFIG = AppConfig()
+
 
 # --- Database round-trip tests ---
 
@@ -18,7 +21,6 @@ from projectdash.services.metrics import MetricsService
 async def test_local_projects_table_created(tmp_path):
     db = Database(tmp_path / "test.db")
     await db.init_db()
-    import aiosqlite
 
     async with aiosqlite.connect(tmp_path / "test.db") as conn:
         async with conn.execute(
@@ -156,16 +158,14 @@ def _make_project(**overrides):
 
 
 def test_portfolio_empty():
-    config = AppConfig()
-    metrics = MetricsService(config)
+    metrics = MetricsService(_CONFIG)
     result = metrics.portfolio(DummyData())
     assert result.total == 0
     assert result.rows == []
 
 
 def test_portfolio_basic_list():
-    config = AppConfig()
-    metrics = MetricsService(config)
+    metrics = MetricsService(_CONFIG)
     projects = [
         _make_project(id="local:a", name="a", tier="A"),
         _make_project(id="local:b", name="b", tier="B"),
@@ -177,8 +177,7 @@ def test_portfolio_basic_list():
 
 
 def test_portfolio_status_filter():
-    config = AppConfig()
-    metrics = MetricsService(config)
+    metrics = MetricsService(_CONFIG)
     projects = [
         _make_project(id="local:a", name="a", status="active"),
         _make_project(id="local:b", name="b", status="paused"),
@@ -189,8 +188,7 @@ def test_portfolio_status_filter():
 
 
 def test_portfolio_ideas_filter():
-    config = AppConfig()
-    metrics = MetricsService(config)
+    metrics = MetricsService(_CONFIG)
     projects = [
         _make_project(id="local:a", name="a", status="idea"),
         _make_project(id="local:b", name="b", status="exploration"),
@@ -201,8 +199,7 @@ def test_portfolio_ideas_filter():
 
 
 def test_portfolio_tier_filter():
-    config = AppConfig()
-    metrics = MetricsService(config)
+    metrics = MetricsService(_CONFIG)
     projects = [
         _make_project(id="local:a", name="a", tier="S"),
         _make_project(id="local:b", name="b", tier="C"),
@@ -213,8 +210,7 @@ def test_portfolio_tier_filter():
 
 
 def test_portfolio_sort_by_name():
-    config = AppConfig()
-    metrics = MetricsService(config)
+    metrics = MetricsService(_CONFIG)
     projects = [
         _make_project(id="local:z", name="zebra", tier="A"),
         _make_project(id="local:a", name="alpha", tier="A"),
@@ -225,8 +221,7 @@ def test_portfolio_sort_by_name():
 
 
 def test_portfolio_divergence_stale_flagship():
-    config = AppConfig()
-    metrics = MetricsService(config)
+    metrics = MetricsService(_CONFIG)
     old = (datetime.now(timezone.utc) - timedelta(days=45)).isoformat()
     projects = [
         _make_project(id="local:a", name="a", tier="S", last_commit_at=old),
@@ -238,8 +233,7 @@ def test_portfolio_divergence_stale_flagship():
 
 
 def test_portfolio_divergence_overactive_low_tier():
-    config = AppConfig()
-    metrics = MetricsService(config)
+    metrics = MetricsService(_CONFIG)
     recent = (datetime.now(timezone.utc) - timedelta(days=2)).isoformat()
     projects = [
         _make_project(id="local:a", name="a", tier="D", last_commit_at=recent),
@@ -249,8 +243,7 @@ def test_portfolio_divergence_overactive_low_tier():
 
 
 def test_portfolio_divergence_unproven_flagship():
-    config = AppConfig()
-    metrics = MetricsService(config)
+    metrics = MetricsService(_CONFIG)
     recent = (datetime.now(timezone.utc) - timedelta(days=2)).isoformat()
     projects = [
         _make_project(id="local:a", name="a", tier="S", last_commit_at=recent),
@@ -260,8 +253,7 @@ def test_portfolio_divergence_unproven_flagship():
 
 
 def test_portfolio_no_divergence():
-    config = AppConfig()
-    metrics = MetricsService(config)
+    metrics = MetricsService(_CONFIG)
     recent = (datetime.now(timezone.utc) - timedelta(days=2)).isoformat()
     projects = [
         _make_project(
@@ -280,8 +272,7 @@ def test_portfolio_no_divergence():
 
 
 def test_portfolio_relative_time_labels():
-    config = AppConfig()
-    metrics = MetricsService(config)
+    metrics = MetricsService(_CONFIG)
     now = datetime.now(timezone.utc)
     projects = [
         _make_project(id="local:a", name="a", last_commit_at=(now - timedelta(hours=2)).isoformat()),
@@ -8,38 +8,32 @@ from rich.text import Text
 
 from projectdash.models import Issue, User
 from projectdash.services.metrics import SprintColumnMetric, SprintRiskMetric
-from projectdash.views.sprint_board import SprintBoardView
-
-
-def _issue(
-    issue_id: str,
-    title: str,
-    assignee: User | None = None,
-    *,
-    status: str = "Todo",
-    priority: str = "Medium",
-    project_id: str | None = None,
-) -> Issue:
-    return Issue(
-        id=issue_id,
-        title=title,
-        priority=priority,
-        status=status,
-        assignee=assignee,
-        points=3,
-        project_id=project_id,
-    )
+from projectdash.views.sprint_board import SprintBoardView, SprintFilterSpec
 
+_ALICE = User("u1", "Alice")
+_BOB = User("u2", "Bob")
+_ISSUE_DEFAULTS = {"priority": "Medium", "status": "Todo", "points": 3}
 
-def test_move_cursor_wraps_across_columns(monkeypatch) -> None:
-    view = SprintBoardView()
-    alice = User("u1", "Alice")
-    bob = User("u2", "Bob")
-    view.column_metrics = [
-        SprintColumnMetric(status="Todo", issues=[_issue("T-1", "One", alice)]),
-        SprintColumnMetric(status="Done", issues=[_issue("D-1", "Two", bob)]),
-    ]
-    monkeypatch.setattr(view, "refresh_view", lambda: None)
+
+def _issue(issue_id: str, title: str, assignee: User | None = None, **overrides) -> Issue:
+    return Issue(id=issue_id, title=title, assignee=assignee, **{**_ISSUE_DEFAULTS, **overrides})
+
+
+def _columns(*spec: tuple[str, list[Issue]]) -> list[SprintColumnMetric]:
+    return [SprintColumnMetric(status=status, issues=issues) for status, issues in spec]
+
+
+@pytest.fixture
+def board() -> SprintBoardView:
+    return SprintBoardView(refresh_view=lambda: None)
+
+
+def test_move_cursor_wraps_across_columns(board: SprintBoardView) -> None:
+    view = board
+    view.column_metrics = _columns(
+        ("Todo", [_issue("T-1", "One", _ALICE)]),
+        ("Done", [_issue("D-1", "Two", _BOB)]),
+    )
 
     view.cursor_col = 0
     view.move_cursor(col_delta=-1)
@@ -53,64 +47,36 @@ def test_move_cursor_wraps_across_columns(monkeypatch) -> None:
 
 def test_filter_columns_matches_id_title_and_assignee() -> None:
     view = SprintBoardView()
-    alice = User("u1", "Alice")
-    todo = SprintColumnMetric(
-        status="Todo",
-        issues=[_issue("PD-1", "Fix login bug", alice), _issue("PD-2", "Docs cleanup")],
+    columns = _columns(
+        ("Todo", [_issue("PD-1", "Fix login bug", _ALICE), _issue("PD-2", "Docs cleanup")]),
+        ("Done", [_issue("PD-3", "Release checklist")]),
     )
-    done = SprintColumnMetric(status="Done", issues=[_issue("PD-3", "Release checklist")])
 
-    by_id = view._filter_columns([todo, done], "pd-3")
+    by_id = view._filter_columns(columns, "pd-3")
     assert [issue.id for issue in by_id[1].issues] == ["PD-3"]
 
-    by_title = view._filter_columns([todo, done], "login")
+    by_title = view._filter_columns(columns, "login")
     assert [issue.id for issue in by_title[0].issues] == ["PD-1"]
 
-    by_assignee = view._filter_columns([todo, done], "alice")
+    by_assignee = view._filter_columns(columns, "alice")
     assert [issue.id for issue in by_assignee[0].issues] == ["PD-1"]
 
 
 def test_filter_columns_supports_keyed_status_priority_assignee() -> None:
     view = SprintBoardView()
-    alice = User("u1", "Alice")
-    bob = User("u2", "Bob")
-    todo = SprintColumnMetric(
-        status="Todo",
-        issues=[
-            _issue(
-                "PD-10",
-                "Ship release",
-                alice,
-                status="In Progress",
-                priority="High",
-                project_id="p1",
-            ),
-            _issue(
-                "PD-11",
-                "QA pass",
-                bob,
-                status="Review",
-                priority="High",
-                project_id="p1",
-            ),
-        ],
-    )
-    done = SprintColumnMetric(
-        status="Done",
-        issues=[
-            _issue(
-                "PD-12",
-                "Publish changelog",
-                alice,
-                status="Done",
-                priority="Medium",
-                project_id="p2",
-            ),
-        ],
+    columns = _columns(
+        (
+            "Todo",
+            [
+                _issue("PD-10", "Ship release", _ALICE, status="In Progress", priority="High", project_id="p1"),
+                _issue("PD-11", "QA pass", _BOB, status="Review", priority="High", project_id="p1"),
+            ],
+        ),
+        ("Done", [_issue("PD-12", "Publish changelog", _ALICE, status="Done", priority="Medium", project_id="p2")]),
     )
 
     filtered = view._filter_columns(
-        [todo, done],
+        columns,
         'status:"in progress" priority:high assignee:alice',
     )
 
@@ -120,31 +86,43 @@ def test_filter_columns_supports_keyed_status_priority_assignee() -> None:
 
 def test_filter_columns_supports_mixed_text_and_keyed_terms() -> None:
     view = SprintBoardView()
-    alice = User("u1", "Alice")
-    todo = SprintColumnMetric(
-        status="Todo",
-        issues=[
-            _issue("PD-20", "Fix login guard", alice, status="Todo", priority="High"),
-            _issue("PD-21", "Fix login docs", alice, status="Done", priority="High"),
-            _issue("PD-22", "Refactor auth", alice, status="Todo", priority="Low"),
-        ],
+    columns = _columns(
+        (
+            "Todo",
+            [
+                _issue("PD-20", "Fix login guard", _ALICE, status="Todo", priority="High"),
+                _issue("PD-21", "Fix login docs", _ALICE, status="Done", priority="High"),
+                _issue("PD-22", "Refactor auth", _ALICE, status="Todo", priority="Low"),
+            ],
+        ),
     )
 
-    filtered = view._filter_columns([todo], "fix status:todo priority:high")
+    filtered = view._filter_columns(columns, "fix status:todo priority:high")
 
     assert [issue.id for issue in filtered[0].issues] == ["PD-20"]
 
 
-def test_jump_to_my_issue_uses_identity_candidates(monkeypatch) -> None:
+def test_filter_columns_accepts_pre_parsed_spec() -> None:
     view = SprintBoardView()
-    view.column_metrics = [
-        SprintColumnMetric(
-            status="Todo",
-            issues=[_issue("PD-9", "Infra", User("u2", "Bob")), _issue("PD-11", "Polish", User("u3", "Dylan"))],
-        ),
-        SprintColumnMetric(status="Done", issues=[_issue("PD-12", "Ship", User("u4", "Eve"))]),
-    ]
-    monkeypatch.setattr(view, "refresh_view", lambda: None)
+    columns = _columns(
+        ("Todo", [_issue("PD-30", "Fix login", _ALICE, priority="High"), _issue("PD-31", "Fix docs", _BOB)]),
+    )
+    query = "fix assignee:alice"
+
+    spec = view._parse_filter_query(query)
+
+    assert spec == SprintFilterSpec(keyed=(("assignee", ("alice",)),), free_terms=("fix",))
+    assert view._parse_filter_query(query) is spec
+    assert [issue.id for issue in view._filter_columns(columns, spec)[0].issues] == ["PD-30"]
+    assert view._filter_columns(columns, spec) == view._filter_columns(columns, query)
+
+
+def test_jump_to_my_issue_uses_identity_candidates(board: SprintBoardView, monkeypatch) -> None:
+    view = board
+    view.column_metrics = _columns(
+        ("Todo", [_issue("PD-9", "Infra", _BOB), _issue("PD-11", "Polish", User("u3", "Dylan"))]),
+        ("Done", [_issue("PD-12", "Ship", User("u4", "Eve"))]),
+    )
     monkeypatch.setenv("PD_ME", "Dylan")
 
     ok, message = view.jump_to_my_issue()
@@ -194,10 +172,10 @@ def test_linear_issue_url_uses_workspace_env(monkeypatch) -> None:
 
 
 @pytest.mark.asyncio
-async def test_close_selected_issue_cycles_until_done(monkeypatch) -> None:
-    view = SprintBoardView()
+async def test_close_selected_issue_cycles_until_done(board: SprintBoardView, monkeypatch) -> None:
+    view = board
     issue = _issue("PD-30", "Ship release", status="Todo")
-    view.column_metrics = [SprintColumnMetric(status="Todo", issues=[issue])]
+    view.column_metrics = _columns(("Todo", [issue]))
     calls: list[str] = []
 
     async def fake_cycle(issue_id: str, statuses: tuple[str, ...]):
@@ -214,7 +192,6 @@ async def test_close_selected_issue_cycles_until_done(monkeypatch) -> None:
         data_manager=SimpleNamespace(cycle_issue_status=fake_cycle),
     )
     monkeypatch.setattr(SprintBoardView, "app", property(lambda self: fake_app))
-    monkeypatch.setattr(view, "refresh_view", lambda: None)
 
     ok, message = await view.close_selected_issue()
 
@@ -228,14 +205,12 @@ def test_triage_filters_compose_mine_blocked_failing_and_stale(monkeypatch) -> N
     view = SprintBoardView()
     dylan = User("u1", "Dylan")
     other = User("u2", "Alex")
-    match = _issue("PD-50", "Blocked failing", dylan, status="Blocked", priority="High")
-    match.created_at = datetime.now() - timedelta(days=10)
-    wrong_owner = _issue("PD-51", "Blocked failing", other, status="Blocked", priority="High")
-    wrong_owner.created_at = datetime.now() - timedelta(days=10)
-    no_failing = _issue("PD-52", "Blocked no failing", dylan, status="Blocked", priority="High")
-    no_failing.created_at = datetime.now() - timedelta(days=10)
-    fresh = _issue("PD-53", "Blocked fresh", dylan, status="Blocked", priority="High")
-    fresh.created_at = datetime.now() - timedelta(days=1)
+    old = datetime.now() - timedelta(days=10)
+    blocked = {"status": "Blocked", "priority": "High"}
+    match = _issue("PD-50", "Blocked failing", dylan, created_at=old, **blocked)
+    wrong_owner = _issue("PD-51", "Blocked failing", other, created_at=old, **blocked)
+    no_failing = _issue("PD-52", "Blocked no failing", dylan, created_at=old, **blocked)
+    fresh = _issue("PD-53", "Blocked fresh", dylan, created_at=datetime.now() - timedelta(days=1), **blocked)
 
     pr = SimpleNamespace(id="pr-1")
     check_fail = SimpleNamespace(status="completed", conclusion="failure")
@@ -254,17 +229,13 @@ def test_triage_filters_compose_mine_blocked_failing_and_stale(monkeypatch) -> N
     monkeypatch.setenv("PD_TRIAGE_STALE_DAYS", "7")
 
     view.triage_filters = {"mine", "blocked", "failing", "stale"}
-    filtered = view._filter_columns(
-        [SprintColumnMetric(status="Todo", issues=[match, wrong_owner, no_failing, fresh])],
-        "",
-    )
+    filtered = view._filter_columns(_columns(("Todo", [match, wrong_owner, no_failing, fresh])), "")
 
     assert [issue.id for issue in filtered[0].issues] == ["PD-50"]
 
 
-def test_clear_and_restore_triage_filters(monkeypatch) -> None:
-    view = SprintBoardView()
-    monkeypatch.setattr(view, "refresh_view", lambda: None)
+def test_clear_and_restore_triage_filters(board: SprintBoardView) -> None:
+    view = board
     view.triage_filters = {"mine", "blocked"}
 
     ok, message = view.clear_triage_filters()
@@ -317,12 +288,10 @@ def test_sprint_risk_text_shows_thresholds_and_breach_emphasis(monkeypatch) -> N
 
 def test_refresh_summary_panel_renders_full_summary_with_risk_and_load(monkeypatch) -> None:
     view = SprintBoardView()
-    alice = User("u1", "Alice")
-    bob = User("u2", "Bob")
-    view.column_metrics = [
-        SprintColumnMetric(status="Todo", issues=[_issue("PD-1", "One", alice), _issue("PD-2", "Two", bob)]),
-        SprintColumnMetric(status="Done", issues=[_issue("PD-3", "Three", alice, status="Done")]),
-    ]
+    view.column_metrics = _columns(
+        ("Todo", [_issue("PD-1", "One", _ALICE), _issue("PD-2", "Two", _BOB)]),
+        ("Done", [_issue("PD-3", "Three", _ALICE, status="Done")]),
+    )
     captured: list[Text] = []
 
     class _SummaryWidget:
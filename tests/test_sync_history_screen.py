@@ -41,3 +41,45 @@ def test_filtered_entries_matches_summary_and_diagnostics() -> None:
     assert summary_match[0]["result"] == "success"
     assert len(diag_match) == 1
     assert diag_match[0]["result"] == "success"
+
+
+def test_filtered_entries_requires_every_query_token() -> None:
+    entries = [
+        {"created_at": "2026-02-23 01:00:00", "result": "failed", "summary": "issues fetch failed: rate limit"},
+        {"created_at": "2026-02-23 00:59:00", "result": "failed", "summary": "auth failed: unauthorized"},
+    ]
+
+    matched = SyncHistoryScreen._filtered_entries(entries, "  RATE   issues ")
+
+    assert matched == [entries[0]]
+    assert SyncHistoryScreen._filtered_entries(entries, "rate unauthorized") == []
+    assert SyncHistoryScreen._filtered_entries(entries, "failed fetch limit") == [entries[0]]
+    assert SyncHistoryScreen._filtered_entries(entries, "   ") is entries
+
+
+def test_cached_search_blob_builds_each_entry_blob_once(monkeypatch) -> None:
+    built: list[dict] = []
+    original = SyncHistoryScreen._entry_search_blob
+
+    def counting_blob(entry: dict) -> str:
+        built.append(entry)
+        return original(entry)
+
+    monkeypatch.setattr(SyncHistoryScreen, "_entry_search_blob", staticmethod(counting_blob))
+    entries = [
+        {"created_at": "2026-02-23 01:00:00", "result": "failed", "summary": "rate limit"},
+        {"created_at": "2026-02-23 00:59:00", "result": "success", "summary": "u:1 p:1"},
+    ]
+    screen = SyncHistoryScreen()
+
+    for query in ("r", "ra", "rat", "rate"):
+        blobs = [screen._cached_search_blob(entry) for entry in entries]
+        matched = SyncHistoryScreen._filtered_entries(entries, query, blobs)
+
+    assert matched == [entries[0]]
+    assert built == entries
+
+
+def test_query_tokens_drop_tokens_implied_by_longer_ones() -> None:
+    assert SyncHistoryScreen._query_tokens("rat RATE  limit rate") == ("rate", "limit")
+    assert SyncHistoryScreen._query_tokens("   ") == ()
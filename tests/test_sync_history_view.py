@@ -22,3 +22,29 @@ def test_entry_recovery_hints_fallback_for_generic_failures() -> None:
 
     assert hints
     assert "retry" in hints[-1].casefold() or "fix connector config" in hints[-1].casefold()
+
+
+class _CountingStatus:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.formats = 0
+
+    def __format__(self, spec: str) -> str:
+        self.formats += 1
+        return self.text
+
+
+def test_diagnostics_text_is_flattened_once_per_entry() -> None:
+    status = _CountingStatus("failed: unauthorized")
+    entry = {"summary": "failed", "diagnostics": {"auth": status}}
+
+    assert SyncHistoryScreen._diagnostics_text(entry) == "auth failed: unauthorized"
+    assert SyncHistoryScreen._diagnostics_text(entry) == "auth failed: unauthorized"
+    assert SyncHistoryScreen._entry_recovery_hints(entry)
+    assert status.formats == 1
+
+    # History entries are replaced rather than edited; a replacement starts
+    # without a memo and is flattened from its own diagnostics.
+    replacement = {"summary": "failed", "diagnostics": {"github_auth": status}}
+    assert SyncHistoryScreen._diagnostics_text(replacement) == "github_auth failed: unauthorized"
+    assert status.formats == 2
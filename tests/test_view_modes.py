@@ -8,6 +8,8 @@ from projectdash.views.sprint_board import SprintBoardView
 from projectdash.views.timeline import TimelineView
 from projectdash.views.workload import WorkloadView
 from projectdash.views.ideation_gallery import IdeationGalleryView
+from projectdash.views.portfolio import PortfolioView
+from projectdash.views.blocked_queue import BlockedQueueView
 
 
 def test_dashboard_mode_cycles_through_all_views(monkeypatch) -> None:
@@ -396,6 +398,24 @@ def test_workload_move_selection_cycles_cached_members(monkeypatch) -> None:
     view.move_selection(1)
     assert view.selected_member == "Alice"
 
+    view._member_order = ["Cara", "Alice"]
+    view.move_selection(1)
+    assert view.selected_member == "Cara"
+
+
+def test_workload_move_selection_wraps_deltas_longer_than_the_order(monkeypatch) -> None:
+    # page_selection moves by whole pages, so deltas can exceed the member count.
+    view = WorkloadView()
+    monkeypatch.setattr(view, "refresh_view", lambda: None)
+    view._member_order = ["Alice", "Bob", "Cara"]
+    view.selected_member = "Alice"
+
+    view.move_selection(7)
+    assert view.selected_member == "Bob"
+
+    view.move_selection(-5)
+    assert view.selected_member == "Cara"
+
 
 def test_github_move_selection_cycles_cached_repositories(monkeypatch) -> None:
     view = GitHubDashboardView()
@@ -413,6 +433,51 @@ def test_github_move_selection_cycles_cached_repositories(monkeypatch) -> None:
     assert view.selected_repository_id == "github:acme/api"
 
 
+def test_github_check_selection_steps_and_syncs_parent_pull_request(monkeypatch) -> None:
+    view = GitHubDashboardView()
+    monkeypatch.setattr(view, "refresh_view", lambda: None)
+    view.visual_mode = "checks"
+    view._check_order = ["check-1", "check-2"]
+    view._visible_checks_by_id = {
+        "check-1": SimpleNamespace(pull_request_id="pr-1"),
+        "check-2": SimpleNamespace(pull_request_id="pr-2"),
+    }
+    view._filtered_pull_requests_by_id = {
+        "pr-1": SimpleNamespace(id="pr-1", repository_id="github:acme/api"),
+        "pr-2": SimpleNamespace(id="pr-2", repository_id="github:acme/web"),
+    }
+
+    view.selected_check_id = "stale-check"
+    view.move_selection(1)
+    assert view.selected_check_id == "check-1"
+    assert view.selected_pull_request_id == "pr-1"
+
+    view.move_selection(-1)
+    assert view.selected_check_id == "check-2"
+    assert view.selected_repository_id == "github:acme/web"
+
+
+def test_portfolio_and_blocked_queue_move_selection_wrap_and_recover(monkeypatch) -> None:
+    portfolio = PortfolioView()
+    monkeypatch.setattr(portfolio, "refresh_view", lambda: None)
+    portfolio._project_order = ["proj-a", "proj-b", "proj-c"]
+    portfolio.selected_project_id = "proj-c"
+    portfolio.move_selection(1)
+    assert portfolio.selected_project_id == "proj-a"
+    portfolio._project_order = ["proj-b"]
+    portfolio.move_selection(1)
+    assert portfolio.selected_project_id == "proj-b"
+
+    queue = BlockedQueueView()
+    monkeypatch.setattr(queue, "refresh_view", lambda: None)
+    queue._issue_order = ["PD-1", "PD-2"]
+    queue.selected_issue_id = None
+    queue.move_selection(-1)
+    assert queue.selected_issue_id == "PD-1"
+    queue.move_selection(-1)
+    assert queue.selected_issue_id == "PD-2"
+
+
 def test_dashboard_delivery_health_behind_when_past_end_date() -> None:
     view = DashboardView()
     today = date(2026, 2, 24)